@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+EAI Chart Aggregation Layer
+Vectorized group-by over decision codes with precomputed quantiles, box-plot statistics
+and histogram counts, computed once per report and shared by every chart
+"""
+
+import numpy as np
+
+# Fine bins per group used for quantiles; error is at most one bin width
+QUANTILE_BINS = 2048
+# Rows processed per bincount pass, so temporary memory stays flat with report size
+AGGREGATION_CHUNK = 1 << 20
+# Box plots show at most this many outlier markers per group
+MAX_FLIERS = 200
+
+
+def histogram(values, bins, chunk=AGGREGATION_CHUNK):
+    """np.histogram(values, bins) computed in chunks; returns (counts, edges)"""
+    values = np.asarray(values)
+    if not len(values):
+        return np.zeros(bins, dtype=np.int64), np.linspace(0, 1, bins + 1)
+    edges = np.histogram_bin_edges([values.min(), values.max()], bins=bins)
+    counts = np.zeros(bins, dtype=np.int64)
+    for start in range(0, len(values), chunk):
+        counts += np.histogram(values[start:start + chunk], bins=edges)[0]
+    return counts, edges
+
+
+class GroupedDistribution:
+    """
+    Per-group fine histograms of one value column, keyed by small integer codes.
+
+    Counts, sums, minima and maxima are filled with bincount in fixed-size
+    chunks; quantiles, whiskers and fliers are then read from the histograms,
+    so time is one pass over the data and memory is groups x QUANTILE_BINS.
+    """
+
+    def __init__(self, codes, values, n_groups, lo=None, hi=None, mask=None, bins=QUANTILE_BINS,
+                 chunk=AGGREGATION_CHUNK):
+        codes = np.asarray(codes)
+        values = np.asarray(values)
+        if lo is None or hi is None:
+            selected = values if mask is None else values[mask]
+            lo = float(selected.min()) if len(selected) else 0.0
+            hi = float(selected.max()) if len(selected) else 1.0
+        if hi <= lo:
+            hi = lo + 1.0
+        self.n_groups = n_groups
+        self.bins = bins
+        self.edges = np.linspace(lo, hi, bins + 1)
+        self.counts = np.zeros((n_groups, bins), dtype=np.int64)
+        self.sums = np.zeros(n_groups, dtype=np.float64)
+        self.mins = np.full(n_groups, np.inf)
+        self.maxs = np.full(n_groups, -np.inf)
+
+        scale = bins / (hi - lo)
+        for start in range(0, len(values), chunk):
+            chunk_codes = codes[start:start + chunk].astype(np.intp)
+            chunk_values = values[start:start + chunk].astype(np.float64)
+            if mask is not None:
+                keep = mask[start:start + chunk]
+                chunk_codes = chunk_codes[keep]
+                chunk_values = chunk_values[keep]
+            if not len(chunk_values):
+                continue
+            value_bins = np.clip(((chunk_values - lo) * scale).astype(np.intp), 0, bins - 1)
+            self.counts += np.bincount(chunk_codes * bins + value_bins,
+                                       minlength=n_groups * bins).reshape(n_groups, bins)
+            self.sums += np.bincount(chunk_codes, weights=chunk_values, minlength=n_groups)
+            # Group-wise extremes: sort the chunk by code once, then reduce each run
+            order = np.argsort(chunk_codes, kind='stable')
+            sorted_codes = chunk_codes[order]
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            groups = sorted_codes[starts]
+            sorted_values = chunk_values[order]
+            self.mins[groups] = np.minimum(self.mins[groups], np.minimum.reduceat(sorted_values, starts))
+            self.maxs[groups] = np.maximum(self.maxs[groups], np.maximum.reduceat(sorted_values, starts))
+
+    def count(self, group):
+        return int(self.counts[group].sum())
+
+    def mean(self, group):
+        count = self.count(group)
+        return self.sums[group] / count if count else np.nan
+
+    def groups(self):
+        """Codes of groups that received at least one value"""
+        return np.flatnonzero(self.counts.sum(axis=1))
+
+    def quantiles(self, group, qs):
+        """Quantiles of one group, linearly interpolated inside the fine bins"""
+        counts = self.counts[group]
+        total = counts.sum()
+        qs = np.atleast_1d(np.asarray(qs, dtype=np.float64))
+        if not total:
+            return np.full(len(qs), np.nan)
+        cumulative = np.cumsum(counts)
+        targets = qs * total
+        index = np.clip(np.searchsorted(cumulative, targets, side='left'), 0, self.bins - 1)
+        before = np.where(index > 0, cumulative[index - 1], 0)
+        in_bin = np.maximum(counts[index], 1)
+        fraction = np.clip((targets - before) / in_bin, 0, 1)
+        width = self.edges[1] - self.edges[0]
+        values = self.edges[index] + fraction * width
+        return np.clip(values, self.mins[group], self.maxs[group])
+
+    def box_stats(self, group, label, whis=1.5, max_fliers=MAX_FLIERS):
+        """Statistics dict in the format Axes.bxp expects (Tukey whiskers, binned fliers)"""
+        q1, median, q3 = self.quantiles(group, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        low_limit, high_limit = q1 - whis * iqr, q3 + whis * iqr
+        counts = self.counts[group]
+        lower_edges, upper_edges = self.edges[:-1], self.edges[1:]
+        occupied = counts > 0
+
+        inside = occupied & (upper_edges >= low_limit) & (lower_edges <= high_limit)
+        if inside.any():
+            first, last = np.flatnonzero(inside)[[0, -1]]
+            whislo = max(self.mins[group], low_limit, lower_edges[first])
+            whishi = min(self.maxs[group], high_limit, upper_edges[last])
+        else:
+            whislo, whishi = q1, q3
+        whislo, whishi = min(whislo, q1), max(whishi, q3)
+
+        centres = (lower_edges + upper_edges) / 2
+        outside = occupied & ((upper_edges < whislo) | (lower_edges > whishi))
+        fliers = np.clip(centres[outside], self.mins[group], self.maxs[group])
+        if len(fliers) > max_fliers:
+            fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).astype(np.intp)]
+
+        return {
+            'label': label,
+            'med': median,
+            'q1': q1,
+            'q3': q3,
+            'whislo': whislo,
+            'whishi': whishi,
+            'mean': self.mean(group),
+            'fliers': fliers,
+        }
+
+
+class ChartAggregates:
+    """Statistics shared by the chart methods, computed once from ReportColumns"""
+
+    def __init__(self, columns, histogram_bins=6):
+        self.columns = columns
+        confident = columns.confident
+
+        # Work on the int32 millisecond column and rescale, rather than materialising seconds
+        response_times = columns.response_time_ms
+        self.response_time_mean = (float(response_times.mean(dtype=np.float64)) / 1000
+                                   if len(response_times) else np.nan)
+        counts, edges = histogram(response_times, histogram_bins)
+        # Sampled columns (merged shards) stand for row_weight requests per row
+        self.response_time_hist = (counts * columns.row_weight, edges / 1000)
+
+        confidences = columns.confidence[confident]
+        self.confidence_mean = float(confidences.mean(dtype=np.float64)) if len(confidences) else np.nan
+        counts, edges = histogram(confidences, histogram_bins)
+        self.confidence_hist = (counts * columns.row_weight, edges)
+
+        self.decision_confidence = GroupedDistribution(
+            columns.decision_code, columns.confidence, len(columns.decision_labels),
+            lo=0.0, hi=max(1.0, float(confidences.max()) if len(confidences) else 1.0), mask=confident)
+
+    def decision_box_stats(self):
+        """bxp statistics for confidence per decision, for decisions that have confident requests"""
+        labels = self.columns.decision_labels
+        return [self.decision_confidence.box_stats(group, labels[group])
+                for group in self.decision_confidence.groups()]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+EAI Approval API Stub Server
+Local stand-in for EAI.Api that serves /health and /api/approval/process with configurable
+latency, error rate and processing capacity, for exercising load_generator.py without an LLM
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from datetime import datetime, timezone
+
+DEFAULT_PORT = 58081
+DECISIONS = ('escalate', 'approve', 'deny')
+DECISION_WEIGHTS = (0.6, 0.3, 0.1)
+
+
+class StubSettings:
+    """Latency model of the stub: lognormal around median_ms, optional capacity limit"""
+
+    def __init__(self, median_ms=50.0, sigma=0.5, error_rate=0.0, capacity=None, seed=None):
+        self.median_ms = median_ms
+        self.sigma = sigma
+        self.error_rate = error_rate
+        # Requests processed at once; the rest queue, like LLM backend slots
+        self.capacity = capacity
+        self.random = random.Random(seed)
+
+    def latency_seconds(self):
+        if self.median_ms <= 0:
+            return 0.0
+        return self.random.lognormvariate(0, self.sigma) * self.median_ms / 1000
+
+
+def create_app(settings=None):
+    """aiohttp application emulating the approval API"""
+    from aiohttp import web
+
+    settings = settings or StubSettings()
+    slots = asyncio.Semaphore(settings.capacity) if settings.capacity else None
+
+    async def health(request):
+        return web.Response(text='Healthy')
+
+    async def process(request):
+        try:
+            body = await request.json()
+        except json.JSONDecodeError:
+            return web.Response(status=400, text='Invalid JSON')
+        started = asyncio.get_running_loop().time()
+        if slots is not None:
+            async with slots:
+                await asyncio.sleep(settings.latency_seconds())
+        else:
+            await asyncio.sleep(settings.latency_seconds())
+        if settings.random.random() < settings.error_rate:
+            return web.Response(status=500, text='Internal server error')
+
+        decision = settings.random.choices(DECISIONS, DECISION_WEIGHTS)[0]
+        elapsed = asyncio.get_running_loop().time() - started
+        return web.json_response({
+            'decision': decision,
+            'confidenceScore': round(settings.random.betavariate(7, 3), 2),
+            'reasoning': f"Stub decision for {body.get('requestType', 'unknown')} request "
+                         f"from {body.get('department', 'unknown')}",
+            'policyReferences': [],
+            'escalationReason': 'Stub escalation' if decision == 'escalate' else '',
+            'humanReviewRequired': decision == 'escalate',
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'processingTime': f"{elapsed:.3f}s",
+        })
+
+    app = web.Application()
+    app.router.add_get('/health', health)
+    app.router.add_post('/api/approval/process', process)
+    return app
+
+
+async def start_stub_server(settings=None, host='127.0.0.1', port=0):
+    """
+    Start the stub in the running event loop.
+
+    Returns (runner, base_url); call `await runner.cleanup()` to stop it. port=0 picks a free port.
+    """
+    from aiohttp import web
+
+    runner = web.AppRunner(create_app(settings), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}"
+
+
+def main():
+    """Run the stub server until interrupted"""
+    from aiohttp import web
+
+    parser = argparse.ArgumentParser(description='Serve a stub EAI approval API with configurable latency')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=float, default=50.0, help='Median processing latency')
+    parser.add_argument('--sigma', type=float, default=0.5, help='Lognormal spread of the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--capacity', type=int, help='Requests processed concurrently; the rest queue')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    settings = StubSettings(args.latency_ms, args.sigma, args.error_rate, args.capacity, args.seed)
+    print(f"Stub approval API on http://{args.host}:{args.port} "
+          f"(median {args.latency_ms:.0f}ms, error rate {args.error_rate:.1%}, "
+          f"capacity {args.capacity or 'unlimited'})")
+    web.run_app(create_app(settings), host=args.host, port=args.port, access_log=None, print=None)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
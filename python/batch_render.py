@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+EAI Batch Chart Renderer
+Renders charts for many benchmark reports through one set of chart templates: each chart's
+figure and layout are built for the first report, and every later report only swaps the data
+artists before saving. Reports can be spread over worker processes, each with its own templates
+"""
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from chart_generator import EAIChartGenerator
+from report_history import find_reports
+
+
+def expand_reports(inputs):
+    """Report paths from files, directories (their benchmark_report_*.json) and glob patterns"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(find_reports(item))
+        else:
+            paths.extend(sorted(glob.glob(item)) or [item])
+    # Keep the first occurrence of each report
+    return list(dict.fromkeys(paths))
+
+
+class BatchRenderer:
+    """Renders one report after another, reusing chart figures between them"""
+
+    def __init__(self, charts_root='charts', charts=None, profile='preview', force=False, use_cache=True,
+                 generator_options=None):
+        self.charts_root = charts_root
+        self.charts = charts
+        self.profile = profile
+        self.force = force
+        self.use_cache = use_cache
+        self.generator_options = generator_options or {}
+        # method name -> ChartTemplate, filled by the generators as charts are first drawn
+        self.templates = {}
+
+    def charts_dir_for(self, report_path):
+        """Each report gets its own output directory named after the report"""
+        name = os.path.splitext(os.path.basename(report_path))[0]
+        return os.path.join(self.charts_root, name)
+
+    def render(self, report_path):
+        """Render the selected charts for one report"""
+        generator = EAIChartGenerator(report_path, charts_dir=self.charts_dir_for(report_path),
+                                      profile=self.profile, templates=self.templates, **self.generator_options)
+        generator.generate_all_charts(force=self.force, use_cache=self.use_cache, charts=self.charts)
+
+    def render_all(self, report_paths):
+        """Render every report; returns {report_path: error} for reports that failed"""
+        failures = {}
+        for report_path in report_paths:
+            try:
+                self.render(report_path)
+            except Exception as e:
+                failures[report_path] = f"{type(e).__name__}: {e}"
+                print(f"Failed to render {os.path.basename(report_path)}: {e}")
+        return failures
+
+    def close(self):
+        for template in self.templates.values():
+            template.close()
+        self.templates.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _render_worker(report_paths, options):
+    """Process pool task: render a slice of the reports with this process's own templates"""
+    import matplotlib
+    matplotlib.use('Agg')
+    with BatchRenderer(**options) as renderer:
+        return renderer.render_all(report_paths)
+
+
+def render_reports(report_paths, workers=1, **options):
+    """Render reports in one process, or split them over `workers` processes; returns failures"""
+    report_paths = list(report_paths)
+    workers = max(1, min(workers or 1, len(report_paths)))
+    if workers == 1:
+        return _render_worker(report_paths, options)
+    failures = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Interleaved slices keep the work balanced when report sizes grow over time
+        futures = [pool.submit(_render_worker, report_paths[i::workers], options) for i in range(workers)]
+        for future in as_completed(futures):
+            failures.update(future.result())
+    return failures
+
+
+def main():
+    """Render charts for many benchmark reports"""
+    chart_names = [spec['file'] for spec in EAIChartGenerator.CHART_SPECS.values()]
+    parser = argparse.ArgumentParser(description='Render EAI charts for many benchmark reports')
+    parser.add_argument('reports', nargs='+',
+                        help='Reports, directories of benchmark_report_*.json or glob patterns')
+    parser.add_argument('--charts-dir', default='charts', help='Root output directory (one subdirectory per report)')
+    parser.add_argument('-c', '--chart', dest='charts', action='append', choices=chart_names,
+                        help='Chart to render; repeat for several (default: all)')
+    parser.add_argument('--profile', default='preview', choices=list(EAIChartGenerator.RENDER_PROFILES),
+                        help="Render profile (default: preview, low DPI without bbox_inches='tight')")
+    parser.add_argument('--dpi', type=int, help="Output resolution (default: the profile's)")
+    parser.add_argument('-f', '--format', default='png', choices=['png', 'pdf', 'svg', 'jpg'], help='Image format')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='Worker processes, each with its own templates')
+    parser.add_argument('--force', action='store_true', help='Re-render charts even if the render cache is fresh')
+    parser.add_argument('--no-cache', action='store_true', help='Neither read nor update the render cache')
+    args = parser.parse_args()
+
+    report_paths = expand_reports(args.reports)
+    if not report_paths:
+        print("No benchmark reports found")
+        return 1
+
+    started = time.perf_counter()
+    failures = render_reports(report_paths, workers=args.workers, charts_root=args.charts_dir, charts=args.charts,
+                              profile=args.profile, force=args.force, use_cache=not args.no_cache,
+                              generator_options={'dpi': args.dpi, 'image_format': args.format})
+    elapsed = time.perf_counter() - started
+    print(f"\nRendered {len(report_paths) - len(failures)} of {len(report_paths)} reports in {elapsed:.1f}s "
+          f"({elapsed / len(report_paths):.2f}s per report)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+EAI Chart Generator Benchmark Suite
+Measures report load time, per-chart render time and peak RSS of EAIChartGenerator on
+synthetic reports of increasing size, and compares the results against a stored baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+BENCHMARK_SCHEMA_VERSION = 1
+DEFAULT_SIZES = '1e3,1e4,1e5'
+DEFAULT_WORK_DIR = 'benchmark_work'
+DEFAULT_RESULTS = 'chart_benchmark_results.json'
+# A stage counts as a regression when it is this much slower than the baseline
+DEFAULT_TOLERANCE = 1.25
+LOAD_STAGE = 'load'
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_stage(report_path, stage, dpi):
+    """Child-process body: load the report and optionally render one chart"""
+    import matplotlib
+    matplotlib.use('Agg')
+    # Import pyplot up front so render timings exclude the one-off import cost
+    import matplotlib.pyplot  # noqa: F401
+    from chart_generator import EAIChartGenerator
+
+    started = time.perf_counter()
+    generator = EAIChartGenerator(report_path, dpi=dpi,
+                                  charts_dir=os.path.join(os.path.dirname(report_path), 'charts'))
+    load_seconds = time.perf_counter() - started
+
+    render_seconds = None
+    if stage != LOAD_STAGE:
+        started = time.perf_counter()
+        getattr(generator, stage)()
+        render_seconds = time.perf_counter() - started
+
+    return {'load_seconds': load_seconds, 'render_seconds': render_seconds, 'peak_rss_mb': _peak_rss_mb()}
+
+
+def measure_stage(report_path, stage, dpi):
+    """Run one stage in a fresh interpreter so peak RSS and import state are isolated"""
+    command = [sys.executable, os.path.abspath(__file__), '--child', os.path.abspath(report_path), '--stage', stage,
+               '--dpi', str(dpi)]
+    completed = subprocess.run(command, capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    if completed.returncode != 0:
+        raise RuntimeError(f"{stage} failed on {os.path.basename(report_path)}: {completed.stderr.strip()[-500:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_benchmarks(sizes, stages, work_dir=DEFAULT_WORK_DIR, dpi=100, repeat=1):
+    """Measure every (size, stage) pair; the fastest of `repeat` runs is kept"""
+    from synthetic_report import ensure_synthetic_report
+
+    results = []
+    for size in sizes:
+        started = time.perf_counter()
+        report_path = ensure_synthetic_report(work_dir, size)
+        print(f"Report with {size:,} entries ready ({time.perf_counter() - started:.1f}s, "
+              f"{os.path.getsize(report_path) / 1e6:.1f} MB)")
+        for stage in stages:
+            runs = [measure_stage(report_path, stage, dpi) for _ in range(repeat)]
+            best = min(runs, key=lambda r: r['render_seconds'] if stage != LOAD_STAGE else r['load_seconds'])
+            seconds = best['load_seconds'] if stage == LOAD_STAGE else best['render_seconds']
+            results.append({
+                'size': size,
+                'stage': stage,
+                'seconds': seconds,
+                'peak_rss_mb': max(r['peak_rss_mb'] for r in runs),
+            })
+            print(f"  {stage:<34} {seconds:8.3f}s  peak RSS {results[-1]['peak_rss_mb']:8.1f} MB")
+    return results
+
+
+def environment_info():
+    import matplotlib
+    import numpy
+    return {
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Per-stage ratios against a baseline results document; returns (rows, regressions)"""
+    reference = {(r['size'], r['stage']): r for r in baseline.get('results', [])}
+    rows = []
+    regressions = []
+    for result in results:
+        base = reference.get((result['size'], result['stage']))
+        if base is None or not base['seconds']:
+            continue
+        row = {
+            'size': result['size'],
+            'stage': result['stage'],
+            'baseline_seconds': base['seconds'],
+            'seconds': result['seconds'],
+            'time_ratio': result['seconds'] / base['seconds'],
+            'baseline_peak_rss_mb': base['peak_rss_mb'],
+            'peak_rss_mb': result['peak_rss_mb'],
+            'rss_ratio': result['peak_rss_mb'] / base['peak_rss_mb'] if base['peak_rss_mb'] else None,
+        }
+        row['regression'] = row['time_ratio'] > tolerance or (row['rss_ratio'] or 0) > tolerance
+        rows.append(row)
+        if row['regression']:
+            regressions.append(row)
+    return rows, regressions
+
+
+def print_comparison(rows):
+    print(f"\n{'Size':>10}  {'Stage':<34} {'Baseline':>9} {'Now':>9} {'Time':>7} {'RSS':>7}")
+    for row in rows:
+        rss_ratio = f"{row['rss_ratio']:.2f}x" if row['rss_ratio'] else '-'
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['size']:>10,}  {row['stage']:<34} {row['baseline_seconds']:8.3f}s {row['seconds']:8.3f}s "
+              f"{row['time_ratio']:6.2f}x {rss_ratio:>7}{flag}")
+
+
+def main():
+    """Benchmark EAIChartGenerator on synthetic reports"""
+    from chart_generator import EAIChartGenerator
+
+    parser = argparse.ArgumentParser(description='Benchmark EAIChartGenerator on synthetic reports')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help='Comma-separated LoadTestResults counts, 1e3 .. 1e7 (default: %(default)s)')
+    parser.add_argument('--charts', help='Comma-separated create_* methods to time (default: all)')
+    parser.add_argument('--dpi', type=int, default=100, help='Render resolution (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per stage; the fastest is kept')
+    parser.add_argument('--work-dir', default=DEFAULT_WORK_DIR, help='Where synthetic reports are cached')
+    parser.add_argument('-o', '--output', default=DEFAULT_RESULTS, help='Machine-readable results file')
+    parser.add_argument('--baseline', help='Results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Slowdown/RSS ratio treated as a regression (default: %(default)s)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit 1 when a regression is found')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--stage', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_run_stage(args.child, args.stage, args.dpi)))
+        return 0
+
+    sizes = [int(float(size)) for size in args.sizes.split(',')]
+    charts = args.charts.split(',') if args.charts else list(EAIChartGenerator.CHART_METHODS)
+    stages = [LOAD_STAGE] + [EAIChartGenerator.chart_method(name) for name in charts]
+
+    results = run_benchmarks(sizes, stages, work_dir=args.work_dir, dpi=args.dpi, repeat=args.repeat)
+    document = {
+        'schema_version': BENCHMARK_SCHEMA_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': environment_info(),
+        'settings': {'dpi': args.dpi, 'repeat': args.repeat},
+        'results': results,
+    }
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        rows, regressions = compare_to_baseline(results, baseline, args.tolerance)
+        print_comparison(rows)
+        document['comparison'] = {'baseline': args.baseline, 'tolerance': args.tolerance, 'rows': rows}
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.2f}x")
+            if args.fail_on_regression:
+                exit_code = 1
+
+    with open(args.output, 'w') as f:
+        json.dump(document, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
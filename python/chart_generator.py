@@ -5,25 +5,84 @@ Unified script to generate compelling visualizations from benchmark results
 Creates both business presentation charts and academic paper-ready figures
 """
 
-import json
+import argparse
+import importlib
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-import numpy as np
-from datetime import datetime
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import warnings
+from report_sidecar import open_report, sidecar_path
+from lod import LOD_POINT_THRESHOLD
+from render_cache import RenderCache, chart_cache_key
+from chart_tracing import NullTracer
+from aggregation import ChartAggregates
+from timeline import Timeline
+from report_shards import DEFAULT_MAX_ROWS, expand_shards, merge_reports
 warnings.filterwarnings('ignore')
 
+
+class _LazyModule:
+    """Module proxy that defers the import until an attribute is first used"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# matplotlib is only imported once a chart is actually drawn, so --help, cache hits
+# and data-only use of the generator skip its startup cost
+plt = _LazyModule('matplotlib.pyplot')
+chart_templates = _LazyModule('chart_templates')
+
 class EAIChartGenerator:
-    def __init__(self, benchmark_file=None):
-        """Initialize with benchmark data"""
-        if benchmark_file is None:
+    # Independent figures rendered by generate_all_charts, in output order.
+    # Bump 'version' whenever a chart's drawing code changes so cached renders are invalidated.
+    CHART_SPECS = {
+        'create_performance_dashboard': {'file': 'performance_dashboard_3d', 'figsize': (16, 12), 'version': 3},
+        'create_3d_response_analysis': {'file': 'response_time_analysis_3d', 'figsize': (16, 12), 'version': 2},
+        'create_3d_decision_analysis': {'file': 'decision_analysis_3d', 'figsize': (16, 12), 'version': 1},
+        'create_business_impact_chart': {'file': 'business_impact_analysis', 'figsize': (15, 12), 'version': 4},
+        'create_decision_analysis_chart': {'file': 'decision_analysis', 'figsize': (15, 12), 'version': 3},
+        # Only rendered for reports whose LoadTestResults carry StartTime/EndTime
+        'create_timeline_chart': {'file': 'timeline_analysis', 'figsize': (15, 12), 'version': 2,
+                                  'requires_timestamps': True},
+    }
+    CHART_METHODS = tuple(CHART_SPECS)
+    # 'publication' is the full-quality output; 'preview' trades resolution and tight bounding
+    # boxes for speed when rendering many reports
+    RENDER_PROFILES = {
+        'publication': {'dpi': 300, 'bbox_inches': 'tight'},
+        'preview': {'dpi': 72, 'bbox_inches': None},
+    }
+
+    def __init__(self, benchmark_file=None, lod_threshold=LOD_POINT_THRESHOLD, lod_mode='bin',
+                 dpi=None, image_format='png', charts_dir='charts', tracer=None, use_sidecar=True,
+                 shards=None, shard_workers=None, max_rows=DEFAULT_MAX_ROWS, profile='publication',
+                 templates=None):
+        """
+        Initialize with benchmark data; lod_* control how large scatters are reduced ('bin' or 'sample').
+
+        An up-to-date .eaicol sidecar next to the report is memory-mapped instead of parsing the JSON
+        unless use_sidecar is False.
+
+        shards (report paths or glob patterns) charts several per-node reports as one run instead
+        of benchmark_file: they are merged in a pool of shard_workers processes, with the Summary
+        recomputed and at most max_rows rows kept as columns (see report_shards.py).
+
+        profile picks a RENDER_PROFILES entry ('publication' or 'preview'), which sets the
+        default dpi and the savefig bounding box. templates is a dict shared between
+        generators (see batch_render.py) in which chart figures are kept and reused.
+
+        Pass a chart_tracing.ChartTracer as tracer to record per-stage timing spans.
+        """
+        self.merged = None
+        if shards:
+            benchmark_file = None
+        elif benchmark_file is None:
             # Find the latest benchmark file in parent directory
             parent_dir = '..'
             benchmark_files = [f for f in os.listdir(parent_dir) if f.startswith('benchmark_report_') and f.endswith('.json')]
@@ -33,8 +92,24 @@ class EAIChartGenerator:
                 raise FileNotFoundError("No benchmark report found!")
         
         self.benchmark_file = benchmark_file
-        with open(benchmark_file, 'r') as f:
-            self.data = json.load(f)
+        self.lod_threshold = lod_threshold
+        self.lod_mode = lod_mode
+        self.profile = profile
+        self.dpi = dpi or self.RENDER_PROFILES[profile]['dpi']
+        self.templates = templates
+        self.image_format = image_format
+        self.tracer = tracer or NullTracer()
+        self._aggregates = None
+        self._timeline = None
+        # LoadTestResults are streamed (or memory-mapped) into compact columns; self.data keeps the rest
+        if shards:
+            paths = expand_shards(shards)
+            with self.tracer.span('merge_shards', category='load', shards=len(paths)):
+                self.merged = merge_reports(paths, shard_workers, max_rows, use_sidecar=use_sidecar)
+            self.data, self.columns = self.merged.header, self.merged.columns
+        else:
+            with self.tracer.span('load_report', category='load', file=os.path.basename(benchmark_file)):
+                self.data, self.columns = open_report(benchmark_file, use_sidecar=use_sidecar)
         
         self.timestamp = self.data['Timestamp']
         self.environment = self.data['Environment']
@@ -42,378 +117,190 @@ class EAIChartGenerator:
         self.summary = self.results['Summary']
         
         # Create single output directory
-        self.charts_dir = 'charts'
+        self.charts_dir = charts_dir
         os.makedirs(self.charts_dir, exist_ok=True)
         
-        print(f"Loaded benchmark data from {benchmark_file}")
+        if self.merged is not None:
+            print(f"Merged {len(self.merged.paths)} shard reports ({self.merged.total_rows:,} load test results"
+                  f"{f', {len(self.columns):,} sampled for charts' if self.merged.sampled else ''})")
+        else:
+            print(f"Loaded benchmark data from {benchmark_file}")
         print(f"Model: {self.environment['Model']}")
         print(f"Total Requests: {self.summary['TotalRequests']}")
         print(f"Success Rate: {self.summary['SuccessRate']}%")
 
     def create_performance_dashboard(self):
         """Create 3D performance dashboard"""
-        fig = plt.figure(figsize=(16, 12))
-        fig.suptitle('EAI System Performance Dashboard', fontsize=16, fontweight='bold', y=0.98)
-        
-        # Get data
-        load_test_results = self.results['LoadTestResults']
-        response_times = [r['ResponseTime'] / 1000 for r in load_test_results]
-        confidences = [r['Confidence'] for r in load_test_results if r['Confidence'] > 0]
-        decisions = [r['Decision'] for r in load_test_results]
-        
-        # Create 3D subplot
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Create 3D scatter plot: Response Time vs Confidence vs Decision Type
-        decision_colors = {'escalate': 'red', 'approve': 'green', 'deny': 'orange'}
-        decision_markers = {'escalate': 'o', 'approve': 's', 'deny': '^'}
-        
-        # Get unique decisions for legend
-        unique_decisions = list(set(decisions))
-        
-        for i, (time, conf, decision) in enumerate(zip(response_times, confidences, decisions)):
-            ax.scatter(time, conf, i, 
-                      c=decision_colors.get(decision, 'blue'), 
-                      marker=decision_markers.get(decision, 'o'),
-                      s=100, alpha=0.7, edgecolors='black', linewidth=1)
-        
-        ax.set_xlabel('Response Time (seconds)', fontweight='bold', fontsize=12)
-        ax.set_ylabel('Confidence Score', fontweight='bold', fontsize=12)
-        ax.set_zlabel('Request Sequence', fontweight='bold', fontsize=12)
-        ax.set_title('3D Performance Analysis: Time vs Confidence vs Request Order', 
-                    fontweight='bold', fontsize=14, pad=30)
-        
-        # Add legend - only show decisions that actually exist in data
-        legend_elements = []
-        for decision in unique_decisions:
-            color = decision_colors.get(decision, 'blue')
-            marker = decision_markers.get(decision, 'o')
-            count = decisions.count(decision)
-            legend_elements.append(
-                plt.Line2D([0], [0], marker=marker, color='w', markerfacecolor=color, 
-                          markersize=10, label=f'{decision.title()} Decision ({count})')
-            )
-        
-        # Move legend to bottom
-        ax.legend(handles=legend_elements, loc='lower center', bbox_to_anchor=(0.5, -0.15), 
-                 ncol=len(legend_elements), fontsize=10)
-        
-        # Add performance metrics as text
-        metrics_text = f"""Performance Metrics:
-• Total Requests: {self.summary['TotalRequests']}
-• Success Rate: {self.summary['SuccessRate']}%
-• Avg Response Time: {self.summary['AverageResponseTime']/1000:.1f}s
-• Avg Confidence: {self.summary['AverageConfidence']:.2f}
-• Model: {self.environment['Model']}"""
-        
-        ax.text2D(0.02, 0.98, metrics_text, transform=ax.transAxes, 
-                 fontsize=10, verticalalignment='top',
-                 bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.8))
-        
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.95, bottom=0.15)
-        plt.savefig(f'{self.charts_dir}/performance_dashboard_3d.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._draw_chart('create_performance_dashboard')
         print("Created 3D performance dashboard")
 
     def create_business_impact_chart(self):
         """Create business impact analysis chart using only real benchmark data"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('EAI System Business Impact Analysis', fontsize=12, fontweight='bold', y=0.98)
-        
-        # Use only real benchmark data
-        avg_response_time_seconds = self.summary['AverageResponseTime'] / 1000
-        success_rate = self.summary['SuccessRate']
-        total_requests = self.summary['TotalRequests']
-        avg_confidence = self.summary['AverageConfidence']
-        
-        # 1. Response Time Analysis (Real Data)
-        load_test_results = self.results['LoadTestResults']
-        response_times = [r['ResponseTime'] / 1000 for r in load_test_results]  # Convert to seconds
-        
-        ax1.hist(response_times, bins=6, alpha=0.7, color='skyblue', edgecolor='black')
-        ax1.axvline(np.mean(response_times), color='red', linestyle='--', linewidth=2,
-                   label=f'Mean: {np.mean(response_times):.1f}s')
-        ax1.set_xlabel('Response Time (seconds)')
-        ax1.set_ylabel('Frequency')
-        ax1.set_title('Response Time Distribution (Real Data)', pad=25)
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # 2. Success Rate Analysis (Real Data)
-        success_metrics = {
-            'Total Requests': total_requests,
-            'Successful Requests': self.summary['SuccessfulRequests'],
-            'Failed Requests': self.summary['FailedRequests'],
-            'Success Rate': success_rate
-        }
-        
-        bars = ax2.bar(success_metrics.keys(), success_metrics.values(), 
-                      color=['blue', 'green', 'red', 'orange'], alpha=0.8)
-        ax2.set_ylabel('Count / Percentage')
-        ax2.set_title('Request Success Analysis (Real Data)', pad=25)
-        ax2.grid(True, alpha=0.3)
-        
-        # Add value labels
-        for bar, value in zip(bars, success_metrics.values()):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{value}', ha='center', va='bottom', fontweight='bold')
-        
-        # 3. Decision Distribution (Real Data)
-        decision_counts = self.summary['DecisionDistribution']
-        labels = list(decision_counts.keys())
-        sizes = list(decision_counts.values())
-        colors = ['#ff6b6b', '#4ecdc4', '#45b7d1']
-        
-        wedges, texts, autotexts = ax3.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                          colors=colors[:len(labels)], startangle=90)
-        ax3.set_title('Decision Distribution (Real Data)', pad=25)
-        
-        # 4. Performance Metrics Summary (Real Data)
-        metrics = ['Min Response Time', 'Avg Response Time', 'Max Response Time', 'Avg Confidence']
-        values = [
-            self.summary['MinResponseTime'] / 1000,
-            self.summary['AverageResponseTime'] / 1000,
-            self.summary['MaxResponseTime'] / 1000,
-            self.summary['AverageConfidence']
-        ]
-        colors = ['lightgreen', 'lightblue', 'lightcoral', 'lightyellow']
-        
-        bars = ax4.bar(metrics, values, color=colors, alpha=0.8, edgecolor='black')
-        ax4.set_ylabel('Time (seconds) / Confidence Score')
-        ax4.set_title('Performance Metrics Summary (Real Data)', pad=25)
-        ax4.grid(True, alpha=0.3)
-        
-        # Add value labels
-        for bar, value in zip(bars, values):
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                    f'{value:.2f}', ha='center', va='bottom', fontweight='bold')
-        
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.95)
-        plt.savefig(f'{self.charts_dir}/business_impact_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._draw_chart('create_business_impact_chart')
         print("Created business impact analysis (real data only)")
 
     def create_3d_response_analysis(self):
         """Create 3D response time analysis"""
-        fig = plt.figure(figsize=(16, 12))
-        fig.suptitle('EAI System 3D Response Time Analysis', fontsize=16, fontweight='bold', y=0.98)
-        
-        # Get data
-        load_test_results = self.results['LoadTestResults']
-        response_times = [r['ResponseTime'] / 1000 for r in load_test_results]
-        confidences = [r['Confidence'] for r in load_test_results if r['Confidence'] > 0]
-        
-        # Create 3D subplot
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Create 3D scatter plot
-        x = np.array(response_times)
-        y = np.array(confidences)
-        z = np.arange(len(response_times))
-        
-        # Create 3D scatter plot
-        scatter = ax.scatter(x, y, z, c=z, cmap='viridis', s=150, alpha=0.8, edgecolors='black')
-        
-        # Add lines connecting points
-        ax.plot(x, y, z, 'k-', alpha=0.3, linewidth=1)
-        
-        ax.set_xlabel('Response Time (seconds)', fontweight='bold', fontsize=12)
-        ax.set_ylabel('Confidence Score', fontweight='bold', fontsize=12)
-        ax.set_zlabel('Request Sequence', fontweight='bold', fontsize=12)
-        ax.set_title('3D Response Time vs Confidence Analysis', 
-                    fontweight='bold', fontsize=12, pad=40)
-        
-        # Add colorbar
-        cbar = plt.colorbar(scatter, ax=ax, shrink=0.5, aspect=20)
-        cbar.set_label('Request Order', fontweight='bold')
-        
-        # Add legend at bottom
-        legend_text = f"""Legend:
-• X-axis: Response Time (seconds) - Shows processing speed
-• Y-axis: Confidence Score - Shows decision certainty  
-• Z-axis: Request Sequence - Shows chronological order
-• Color: Request Order - Darker = earlier requests
-• Surface: Shows relationship between time and confidence
-
-Performance Summary:
-• Total Requests: {self.summary['TotalRequests']}
-• Success Rate: {self.summary['SuccessRate']}%
-• Avg Response Time: {self.summary['AverageResponseTime']/1000:.1f}s
-• Avg Confidence: {self.summary['AverageConfidence']:.2f}"""
-        
-        fig.text(0.5, 0.02, legend_text, ha='center', va='bottom', fontsize=10,
-                bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow", alpha=0.8))
-        
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.95, bottom=0.25)
-        plt.savefig(f'{self.charts_dir}/response_time_analysis_3d.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._draw_chart('create_3d_response_analysis')
         print("Created 3D response time analysis")
 
     def create_3d_decision_analysis(self):
         """Create 3D decision analysis"""
-        fig = plt.figure(figsize=(16, 12))
-        fig.suptitle('EAI System 3D Decision Analysis', fontsize=16, fontweight='bold', y=0.98)
-        
-        # Get data
-        load_test_results = self.results['LoadTestResults']
-        response_times = [r['ResponseTime'] / 1000 for r in load_test_results]
-        confidences = [r['Confidence'] for r in load_test_results if r['Confidence'] > 0]
-        decisions = [r['Decision'] for r in load_test_results]
-        
-        # Create 3D subplot
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Create 3D bar chart for decision distribution
-        decision_counts = self.summary['DecisionDistribution']
-        decision_names = list(decision_counts.keys())
-        decision_values = list(decision_counts.values())
-        
-        # Create 3D bars
-        x_pos = np.arange(len(decision_names))
-        y_pos = np.zeros(len(decision_names))
-        z_pos = np.zeros(len(decision_names))
-        dx = np.ones(len(decision_names)) * 0.8
-        dy = np.ones(len(decision_names)) * 0.8
-        dz = decision_values
-        
-        colors = ['red', 'green', 'blue', 'orange']
-        bars = ax.bar3d(x_pos, y_pos, z_pos, dx, dy, dz, 
-                       color=colors[:len(decision_names)], alpha=0.7, edgecolor='black')
-        
-        ax.set_xlabel('Decision Types', fontweight='bold', fontsize=12)
-        ax.set_ylabel('Y Position', fontweight='bold', fontsize=12)
-        ax.set_zlabel('Number of Decisions', fontweight='bold', fontsize=12)
-        ax.set_title('3D Decision Distribution Analysis', 
-                    fontweight='bold', fontsize=12, pad=40)
-        
-        # Set x-axis labels
-        ax.set_xticks(x_pos + 0.4)
-        ax.set_xticklabels(decision_names)
-        
-        # Add legend at bottom
-        legend_text = f"""Legend:
-• X-axis: Decision Types - Shows different decision categories
-• Y-axis: Y Position - Spatial positioning for 3D effect
-• Z-axis: Number of Decisions - Shows frequency of each decision type
-• Colors: Red = Escalate, Green = Approve, Blue = Other decisions
-
-Decision Analysis:
-• Total Decisions: {sum(decision_values)}
-• Escalate: {decision_counts.get('escalate', 0)} decisions
-• Approve: {decision_counts.get('approve', 0)} decisions
-• Success Rate: {self.summary['SuccessRate']}%
-• Avg Confidence: {self.summary['AverageConfidence']:.2f}
-
-Model: {self.environment['Model']}"""
-        
-        fig.text(0.5, 0.02, legend_text, ha='center', va='bottom', fontsize=10,
-                bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgreen", alpha=0.8))
-        
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.95, bottom=0.25)
-        plt.savefig(f'{self.charts_dir}/decision_analysis_3d.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._draw_chart('create_3d_decision_analysis')
         print("Created 3D decision analysis")
 
     def create_decision_analysis_chart(self):
         """Create decision making analysis chart using only real benchmark data"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('EAI Decision Making Analysis', fontsize=12, fontweight='bold', y=0.98)
-        
-        # Get decision data from real benchmark
-        load_test_results = self.results['LoadTestResults']
-        confidences = [r['Confidence'] for r in load_test_results if r['Confidence'] > 0]
-        decisions = [r['Decision'] for r in load_test_results]
-        decision_counts = self.summary['DecisionDistribution']
-        
-        # Subplot 1: Decision Distribution (Real Data)
-        labels = list(decision_counts.keys())
-        sizes = list(decision_counts.values())
-        colors = ['#ff6b6b', '#4ecdc4', '#45b7d1']
-        
-        wedges, texts, autotexts = ax1.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                          colors=colors[:len(labels)], startangle=90)
-        ax1.set_title('Decision Distribution (Real Data)', pad=25)
-        
-        # Subplot 2: Confidence Score Distribution (Real Data)
-        ax2.hist(confidences, bins=6, alpha=0.7, color='lightgreen', 
-                edgecolor='black', linewidth=1)
-        mean_conf = np.mean(confidences)
-        ax2.axvline(mean_conf, color='red', linestyle='--', linewidth=2,
-                   label=f'Mean: {mean_conf:.2f}')
-        ax2.set_xlabel('Confidence Score')
-        ax2.set_ylabel('Frequency')
-        ax2.set_title('Confidence Score Distribution (Real Data)', pad=25)
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        
-        # Subplot 3: Confidence by Decision Type (Real Data)
-        decision_confidences = {}
-        for result in load_test_results:
-            decision = result['Decision']
-            confidence = result['Confidence']
-            if confidence > 0:
-                if decision not in decision_confidences:
-                    decision_confidences[decision] = []
-                decision_confidences[decision].append(confidence)
-        
-        if decision_confidences:
-            decisions_list = list(decision_confidences.keys())
-            confidences_list = list(decision_confidences.values())
-            
-            bp = ax3.boxplot(confidences_list, labels=decisions_list, patch_artist=True)
-            colors_box = ['lightcoral', 'lightblue', 'lightgreen']
-            for patch, color in zip(bp['boxes'], colors_box[:len(decisions_list)]):
-                patch.set_facecolor(color)
-                patch.set_alpha(0.8)
-            
-            ax3.set_ylabel('Confidence Score')
-            ax3.set_title('Confidence Score by Decision Type (Real Data)', pad=25)
-            ax3.grid(True, alpha=0.3)
-        
-        # Subplot 4: System Performance Summary (Real Data)
-        performance_metrics = {
-            'Success Rate (%)': self.summary['SuccessRate'],
-            'Avg Confidence': self.summary['AverageConfidence'] * 100,
-            'Total Requests': self.summary['TotalRequests'],
-            'Avg Response Time (s)': self.summary['AverageResponseTime'] / 1000
-        }
-        
-        bars = ax4.bar(performance_metrics.keys(), performance_metrics.values(), 
-                      color=['green', 'blue', 'orange', 'purple'], alpha=0.8)
-        ax4.set_ylabel('Value')
-        ax4.set_title('System Performance Summary (Real Data)', pad=25)
-        ax4.grid(True, alpha=0.3)
-        
-        # Add value labels
-        for bar, value in zip(bars, performance_metrics.values()):
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{value:.1f}', ha='center', va='bottom', fontweight='bold')
-        
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.95)  # Add extra space for main title
-        plt.savefig(f'{self.charts_dir}/decision_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._draw_chart('create_decision_analysis_chart')
         print("Created decision analysis chart (real data only)")
 
-    def generate_all_charts(self):
-        """Generate all charts"""
+    def create_timeline_chart(self):
+        """Create throughput, in-flight and rolling latency timelines from request timestamps"""
+        self._draw_chart('create_timeline_chart')
+        print("Created load timeline chart")
+
+    def _draw_chart(self, method_name):
+        """
+        Draw a chart through its template (see chart_templates.py) and save it.
+
+        With shared templates the figure, axes and layout built for an earlier report
+        are reused and only the data artists change; otherwise the figure is built for
+        this one chart and closed after saving.
+        """
+        trace = self.tracer.sequence(method_name)
+        template = self.templates.get(method_name) if self.templates is not None else None
+        if template is None:
+            trace.stage('figure')
+            template = chart_templates.CHART_TEMPLATES[method_name](self.CHART_SPECS[method_name]['figsize'])
+            if self.templates is not None:
+                self.templates[method_name] = template
+        template.update(self, trace)
+        if not template.laid_out:
+            trace.stage('tight_layout')
+            template.layout()
+        trace.stage('savefig')
+        template.save(self.chart_path(method_name), dpi=self.dpi,
+                      bbox_inches=self.RENDER_PROFILES[self.profile]['bbox_inches'])
+        if self.templates is None:
+            template.close()
+        trace.end()
+
+    @property
+    def timeline(self):
+        """Per-bucket throughput, concurrency and rolling latency, computed on first use"""
+        if self._timeline is None:
+            with self.tracer.span('timeline', category='prepare'):
+                self._timeline = Timeline(self.columns)
+        return self._timeline
+
+    def available_charts(self):
+        """Chart methods this report has data for (timeline charts need request timestamps)"""
+        return [name for name, spec in self.CHART_SPECS.items()
+                if not spec.get('requires_timestamps') or self.columns.has_timestamps]
+
+    @property
+    def aggregates(self):
+        """Histogram counts, means and per-decision box statistics, computed on first use"""
+        if self._aggregates is None:
+            with self.tracer.span('aggregate', category='prepare'):
+                self._aggregates = ChartAggregates(self.columns)
+        return self._aggregates
+
+    def latency_percentiles(self):
+        """p50/p90/p95/p99/p99.9 response times in seconds from the latency sketch"""
+        return {label: value / 1000 for label, value in self.columns.latency.percentiles().items()}
+
+    def _percentile_line(self):
+        percentiles = self.latency_percentiles()
+        return (f"p50 / p95 / p99: {percentiles['p50']:.1f}s / {percentiles['p95']:.1f}s / "
+                f"{percentiles['p99']:.1f}s")
+
+    def _lod_label(self, plotted_points, total_points):
+        """Describe how many raw points a reduced scatter stands for"""
+        if plotted_points == total_points:
+            return f"{total_points:,} points shown"
+        verb = 'aggregated into' if self.lod_mode == 'bin' else 'sampled to'
+        return f"{total_points:,} points {verb} {plotted_points:,} markers"
+
+    def chart_path(self, method_name):
+        """Output path of the chart rendered by method_name"""
+        return os.path.join(self.charts_dir, f"{self.CHART_SPECS[method_name]['file']}.{self.image_format}")
+
+    def chart_cache_key(self, method_name, report_digest):
+        """Hash of everything that determines a chart's output"""
+        spec = self.CHART_SPECS[method_name]
+        params = {
+            'chart': spec['file'],
+            'dpi': self.dpi,
+            'bbox_inches': self.RENDER_PROFILES[self.profile]['bbox_inches'],
+            'format': self.image_format,
+            'figsize': spec['figsize'],
+            'lod_threshold': self.lod_threshold,
+            'lod_mode': self.lod_mode,
+        }
+        return chart_cache_key(report_digest, params, spec['version'])
+
+    @classmethod
+    def chart_method(cls, name):
+        """Resolve a chart by method name or output file name (e.g. 'decision_analysis_3d')"""
+        if name in cls.CHART_SPECS:
+            return name
+        for method_name, spec in cls.CHART_SPECS.items():
+            if spec['file'] == name:
+                return method_name
+        raise ValueError(f"Unknown chart: {name}")
+
+    def generate_all_charts(self, parallel=False, workers=None, force=False, use_cache=True, charts=None):
+        """
+        Generate all charts (or only those named in charts), optionally in a process pool.
+
+        Charts whose report contents, render parameters and chart version match
+        the render cache manifest are skipped unless force is set.
+        """
         print("Starting EAI Chart Generation...")
         print(f"Charts directory: {self.charts_dir}")
         
+        available = self.available_charts()
+        selected = available if charts is None else [self.chart_method(name) for name in charts]
+        for name in selected:
+            if name not in available:
+                print(f"Skipped {self.CHART_SPECS[name]['file']} (report has no request timestamps)")
+        selected = [name for name in selected if name in available]
+        cache = RenderCache(self.charts_dir) if use_cache else None
+        keys = {}
+        pending = list(selected)
+        if cache is not None:
+            with self.tracer.span('render_cache.report_digest', category='cache'):
+                if self.merged is not None:
+                    report_digest = self.merged.digest(cache.report_digest)
+                elif os.path.exists(self.benchmark_file):
+                    report_digest = cache.report_digest(self.benchmark_file)
+                else:
+                    # Charted from a sidecar whose JSON is gone; the sidecar identifies the report as well
+                    report_digest = cache.report_digest(sidecar_path(self.benchmark_file))
+            keys = {name: self.chart_cache_key(name, report_digest) for name in selected}
+            if not force:
+                pending = [name for name in pending if not cache.is_fresh(self.chart_path(name), keys[name])]
+                for name in selected:
+                    if name not in pending:
+                        print(f"Skipped {self.CHART_SPECS[name]['file']} (unchanged)")
+        
         try:
-            # Generate 3D charts
-            self.create_performance_dashboard()
-            self.create_3d_response_analysis()
-            self.create_3d_decision_analysis()
-            self.create_business_impact_chart()
-            self.create_decision_analysis_chart()
+            if parallel:
+                failures = self._render_charts_parallel(pending, workers) if pending else {}
+                if cache is not None:
+                    for name in pending:
+                        if name not in failures:
+                            cache.record(self.chart_path(name), keys[name])
+                if failures:
+                    raise RuntimeError(f"{len(failures)} chart(s) failed: " +
+                                       "; ".join(f"{name}: {error}" for name, error in failures.items()))
+            else:
+                # Generate 3D charts
+                for method_name in pending:
+                    self.render_chart(method_name)
+                    if cache is not None:
+                        cache.record(self.chart_path(method_name), keys[method_name])
             
             print("\nAll charts generated successfully!")
             print(f"Charts saved in: {os.path.abspath(self.charts_dir)}")
@@ -428,12 +315,136 @@ Model: {self.environment['Model']}"""
         except Exception as e:
             print(f"Error generating charts: {e}")
             raise
+        finally:
+            if cache is not None:
+                cache.save()
+
+    def export_html_dashboard(self, path=None, threshold=None):
+        """
+        Write the performance and response-time dashboards as one offline interactive HTML file.
+
+        Runs larger than threshold points are binned before export (see html_dashboard.py).
+        """
+        import html_dashboard
+        path = path or os.path.join(self.charts_dir, html_dashboard.DASHBOARD_FILE)
+        with self.tracer.span('export_html_dashboard', category='chart'):
+            html_dashboard.write_dashboard(self, path, threshold or html_dashboard.HTML_POINT_THRESHOLD)
+        print(f"Created interactive dashboard {path}")
+        return path
+
+    def render_chart(self, method_name):
+        """Render one chart inside a tracing span (and cProfile, when the tracer asks for it)"""
+        with self.tracer.span(method_name, category='chart'), self.tracer.profile(method_name):
+            getattr(self, method_name)()
+
+    def __getstate__(self):
+        # Template figures stay in the process that built them; chart workers build their own
+        state = dict(self.__dict__)
+        state['templates'] = None
+        return state
 
-def main():
-    """Main function to generate all charts"""
+    def _render_charts_parallel(self, method_names, workers=None):
+        """Render charts in worker processes; returns {method_name: error} for failed charts"""
+        if workers is None:
+            workers = min(len(method_names), os.cpu_count() or 1)
+        
+        failures = {}
+        # Aggregate before forking workers so they share the statistics instead of each recomputing them
+        self.aggregates
+        # The generator (header + columns + aggregates) is shipped once per worker, not once per chart
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_chart_worker,
+                                 initargs=(self,)) as pool:
+            futures = {pool.submit(_render_chart_worker, name): name for name in method_names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    error, events = future.result()
+                    self.tracer.extend(events)
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                if error:
+                    failures[name] = error
+                    print(f"Failed {name}: {error}")
+        return failures
+
+
+# Generator instance owned by each chart worker process
+_worker_generator = None
+
+
+def _init_chart_worker(generator):
+    """Process pool initializer: keep the shared generator and use a non-interactive backend"""
+    global _worker_generator
+    plt.switch_backend('Agg')
+    # Drop events recorded by the parent before the pool started; it already holds them
+    generator.tracer.take_events()
+    _worker_generator = generator
+
+
+def _render_chart_worker(method_name):
+    """Render one chart in a worker; returns (error message or None, trace events)"""
+    error = None
     try:
-        generator = EAIChartGenerator()
-        generator.generate_all_charts()
+        _worker_generator.render_chart(method_name)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return error, _worker_generator.tracer.take_events()
+
+def parse_args(argv=None):
+    """Command-line options for chart generation"""
+    chart_names = [spec['file'] for spec in EAIChartGenerator.CHART_SPECS.values()]
+    parser = argparse.ArgumentParser(description='Generate EAI charts from a benchmark report')
+    parser.add_argument('report', nargs='?',
+                        help='benchmark_report_*.json to chart (default: latest in the parent directory)')
+    parser.add_argument('-c', '--chart', dest='charts', action='append', choices=chart_names,
+                        help='Chart to render; repeat for several (default: all)')
+    parser.add_argument('-o', '--output-dir', default='charts', help='Directory for rendered charts')
+    parser.add_argument('-f', '--format', default='png', choices=['png', 'pdf', 'svg', 'jpg'],
+                        help='Image format')
+    parser.add_argument('--dpi', type=int, help='Output resolution (default: 300, or 72 with --profile preview)')
+    parser.add_argument('--profile', default='publication', choices=list(EAIChartGenerator.RENDER_PROFILES),
+                        help="'preview' renders at low DPI without bbox_inches='tight' for quick looks")
+    parser.add_argument('--parallel', action='store_true', help='Render charts in a process pool')
+    parser.add_argument('--workers', type=int, help='Process pool size (default: one per chart, up to CPU count)')
+    parser.add_argument('--force', action='store_true', help='Re-render charts even if the render cache is fresh')
+    parser.add_argument('--no-cache', action='store_true', help='Neither read nor update the render cache')
+    parser.add_argument('--lod-threshold', type=int, default=LOD_POINT_THRESHOLD,
+                        help='Points above which 3D scatters are reduced')
+    parser.add_argument('--lod-mode', default='bin', choices=['bin', 'sample'],
+                        help='How large 3D scatters are reduced')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='Write per-stage timing spans as Chrome-trace/Perfetto JSON and print a summary')
+    parser.add_argument('--profile-dir', help='Write a cProfile .prof file per chart into this directory')
+    parser.add_argument('--html', action='store_true',
+                        help='Also write an offline interactive HTML dashboard (interactive_dashboard.html)')
+    parser.add_argument('--no-sidecar', action='store_true', help='Parse the JSON even if a .eaicol sidecar exists')
+    parser.add_argument('--shards', action='append', metavar='GLOB',
+                        help='Chart per-node shard reports matching GLOB as one run (quote it; repeatable)')
+    parser.add_argument('--shard-workers', type=int,
+                        help='Processes used to reduce shards (default: one per shard, up to CPU count)')
+    parser.add_argument('--max-rows', type=int, default=DEFAULT_MAX_ROWS,
+                        help='Rows of merged shards kept as columns; larger runs are uniformly sampled')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main function to generate charts"""
+    args = parse_args(argv)
+    tracer = None
+    if args.trace or args.profile_dir:
+        from chart_tracing import ChartTracer
+        tracer = ChartTracer(profile_dir=args.profile_dir)
+    try:
+        generator = EAIChartGenerator(args.report, lod_threshold=args.lod_threshold, lod_mode=args.lod_mode,
+                                      dpi=args.dpi, image_format=args.format, charts_dir=args.output_dir,
+                                      tracer=tracer, use_sidecar=not args.no_sidecar, shards=args.shards,
+                                      shard_workers=args.shard_workers, max_rows=args.max_rows,
+                                      profile=args.profile)
+        generator.generate_all_charts(parallel=args.parallel, workers=args.workers, force=args.force,
+                                      use_cache=not args.no_cache, charts=args.charts)
+        if args.html:
+            generator.export_html_dashboard()
+        chart_count = len(args.charts) if args.charts else len(generator.available_charts())
         
         print("\n" + "="*60)
         print("CHART GENERATION SUMMARY")
@@ -443,9 +454,15 @@ def main():
         print(f"Success Rate: {generator.summary['SuccessRate']}%")
         print(f"Avg Response Time: {generator.summary['AverageResponseTime']/1000:.1f}s")
         print(f"Avg Confidence: {generator.summary['AverageConfidence']:.2f}")
-        print(f"Charts Generated: 5 comprehensive visualizations")
+        print(f"Charts Generated: {chart_count} visualizations")
         print("="*60)
         
+        if tracer is not None:
+            print("\n" + tracer.format_summary())
+            if args.trace:
+                tracer.export_chrome_trace(args.trace)
+                print(f"Trace written to {args.trace} (open in ui.perfetto.dev or chrome://tracing)")
+        
     except Exception as e:
         print(f"Failed to generate charts: {e}")
         return 1
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+EAI Chart Tracing
+Optional timing spans for chart generation, exported as Chrome-trace/Perfetto JSON and
+as a summary table, with an optional cProfile dump per chart
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StageSequence:
+    """Back-to-back spans inside one chart: each stage() call closes the previous stage"""
+
+    def __init__(self, tracer, chart):
+        self.tracer = tracer
+        self.chart = chart
+        self._name = None
+        self._started = None
+
+    def stage(self, name):
+        self.end()
+        self._name = name
+        self._started = time.perf_counter_ns()
+
+    def end(self):
+        if self._name is not None:
+            self.tracer.record(f"{self.chart}.{self._name}", self._started, time.perf_counter_ns(),
+                               category='stage', chart=self.chart)
+            self._name = None
+
+
+class ChartTracer:
+    """Collects complete ('X') trace events; safe to pickle into worker processes"""
+
+    enabled = True
+
+    def __init__(self, profile_dir=None):
+        self.profile_dir = profile_dir
+        # perf_counter is system-wide monotonic on Linux, so worker timestamps line up
+        self.origin_ns = time.perf_counter_ns()
+        self.events = []
+
+    def record(self, name, start_ns, end_ns, category='chart', **args):
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start_ns - self.origin_ns) / 1000,
+            'dur': (end_ns - start_ns) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+    @contextmanager
+    def span(self, name, category='chart', **args):
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, started, time.perf_counter_ns(), category, **args)
+
+    def sequence(self, chart):
+        return StageSequence(self, chart)
+
+    @contextmanager
+    def profile(self, chart):
+        """cProfile the block into <profile_dir>/<chart>.prof when profiling is enabled"""
+        if not self.profile_dir:
+            yield
+            return
+        os.makedirs(self.profile_dir, exist_ok=True)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(os.path.join(self.profile_dir, f"{chart}.prof"))
+
+    def take_events(self):
+        """Remove and return collected events (used to ship worker events back)"""
+        events, self.events = self.events, []
+        return events
+
+    def extend(self, events):
+        self.events.extend(events)
+
+    def export_chrome_trace(self, path):
+        """Write events in the Chrome trace / Perfetto JSON format"""
+        names = {os.getpid(): 'chart_generator'}
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid,
+                     'args': {'name': names.get(pid, f'chart worker {pid}')}}
+                    for pid in sorted({e['pid'] for e in self.events})]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': metadata + sorted(self.events, key=lambda e: e['ts']),
+                       'displayTimeUnit': 'ms'}, f)
+
+    def summary(self):
+        """[(name, count, total_ms, mean_ms, max_ms)] sorted by total time"""
+        totals = {}
+        for event in self.events:
+            entry = totals.setdefault(event['name'], [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += event['dur'] / 1000
+            entry[2] = max(entry[2], event['dur'] / 1000)
+        rows = [(name, count, total, total / count, longest) for name, (count, total, longest) in totals.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def format_summary(self):
+        lines = [f"{'Span':<52} {'Count':>5} {'Total ms':>10} {'Mean ms':>10} {'Max ms':>10}"]
+        for name, count, total, mean, longest in self.summary():
+            lines.append(f"{name:<52} {count:>5} {total:>10.1f} {mean:>10.1f} {longest:>10.1f}")
+        return "\n".join(lines)
+
+
+class _NullSequence:
+    def stage(self, name):
+        pass
+
+    def end(self):
+        pass
+
+
+class NullTracer:
+    """Default tracer: every hook is a no-op"""
+
+    enabled = False
+    profile_dir = None
+    _sequence = _NullSequence()
+
+    @contextmanager
+    def span(self, name, category='chart', **args):
+        yield
+
+    def sequence(self, chart):
+        return self._sequence
+
+    @contextmanager
+    def profile(self, chart):
+        yield
+
+    def take_events(self):
+        return []
+
+    def extend(self, events):
+        pass
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+EAI Chart Watcher
+Long-running mode that keeps the plotting stack warm and renders charts for each new
+benchmark_report_*.json as soon as it lands in the report directory
+"""
+
+import argparse
+import os
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from chart_generator import EAIChartGenerator
+from report_history import HISTORY_DB_NAME, ReportHistory, find_reports
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+def warm_up():
+    """Pay one-off costs (3D toolkit import, font cache, Agg renderer) before the first report"""
+    fig = plt.figure(figsize=(2, 2))
+    ax = fig.add_subplot(121, projection='3d')
+    ax.scatter([0, 1], [0, 1], [0, 1])
+    ax.set_title('warm-up', fontweight='bold')
+    fig.add_subplot(122).bar(['a'], [1])
+    fig.text(0.5, 0.02, 'warm-up', bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+class ReportWatcher:
+    """Polls a directory and renders charts for new, fully written benchmark reports"""
+
+    def __init__(self, report_dir, charts_root='charts', poll_interval=DEFAULT_POLL_INTERVAL,
+                 parallel=False, history=False, generator_options=None):
+        self.report_dir = report_dir
+        self.charts_root = charts_root
+        self.poll_interval = poll_interval
+        self.parallel = parallel
+        self.history = history
+        self.generator_options = generator_options or {}
+        # Chart figures built for the first report are refilled for later ones (see chart_templates.py)
+        self.templates = None if parallel else {}
+        # path -> (size, mtime_ns) already rendered
+        self._rendered = {}
+        # path -> (size, mtime_ns) seen on the previous poll, waiting to stop changing
+        self._pending = {}
+
+    def mark_existing(self):
+        """Treat reports already in the directory as rendered"""
+        for path in find_reports(self.report_dir):
+            stat = os.stat(path)
+            self._rendered[path] = (stat.st_size, stat.st_mtime_ns)
+
+    def scan(self):
+        """Reports that are new or changed and whose size/mtime held steady for one poll"""
+        ready = []
+        for path in find_reports(self.report_dir):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self._rendered.get(path) == signature:
+                continue
+            if self._pending.get(path) == signature:
+                del self._pending[path]
+                ready.append(path)
+            else:
+                # Still being written (or just appeared): check again next poll
+                self._pending[path] = signature
+        return ready
+
+    def charts_dir_for(self, report_path):
+        """Each report gets its own output directory named after the report"""
+        name = os.path.splitext(os.path.basename(report_path))[0]
+        return os.path.join(self.charts_root, name)
+
+    def render(self, report_path):
+        """Render all charts for one report; errors are reported, not raised"""
+        started = time.perf_counter()
+        try:
+            stat = os.stat(report_path)
+        except FileNotFoundError:
+            # Deleted or renamed since the scan; a renamed report shows up under its new name
+            print(f"Skipped {os.path.basename(report_path)} (no longer exists)")
+            self._pending.pop(report_path, None)
+            return
+        try:
+            generator = EAIChartGenerator(report_path, charts_dir=self.charts_dir_for(report_path),
+                                          templates=self.templates, **self.generator_options)
+            generator.generate_all_charts(parallel=self.parallel)
+            if self.history:
+                with ReportHistory(os.path.join(self.charts_root, HISTORY_DB_NAME)) as history:
+                    history.ingest_file(report_path)
+                    history.create_trend_charts(self.charts_root, dpi=generator.dpi,
+                                                image_format=generator.image_format)
+        except Exception as e:
+            print(f"Failed to render {os.path.basename(report_path)}: {e}")
+        else:
+            print(f"Rendered {os.path.basename(report_path)} in {time.perf_counter() - started:.2f}s")
+        finally:
+            self._rendered[report_path] = (stat.st_size, stat.st_mtime_ns)
+
+    def run(self, backfill=False, max_reports=None):
+        """Poll until interrupted (or until max_reports reports have been rendered)"""
+        os.makedirs(self.charts_root, exist_ok=True)
+        warm_up()
+        if not backfill:
+            self.mark_existing()
+        print(f"Watching {os.path.abspath(self.report_dir)} every {self.poll_interval}s (Ctrl+C to stop)")
+
+        rendered = 0
+        try:
+            while max_reports is None or rendered < max_reports:
+                for path in self.scan():
+                    self.render(path)
+                    rendered += 1
+                    if max_reports is not None and rendered >= max_reports:
+                        break
+                else:
+                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+        return rendered
+
+
+def main():
+    """Watch a report directory and render charts for each new benchmark report"""
+    parser = argparse.ArgumentParser(description='Render EAI charts as benchmark reports land')
+    parser.add_argument('report_dir', nargs='?', default='..', help='Directory receiving benchmark_report_*.json')
+    parser.add_argument('--charts-dir', default='charts', help='Root output directory (one subdirectory per report)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL, help='Polling interval in seconds')
+    parser.add_argument('--backfill', action='store_true', help='Also render reports already in the directory')
+    parser.add_argument('--parallel', action='store_true', help='Render each report\'s charts in a process pool')
+    parser.add_argument('--history', action='store_true', help='Index each report and refresh history trend charts')
+    args = parser.parse_args()
+
+    watcher = ReportWatcher(args.report_dir, charts_root=args.charts_dir, poll_interval=args.interval,
+                            parallel=args.parallel, history=args.history)
+    watcher.run(backfill=args.backfill)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
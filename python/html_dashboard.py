@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+EAI Interactive HTML Dashboard
+Self-contained, offline HTML export of the performance and response-time dashboards using
+WebGL traces (scatter3d / scattergl); large runs are binned server-side before export
+"""
+
+import html
+import numpy as np
+from aggregation import AGGREGATION_CHUNK
+from lod import reduce_points
+
+DASHBOARD_FILE = 'interactive_dashboard.html'
+# Raw points per trace above which the export switches to pre-binned aggregates
+HTML_POINT_THRESHOLD = 20000
+# Voxels per axis for binned 3D traces and cells per axis for 2D density panels
+HTML_VOXEL_BINS = 32
+HTML_DENSITY_BINS = 200
+
+DECISION_COLORS = {'escalate': 'red', 'approve': 'green', 'deny': 'orange'}
+
+
+def density_grid(x, y, bins=HTML_DENSITY_BINS, chunk=AGGREGATION_CHUNK):
+    """histogram2d(x, y) filled in chunks; returns (counts[y, x], x_centres, y_centres)"""
+    x_edges = np.histogram_bin_edges([x.min(), x.max()], bins=bins)
+    y_edges = np.histogram_bin_edges([y.min(), y.max()], bins=bins)
+    counts = np.zeros((bins, bins), dtype=np.int64)
+    for start in range(0, len(x), chunk):
+        counts += np.histogram2d(x[start:start + chunk], y[start:start + chunk], bins=(x_edges, y_edges))[0].astype(np.int64)
+    return counts.T, (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2
+
+
+def _reduce(x, y, z, threshold):
+    """LOD reduction tuned for WebGL: finer voxels than the static charts"""
+    return reduce_points(x, y, z, threshold=threshold, mode='bin',
+                         bins=min(HTML_VOXEL_BINS, max(2, int(threshold ** (1 / 3)))))
+
+
+def _marker(points, base_size, **marker):
+    """Marker dict whose size encodes how many requests a binned point stands for"""
+    sizes = points.marker_sizes(base_size, min_size=3)
+    marker['size'] = sizes if np.isscalar(sizes) else np.asarray(sizes, dtype=np.float32)
+    return marker
+
+
+def _hover_counts(points):
+    return np.asarray(points.counts, dtype=np.int64) if points.reduced else None
+
+
+def _sequence_panel(fig, x, y, row, col, threshold, name, color=None):
+    """Response time over request order: scattergl when small, density heatmap when large"""
+    import plotly.graph_objects as go
+
+    if len(x) <= threshold:
+        fig.add_trace(go.Scattergl(x=x, y=y, mode='markers', name=name, showlegend=False,
+                                   marker=dict(size=4, color=color if color is not None else x,
+                                               colorscale='Viridis')),
+                      row=row, col=col)
+        return f"{len(x):,} points shown"
+    counts, x_centres, y_centres = density_grid(x, y)
+    fig.add_trace(go.Heatmap(x=x_centres.astype(np.float32), y=y_centres.astype(np.float32),
+                             z=np.where(counts > 0, counts, np.nan).astype(np.float32),
+                             colorscale='Viridis', colorbar=dict(title='Requests', len=0.4, y=0.2),
+                             hovertemplate='Requests: %{z}<extra></extra>', name=name),
+                  row=row, col=col)
+    return f"{len(x):,} points binned into a {len(x_centres)}x{len(y_centres)} density grid"
+
+
+def performance_figure(generator, threshold=HTML_POINT_THRESHOLD):
+    """Interactive counterpart of create_performance_dashboard"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    columns = generator.columns
+    mask = columns.confident
+    response_times = columns.response_time_s[mask]
+    confidences = columns.confidence[mask]
+    decision_codes = columns.decision_code[mask]
+    sequence = np.flatnonzero(mask)
+    decision_counts = columns.decision_counts()
+
+    fig = make_subplots(rows=2, cols=1, row_heights=[0.7, 0.3], vertical_spacing=0.06,
+                        specs=[[{'type': 'scene'}], [{'type': 'xy'}]],
+                        subplot_titles=('3D Performance Analysis: Time vs Confidence vs Request Order',
+                                        'Response Time by Request Order'))
+    total_points = len(sequence)
+    plotted_points = 0
+    for code, decision in enumerate(columns.decision_labels):
+        in_class = decision_codes == code
+        class_points = int(np.count_nonzero(in_class))
+        if not class_points:
+            continue
+        class_threshold = threshold
+        if total_points > threshold:
+            class_threshold = max(1, threshold * class_points // total_points)
+        points = _reduce(response_times[in_class], confidences[in_class], sequence[in_class], class_threshold)
+        plotted_points += len(points)
+        count = round(decision_counts[decision] * columns.row_weight)
+        fig.add_trace(go.Scatter3d(
+            x=points.x.astype(np.float32), y=points.y.astype(np.float32), z=points.z.astype(np.float32),
+            mode='markers', name=f'{decision.title()} Decision ({count:,})',
+            marker=_marker(points, 6, color=DECISION_COLORS.get(decision, 'blue'), opacity=0.7),
+            customdata=_hover_counts(points),
+            hovertemplate=('Response: %{x:.2f}s<br>Confidence: %{y:.2f}<br>Request: %{z:.0f}'
+                           + ('<br>Requests in voxel: %{customdata}' if points.reduced else '')
+                           + '<extra></extra>')),
+            row=1, col=1)
+
+    sequence_label = _sequence_panel(fig, sequence.astype(np.float32), response_times.astype(np.float32),
+                                     2, 1, threshold, 'Response time')
+    fig.update_scenes(xaxis_title='Response Time (seconds)', yaxis_title='Confidence Score',
+                      zaxis_title='Request Sequence')
+    fig.update_xaxes(title_text='Request Sequence', row=2, col=1)
+    fig.update_yaxes(title_text='Response Time (seconds)', row=2, col=1)
+    fig.update_layout(
+        title=dict(text='EAI System Performance Dashboard', font=dict(size=20)),
+        height=1100, legend=dict(orientation='h', y=0.3, x=0.5, xanchor='center'),
+        annotations=list(fig.layout.annotations) + [_metrics_annotation(generator, [
+            f"Plotted (3D): {generator._lod_label(plotted_points, total_points)}",
+            f"Plotted (2D): {sequence_label}"])])
+    return fig
+
+
+def response_time_figure(generator, threshold=HTML_POINT_THRESHOLD):
+    """Interactive counterpart of create_3d_response_analysis"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    mask = generator.columns.confident
+    x = generator.columns.response_time_s[mask]
+    y = generator.columns.confidence[mask]
+    z = np.flatnonzero(mask)
+
+    fig = make_subplots(rows=2, cols=1, row_heights=[0.7, 0.3], vertical_spacing=0.06,
+                        specs=[[{'type': 'scene'}], [{'type': 'xy'}]],
+                        subplot_titles=('3D Response Time vs Confidence Analysis',
+                                        'Response Time vs Confidence'))
+    points = _reduce(x, y, z, threshold)
+    fig.add_trace(go.Scatter3d(
+        x=points.x.astype(np.float32), y=points.y.astype(np.float32), z=points.z.astype(np.float32),
+        mode='markers' if points.reduced else 'lines+markers', name='Requests', showlegend=False,
+        line=dict(color='rgba(0,0,0,0.3)', width=1),
+        marker=_marker(points, 6, color=points.z.astype(np.float32), colorscale='Viridis', opacity=0.8,
+                       colorbar=dict(title='Request Order', len=0.5, y=0.75)),
+        customdata=_hover_counts(points),
+        hovertemplate=('Response: %{x:.2f}s<br>Confidence: %{y:.2f}<br>Request: %{z:.0f}'
+                       + ('<br>Requests in voxel: %{customdata}' if points.reduced else '')
+                       + '<extra></extra>')),
+        row=1, col=1)
+    density_label = _sequence_panel(fig, x.astype(np.float32), y, 2, 1, threshold, 'Confidence',
+                                    color=z.astype(np.float32))
+
+    fig.update_scenes(xaxis_title='Response Time (seconds)', yaxis_title='Confidence Score',
+                      zaxis_title='Request Sequence')
+    fig.update_xaxes(title_text='Response Time (seconds)', row=2, col=1)
+    fig.update_yaxes(title_text='Confidence Score', row=2, col=1)
+    fig.update_layout(
+        title=dict(text='EAI System 3D Response Time Analysis', font=dict(size=20)), height=1100,
+        annotations=list(fig.layout.annotations) + [_metrics_annotation(generator, [
+            f"Plotted (3D): {points.describe()}", f"Plotted (2D): {density_label}"])])
+    return fig
+
+
+def _metrics_annotation(generator, extra_lines):
+    summary = generator.summary
+    lines = [
+        '<b>Performance Metrics</b>',
+        f"Total Requests: {summary['TotalRequests']}",
+        f"Success Rate: {summary['SuccessRate']}%",
+        f"Avg Response Time: {summary['AverageResponseTime']/1000:.1f}s",
+        f"Avg Confidence: {summary['AverageConfidence']:.2f}",
+        generator._percentile_line(),
+        f"Model: {generator.environment['Model']}",
+    ] + list(extra_lines)
+    return dict(text='<br>'.join(html.escape(line) if not line.startswith('<b>') else line for line in lines),
+                xref='paper', yref='paper', x=0, y=1.0, xanchor='left', yanchor='top', showarrow=False,
+                align='left', bgcolor='rgba(173,216,230,0.8)', font=dict(size=11))
+
+
+def write_dashboard(generator, path, threshold=HTML_POINT_THRESHOLD):
+    """
+    Write both dashboards into one HTML file with plotly.js inlined, so it opens offline.
+
+    Returns the path written.
+    """
+    figures = [performance_figure(generator, threshold), response_time_figure(generator, threshold)]
+    # plotly.js is embedded once, by the first figure
+    bodies = [figure.to_html(full_html=False, include_plotlyjs=(i == 0), config={'responsive': True})
+              for i, figure in enumerate(figures)]
+    title = html.escape(f"EAI Benchmark Dashboards - {generator.environment['Model']} - {generator.timestamp}")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>{title}</title>\n</head>\n"
+                f"<body>\n<h2 style=\"font-family: sans-serif\">{title}</h2>\n")
+        for body in bodies:
+            f.write(f"<div>{body}</div>\n")
+        f.write("</body>\n</html>\n")
+    return path
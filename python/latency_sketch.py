@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+EAI Latency Sketch
+Mergeable, serializable quantile sketch for response times with bounded relative error
+(log-bucketed like DDSketch / HDR histograms, stored as a dense NumPy count array)
+"""
+
+import json
+import numpy as np
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+# Largest response time (ms) the bucket layout covers; larger values land in the last bucket
+MAX_TRACKABLE_MS = np.iinfo(np.int32).max
+REPORTED_QUANTILES = (0.5, 0.9, 0.95, 0.99, 0.999)
+
+
+def quantile_label(q):
+    """0.999 -> 'p99.9'"""
+    return f"p{q * 100:g}"
+
+
+class LatencySketch:
+    """
+    Response-time quantile sketch.
+
+    Bucket i > 0 holds values in (gamma^(i-2), gamma^(i-1)] ms, bucket 0 holds
+    zero-millisecond responses. Any quantile is reported within
+    relative_accuracy of the true value, memory is fixed (~1k buckets at 1%),
+    and sketches with the same accuracy merge by adding their counts.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        buckets = int(np.ceil(np.log(MAX_TRACKABLE_MS) / self._log_gamma)) + 2
+        self.counts = np.zeros(buckets, dtype=np.int64)
+        self.min = None
+        self.max = None
+        self.sum = 0.0
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def __len__(self):
+        return self.count
+
+    def _bucket_index(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        index = np.zeros(len(values), dtype=np.intp)
+        positive = values >= 1
+        index[positive] = np.ceil(np.log(values[positive]) / self._log_gamma).astype(np.intp) + 1
+        return np.clip(index, 0, len(self.counts) - 1)
+
+    def _bucket_value(self, index):
+        """Representative value of each bucket (midpoint in relative terms)"""
+        index = np.asarray(index)
+        upper = self.gamma ** (index - 1.0)
+        return np.where(index == 0, 0.0, 2 * upper / (self.gamma + 1))
+
+    def add(self, values):
+        """Record a batch of response times (ms)"""
+        values = np.asarray(values)
+        if not len(values):
+            return self
+        self.counts += np.bincount(self._bucket_index(values), minlength=len(self.counts))
+        low, high = float(values.min()), float(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        self.sum += float(values.sum(dtype=np.float64))
+        return self
+
+    def merge(self, other):
+        """Add another sketch's counts into this one"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge latency sketches with different relative accuracy")
+        self.counts += other.counts
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sum += other.sum
+        return self
+
+    @classmethod
+    def merged(cls, sketches):
+        """New sketch holding the union of several sketches"""
+        sketches = list(sketches)
+        result = cls(sketches[0].relative_accuracy if sketches else DEFAULT_RELATIVE_ACCURACY)
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
+
+    @property
+    def mean(self):
+        count = self.count
+        return self.sum / count if count else 0.0
+
+    def quantiles(self, qs=REPORTED_QUANTILES):
+        """Estimated response time (ms) at each quantile in qs"""
+        qs = np.atleast_1d(np.asarray(qs, dtype=np.float64))
+        count = self.count
+        if not count:
+            return np.full(len(qs), np.nan)
+        cumulative = np.cumsum(self.counts)
+        ranks = qs * (count - 1)
+        index = np.searchsorted(cumulative, ranks, side='right')
+        return np.clip(self._bucket_value(index), self.min, self.max)
+
+    def buckets(self):
+        """(values, counts) of the non-empty buckets, values clipped to the observed range"""
+        index = np.flatnonzero(self.counts)
+        values = self._bucket_value(index)
+        if len(index):
+            values = np.clip(values, self.min, self.max)
+        return values, self.counts[index]
+
+    def quantile(self, q):
+        return float(self.quantiles([q])[0])
+
+    def percentiles(self, qs=REPORTED_QUANTILES):
+        """{'p50': ms, 'p90': ms, ...}"""
+        return {quantile_label(q): float(v) for q, v in zip(qs, self.quantiles(qs))}
+
+    def to_dict(self):
+        """Sparse, JSON-friendly representation"""
+        nonzero = np.flatnonzero(self.counts)
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'min': self.min,
+            'max': self.max,
+            'sum': self.sum,
+            'buckets': {str(i): int(self.counts[i]) for i in nonzero},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['relative_accuracy'])
+        for index, count in data['buckets'].items():
+            sketch.counts[int(index)] = count
+        sketch.min = data['min']
+        sketch.max = data['max']
+        sketch.sum = data['sum']
+        return sketch
+
+    def dumps(self):
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def loads(cls, text):
+        return cls.from_dict(json.loads(text))
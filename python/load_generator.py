@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+EAI Load Generator
+asyncio load generator for the approval API: drives /health and /api/approval/process with a
+pooled HTTP client at configurable concurrency or open-loop arrival rate, and streams results
+into a benchmark_report_*.json that EAIChartGenerator reads directly
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime
+from http import HTTPStatus
+from report_writer import DEFAULT_ENVIRONMENT, ReportWriter, test_result
+
+DEFAULT_BASE_URL = 'https://localhost:58080'
+# Same per-request limit as APITester's HttpClient
+DEFAULT_TIMEOUT = 120.0
+RAMP_PROFILES = ('constant', 'linear', 'step')
+
+REQUEST_TYPES = ('expense', 'leave', 'purchase')
+DEPARTMENTS = ('Sales', 'Engineering', 'Marketing', 'HR', 'Finance')
+PRIORITIES = ('low', 'normal', 'high')
+
+# The fixed per-type requests sent by APITester.RunComprehensiveBenchmarkAsync
+REQUEST_TYPE_SAMPLES = {
+    'expense': {'requestType': 'expense', 'requesterId': 'user001', 'amount': 500,
+                'description': 'Client dinner', 'department': 'Sales', 'priority': 'normal'},
+    'leave': {'requestType': 'leave', 'requesterId': 'user002', 'days': 7,
+              'description': 'Vacation request', 'department': 'Engineering', 'priority': 'normal'},
+    'purchase': {'requestType': 'purchase', 'requesterId': 'user003', 'amount': 2500,
+                 'description': 'Software license', 'department': 'IT', 'priority': 'high'},
+}
+
+
+def default_report_path(directory='..'):
+    """benchmark_report_<yyyy-MM-dd_HH-mm-ss>.json, the name Program.GenerateReport uses"""
+    return os.path.join(directory, f"benchmark_report_{datetime.now():%Y-%m-%d_%H-%M-%S}.json")
+
+
+def _status_name(status):
+    """HttpStatusCode-style name (e.g. InternalServerError), matching APITester's error text"""
+    try:
+        return HTTPStatus(status).phrase.replace(' ', '')
+    except ValueError:
+        return str(status)
+
+
+def approval_request(rng, index):
+    """Random ApprovalRequestDto (camelCase JSON), as APITester.GenerateTestRequests builds them"""
+    request_type = rng.choice(REQUEST_TYPES)
+    request = {
+        'requestType': request_type,
+        'requesterId': f"user{rng.randint(1000, 9998)}",
+        'description': f"Test request {index + 1}",
+        'department': rng.choice(DEPARTMENTS),
+        'priority': rng.choice(PRIORITIES),
+    }
+    if request_type == 'leave':
+        request['days'] = rng.randint(1, 19)
+    else:
+        request['amount'] = rng.randint(50, 4999)
+    return request
+
+
+class RampProfile:
+    """
+    Target arrival rate (requests/s) over time.
+
+    'constant' holds rate; 'linear' rises from start_rate to rate over ramp_seconds;
+    'step' climbs there in `steps` equal increments. All hold rate after the ramp.
+    """
+
+    def __init__(self, rate, kind='constant', start_rate=1.0, ramp_seconds=0.0, steps=5):
+        if kind not in RAMP_PROFILES:
+            raise ValueError(f"Unknown ramp profile: {kind} (expected one of {', '.join(RAMP_PROFILES)})")
+        self.rate = rate
+        self.kind = kind
+        self.start_rate = min(start_rate, rate)
+        self.ramp_seconds = ramp_seconds
+        self.steps = max(1, steps)
+
+    def fraction(self, elapsed):
+        """How far through the ramp we are, 0..1"""
+        if self.kind == 'constant' or self.ramp_seconds <= 0 or elapsed >= self.ramp_seconds:
+            return 1.0
+        fraction = elapsed / self.ramp_seconds
+        if self.kind == 'step':
+            fraction = (int(fraction * self.steps) + 1) / self.steps
+        return fraction
+
+    def rate_at(self, elapsed):
+        return self.start_rate + (self.rate - self.start_rate) * self.fraction(elapsed)
+
+
+class LoadGenerator:
+    """Pooled aiohttp client that turns approval API calls into TestResult dicts"""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, concurrency=64, timeout=DEFAULT_TIMEOUT, verify_tls=False,
+                 authorization=None, seed=None):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.timeout = timeout
+        # The API's development certificate is self-signed, so TLS is not verified by default
+        self.verify_tls = verify_tls
+        self.headers = {'Authorization': authorization} if authorization else {}
+        self.rng = random.Random(seed)
+        self.issued = 0
+        self.dropped = 0
+        self._session = None
+
+    async def __aenter__(self):
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ssl=None if self.verify_tls else False)
+        # Event-loop time is monotonic; this offset maps it to wall-clock time for StartTime/EndTime
+        self._wall_offset = time.time() - asyncio.get_running_loop().time()
+        self._session = aiohttp.ClientSession(connector=connector, headers=self.headers,
+                                              timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+
+    async def check_health(self):
+        """GET /health; the body goes into Decision, as in APITester.TestHealthEndpointAsync"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            async with self._session.get(f"{self.base_url}/health") as response:
+                content = await response.text()
+                elapsed_ms = (loop.time() - started) * 1000
+                return test_result(response.status < 400, elapsed_ms, decision=content)
+        except Exception as e:
+            return test_result(False, (loop.time() - started) * 1000, error=str(e) or type(e).__name__)
+
+    async def process(self, request, scheduled=None):
+        """
+        POST one approval request and return its TestResult, including StartTime/EndTime.
+
+        In open-loop runs `scheduled` is the intended send time, so time spent waiting
+        for a pooled connection counts towards ResponseTime (no coordinated omission).
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time() if scheduled is None else scheduled
+        try:
+            async with self._session.post(f"{self.base_url}/api/approval/process", json=request) as response:
+                content = await response.text()
+                finished = loop.time()
+                if response.status >= 400:
+                    return test_result(False, (finished - started) * 1000,
+                                       error=f"HTTP {_status_name(response.status)}: {content}",
+                                       **self._timestamps(started, finished))
+            result = json.loads(content)
+            return test_result(True, (finished - started) * 1000, result.get('decision') or 'unknown',
+                               result.get('confidenceScore') or 0.0,
+                               result.get('reasoning') or 'no reasoning provided',
+                               **self._timestamps(started, finished))
+        except Exception as e:
+            finished = loop.time()
+            return test_result(False, (finished - started) * 1000, error=str(e) or type(e).__name__,
+                               **self._timestamps(started, finished))
+
+    def _timestamps(self, started, finished):
+        """StartTime/EndTime in Unix epoch milliseconds from event-loop clock readings"""
+        return {'start_time': (started + self._wall_offset) * 1000,
+                'end_time': (finished + self._wall_offset) * 1000}
+
+    def next_request(self):
+        request = approval_request(self.rng, self.issued)
+        self.issued += 1
+        return request
+
+    async def run_closed_loop(self, sink, duration=None, total_requests=None, ramp_seconds=0.0):
+        """
+        `concurrency` workers each send their next request as soon as the previous one returns.
+
+        Workers start evenly spread over ramp_seconds. sink(result) receives every TestResult.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration if duration else None
+
+        def more():
+            if deadline is not None and loop.time() >= deadline:
+                return False
+            return total_requests is None or self.issued < total_requests
+
+        async def worker(delay):
+            await asyncio.sleep(delay)
+            while more():
+                sink(await self.process(self.next_request()))
+
+        await asyncio.gather(*(worker(ramp_seconds * i / self.concurrency) for i in range(self.concurrency)))
+
+    async def run_open_loop(self, sink, profile, duration=None, total_requests=None, poisson=True,
+                            max_pending=10000):
+        """
+        Send requests on an arrival schedule that does not wait for responses.
+
+        Arrivals follow profile.rate_at(t) (exponential gaps when poisson, even gaps otherwise).
+        When max_pending requests are already outstanding, further arrivals are counted in
+        self.dropped instead of queueing without bound.
+        """
+        loop = asyncio.get_running_loop()
+        pending = set()
+        start = loop.time()
+        offset = 0.0
+
+        async def send(request, scheduled):
+            sink(await self.process(request, scheduled))
+
+        while (duration is None or offset < duration) and (total_requests is None or self.issued < total_requests):
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Behind schedule: still yield so in-flight requests progress while the backlog is issued
+                await asyncio.sleep(0)
+            if len(pending) >= max_pending:
+                self.dropped += 1
+            else:
+                task = asyncio.ensure_future(send(self.next_request(), start + offset))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            rate = max(profile.rate_at(offset), 1e-3)
+            offset += self.rng.expovariate(rate) if poisson else 1.0 / rate
+
+        if pending:
+            await asyncio.gather(*pending)
+
+
+class LoadPlan:
+    """Shape of the load phase: closed loop (rate=None) or open loop following a RampProfile"""
+
+    def __init__(self, rate=None, concurrency=64, duration=None, total_requests=None, ramp='constant',
+                 ramp_seconds=0.0, start_rate=1.0, steps=5, poisson=True, max_pending=10000):
+        if duration is None and total_requests is None:
+            raise ValueError("Give a duration, a request count, or both")
+        self.rate = rate
+        self.concurrency = concurrency
+        self.duration = duration
+        self.total_requests = total_requests
+        self.ramp = ramp
+        self.ramp_seconds = ramp_seconds
+        self.start_rate = start_rate
+        self.steps = steps
+        self.poisson = poisson
+        self.max_pending = max_pending
+
+    def split(self, parts):
+        """Divide rate, connections, request count and backlog evenly between `parts` processes"""
+        plans = []
+        for index in range(parts):
+            plan = LoadPlan(**vars(self))
+            plan.concurrency = max(1, (self.concurrency + parts - 1 - index) // parts)
+            plan.max_pending = max(1, self.max_pending // parts)
+            if self.rate is not None:
+                plan.rate = self.rate / parts
+                plan.start_rate = self.start_rate / parts
+            if self.total_requests is not None:
+                plan.total_requests = (self.total_requests + parts - 1 - index) // parts
+            plans.append(plan)
+        return plans
+
+    async def run(self, generator, sink):
+        if self.rate is None:
+            await generator.run_closed_loop(sink, self.duration, self.total_requests, self.ramp_seconds)
+        else:
+            profile = RampProfile(self.rate, self.ramp, self.start_rate, self.ramp_seconds, self.steps)
+            await generator.run_open_loop(sink, profile, self.duration, self.total_requests, self.poisson,
+                                          self.max_pending)
+
+
+# Results shipped per message from load processes to the writer
+RESULT_BATCH = 500
+# Seconds the parent waits for a message before checking that load processes are still alive
+QUEUE_POLL_SECONDS = 1.0
+
+
+async def _process_load(index, client_options, plan, queue):
+    batch = []
+
+    def sink(result):
+        batch.append(result)
+        if len(batch) >= RESULT_BATCH:
+            queue.put(batch[:])
+            batch.clear()
+
+    async with LoadGenerator(concurrency=plan.concurrency, **client_options) as generator:
+        await plan.run(generator, sink)
+    if batch:
+        queue.put(batch)
+    # The final (index, issued, dropped) message tells the parent this process is done
+    queue.put((index, generator.issued, generator.dropped))
+
+
+def _load_process_main(index, client_options, plan, queue):
+    """Entry point of a load process: run its share of the plan with its own event loop"""
+    asyncio.run(_process_load(index, client_options, plan, queue))
+
+
+async def _run_load_processes(client_options, plan, processes, sink):
+    """Run plan split across processes; results are streamed back to sink in this process"""
+    import multiprocessing
+    from functools import partial
+    from queue import Empty
+
+    # Spawn, not fork: this runs inside an event loop that holds the client session and,
+    # with --stub, the in-process server, none of which a child should inherit
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    workers = []
+    for index, part in enumerate(plan.split(processes)):
+        options = dict(client_options)
+        if options.get('seed') is not None:
+            options['seed'] += index + 1
+        worker = context.Process(target=_load_process_main, args=(index, options, part, queue), daemon=True)
+        worker.start()
+        workers.append(worker)
+
+    loop = asyncio.get_running_loop()
+    issued = dropped = 0
+    reported = set()
+    get = partial(queue.get, timeout=QUEUE_POLL_SECONDS)
+    # Drain off the event loop thread so an in-process stub server keeps serving
+    while len(reported) < len(workers):
+        try:
+            message = await loop.run_in_executor(None, get)
+        except Empty:
+            # Nothing queued: a process that has exited without its final message has crashed
+            for index, worker in enumerate(workers):
+                if index not in reported and not worker.is_alive():
+                    for other in workers:
+                        other.terminate()
+                    raise RuntimeError(f"Load process {index} exited with code {worker.exitcode} "
+                                       "without reporting its results")
+            continue
+        if isinstance(message, tuple):
+            index, process_issued, process_dropped = message
+            issued += process_issued
+            dropped += process_dropped
+            reported.add(index)
+        else:
+            for result in message:
+                sink(result)
+    for worker in workers:
+        worker.join()
+    return issued, dropped
+
+
+async def run_benchmark(path, plan, base_url=DEFAULT_BASE_URL, processes=1, timeout=DEFAULT_TIMEOUT,
+                        verify_tls=False, authorization=None, environment=None, seed=None):
+    """
+    Run the APITester benchmark sequence (health, single request, load, per-type requests)
+    and stream it to path. The load phase follows plan, split over `processes` event loops.
+
+    Returns (summary, stats) where stats holds issued/dropped/completed counts and the load phase
+    duration; completed counts load-test results written to the report, failed ones included.
+    """
+    environment = dict(DEFAULT_ENVIRONMENT if environment is None else environment, BaseUrl=base_url)
+    client_options = {'base_url': base_url, 'timeout': timeout, 'verify_tls': verify_tls,
+                      'authorization': authorization, 'seed': seed}
+    async with LoadGenerator(concurrency=plan.concurrency, **client_options) as generator:
+        loop = asyncio.get_running_loop()
+        health = await generator.check_health()
+        single = await generator.process(approval_request(generator.rng, 0))
+        with ReportWriter(path, environment=environment, timestamp=datetime.now().isoformat(),
+                          health_check=health, single_request=single) as writer:
+            completed = 0
+
+            def sink(result):
+                nonlocal completed
+                writer.add(result)
+                completed += 1
+
+            started = loop.time()
+            if processes > 1:
+                issued, dropped = await _run_load_processes(client_options, plan, processes, sink)
+            else:
+                await plan.run(generator, sink)
+                issued, dropped = generator.issued, generator.dropped
+            stats = {'issued': issued, 'dropped': dropped, 'completed': completed,
+                     'seconds': loop.time() - started}
+            request_types = {name: await generator.process(request) for name, request in REQUEST_TYPE_SAMPLES.items()}
+            return writer.close(request_types), stats
+
+
+async def _run_against_stub(args):
+    """Start the bundled stub server in this loop and point the run at it"""
+    from approval_stub_server import StubSettings, start_stub_server
+
+    settings = StubSettings(args.stub_latency_ms, error_rate=args.stub_error_rate, capacity=args.stub_capacity,
+                            seed=args.seed)
+    runner, base_url = await start_stub_server(settings)
+    print(f"Stub approval API on {base_url}")
+    try:
+        return await _run(args, base_url, environment=dict(DEFAULT_ENVIRONMENT, LLMProvider='Stub', Model='stub'))
+    finally:
+        await runner.cleanup()
+
+
+async def _run(args, base_url, environment=None):
+    plan = LoadPlan(args.rate, args.concurrency, args.duration, args.requests, args.ramp, args.ramp_time,
+                    args.start_rate, args.steps, not args.uniform, args.max_pending)
+    return await run_benchmark(args.output, plan, base_url=base_url, processes=args.processes,
+                               timeout=args.timeout, verify_tls=args.verify_tls, authorization=args.authorization,
+                               environment=environment, seed=args.seed)
+
+
+def main():
+    """Generate load against the approval API and write a benchmark report"""
+    parser = argparse.ArgumentParser(description='Drive the EAI approval API and write a benchmark report')
+    parser.add_argument('base_url', nargs='?', default=DEFAULT_BASE_URL, help='API base URL (default: %(default)s)')
+    parser.add_argument('-o', '--output', help='Report path (default: ../benchmark_report_<timestamp>.json)')
+    parser.add_argument('--rate', type=float, help='Open-loop arrival rate in requests/s (default: closed loop)')
+    parser.add_argument('-c', '--concurrency', type=int, default=64,
+                        help='Connection pool size; closed-loop worker count (default: %(default)s)')
+    parser.add_argument('-p', '--processes', type=int, default=1,
+                        help='Event loops (processes) sharing the load; one core drives roughly 1-2k req/s')
+    parser.add_argument('-d', '--duration', type=float, help='Seconds of load to generate')
+    parser.add_argument('-n', '--requests', type=int, help='Load-test requests to send')
+    parser.add_argument('--ramp', default='constant', choices=RAMP_PROFILES, help='Arrival rate profile')
+    parser.add_argument('--ramp-time', type=float, default=0.0, help='Seconds to reach --rate (or all workers)')
+    parser.add_argument('--start-rate', type=float, default=1.0, help='Arrival rate at the start of a ramp')
+    parser.add_argument('--steps', type=int, default=5, help="Increments of the 'step' ramp")
+    parser.add_argument('--uniform', action='store_true', help='Evenly spaced arrivals instead of Poisson')
+    parser.add_argument('--max-pending', type=int, default=10000,
+                        help='Outstanding open-loop requests beyond which arrivals are dropped')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Per-request timeout in seconds')
+    parser.add_argument('--verify-tls', action='store_true', help='Verify the server certificate')
+    parser.add_argument('--authorization', help='Authorization header value sent with every request')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--stub', action='store_true', help='Run against the bundled stub server instead of base_url')
+    parser.add_argument('--stub-latency-ms', type=float, default=50.0, help='Median stub latency')
+    parser.add_argument('--stub-error-rate', type=float, default=0.0, help='Fraction of stub requests failing')
+    parser.add_argument('--stub-capacity', type=int, help='Requests the stub processes at once')
+    args = parser.parse_args()
+
+    if args.duration is None and args.requests is None:
+        parser.error('give --duration and/or --requests')
+    args.output = args.output or default_report_path()
+
+    mode = f"open loop at {args.rate:g} req/s ({args.ramp})" if args.rate else \
+        f"closed loop with {args.concurrency} workers"
+    if args.processes > 1:
+        mode += f" across {args.processes} processes"
+    print(f"Generating load: {mode}")
+    summary, stats = asyncio.run(_run_against_stub(args) if args.stub else _run(args, args.base_url))
+
+    print(f"Report written to {args.output}")
+    print(f"Load test requests: {stats['issued']:,} sent, {stats['dropped']:,} dropped, "
+          f"{stats['completed']:,} completed ({stats['completed'] / stats['seconds']:,.0f} req/s completed "
+          f"over {stats['seconds']:.1f}s)")
+    print(f"Success Rate: {summary['SuccessRate']:.1f}%  Avg Response Time: {summary['AverageResponseTime']:.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
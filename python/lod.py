@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+EAI Chart Level-of-Detail Helpers
+Reduces large point clouds to a bounded number of markers before they reach matplotlib
+"""
+
+import numpy as np
+
+# Above this many points a scatter is downsampled or binned instead of drawn point-per-request
+LOD_POINT_THRESHOLD = 5000
+# Upper bound on voxels per axis when binning 3D scatters
+LOD_VOXEL_BINS = 24
+LOD_MODES = ('bin', 'sample')
+
+
+class LODPoints:
+    """Points ready to draw, plus how many raw points they stand for"""
+
+    def __init__(self, x, y, z, counts, total, mode):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.counts = counts
+        self.total = total
+        self.mode = mode
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def reduced(self):
+        """True when the points were downsampled or binned"""
+        return self.mode != 'full'
+
+    def marker_sizes(self, base_size, min_size=20):
+        """Marker areas scaled by the number of raw points each marker represents"""
+        if self.mode != 'bin' or not len(self.counts):
+            return base_size
+        scale = np.sqrt(self.counts / self.counts.max())
+        return min_size + (base_size * 2 - min_size) * scale
+
+    def describe(self):
+        """Short label for chart annotations"""
+        if self.mode == 'bin':
+            return f"{self.total:,} points aggregated into {len(self):,} voxels"
+        if self.mode == 'sample':
+            return f"{len(self):,} of {self.total:,} points shown (downsampled)"
+        return f"{self.total:,} points shown"
+
+
+def sample_indices(n, max_points):
+    """Evenly strided subset of range(n), keeping the first and last index"""
+    if n <= max_points:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_points).astype(np.intp))
+
+
+def voxel_bin(x, y, z, bins=LOD_VOXEL_BINS):
+    """
+    Bin 3D points into a bins^3 grid.
+
+    Returns (mean_x, mean_y, mean_z, counts) for occupied voxels only.
+    """
+    flat = np.zeros(len(x), dtype=np.intp)
+    for values in (x, y, z):
+        values = np.asarray(values, dtype=np.float64)
+        lo, hi = values.min(), values.max()
+        span = hi - lo if hi > lo else 1.0
+        index = ((values - lo) / span * bins).astype(np.intp)
+        np.clip(index, 0, bins - 1, out=index)
+        flat = flat * bins + index
+
+    size = bins ** 3
+    counts = np.bincount(flat, minlength=size)
+    occupied = counts > 0
+    means = [np.bincount(flat, weights=values, minlength=size)[occupied] / counts[occupied]
+             for values in (x, y, z)]
+    return means[0], means[1], means[2], counts[occupied]
+
+
+def reduce_points(x, y, z, threshold=LOD_POINT_THRESHOLD, mode='bin', bins=None):
+    """
+    Return an LODPoints for (x, y, z), reducing it when it exceeds threshold.
+
+    In 'bin' mode the grid defaults to the largest one whose voxel count fits
+    within threshold (capped at LOD_VOXEL_BINS per axis).
+    """
+    total = len(x)
+    if total <= threshold:
+        return LODPoints(np.asarray(x), np.asarray(y), np.asarray(z), np.ones(total, dtype=np.int64),
+                         total, 'full')
+    if mode == 'sample':
+        keep = sample_indices(total, threshold)
+        return LODPoints(np.asarray(x)[keep], np.asarray(y)[keep], np.asarray(z)[keep],
+                         np.ones(len(keep), dtype=np.int64), total, 'sample')
+    if mode == 'bin':
+        if bins is None:
+            bins = min(LOD_VOXEL_BINS, max(2, int(threshold ** (1 / 3))))
+        bx, by, bz, counts = voxel_bin(x, y, z, bins)
+        return LODPoints(bx, by, bz, counts, total, 'bin')
+    raise ValueError(f"Unknown LOD mode: {mode} (expected one of {', '.join(LOD_MODES)})")
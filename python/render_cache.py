@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+EAI Chart Render Cache
+Content-hash manifest kept next to the rendered charts so unchanged charts are not regenerated
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = '.render_cache.json'
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def chart_cache_key(report_digest, params, version):
+    """Cache key for one chart: report contents + render parameters + chart version"""
+    payload = json.dumps({'report': report_digest, 'params': params, 'version': version},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """Manifest mapping each chart output to the cache key it was rendered from"""
+
+    def __init__(self, charts_dir):
+        self.path = os.path.join(charts_dir, MANIFEST_NAME)
+        self.charts = {}
+        self.reports = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if manifest.get('version') != MANIFEST_VERSION:
+            return
+        self.charts = manifest.get('charts', {})
+        self.reports = manifest.get('reports', {})
+
+    def report_digest(self, report_path):
+        """Content hash of a report, reusing the stored hash while size and mtime are unchanged"""
+        stat = os.stat(report_path)
+        entry = self.reports.get(os.path.abspath(report_path))
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+        digest = file_digest(report_path)
+        self.reports[os.path.abspath(report_path)] = {
+            'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest,
+        }
+        return digest
+
+    def is_fresh(self, output_path, key):
+        """True when output_path exists and was rendered from the same cache key"""
+        return self.charts.get(os.path.basename(output_path)) == key and os.path.exists(output_path)
+
+    def record(self, output_path, key):
+        self.charts[os.path.basename(output_path)] = key
+
+    def save(self):
+        """Write the manifest atomically"""
+        manifest = {'version': MANIFEST_VERSION, 'charts': self.charts, 'reports': self.reports}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
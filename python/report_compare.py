@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+EAI Benchmark Report Comparison
+Bootstrap confidence intervals for differences between two or more runs (mean and p95
+latency, success rate, confidence, decision mix), with side-by-side and delta charts
+"""
+
+import argparse
+import json
+import os
+import numpy as np
+from latency_sketch import LatencySketch
+from report_sidecar import open_report
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+# Upper bound on resample-matrix cells (resamples x distinct values) generated at once
+BOOTSTRAP_CHUNK_CELLS = 1 << 22
+# Confidence scores are resampled on this grid (0.001 steps)
+CONFIDENCE_DECIMALS = 3
+# Latency is resampled from log buckets this fine, so p95 steps stay well inside its interval
+BOOTSTRAP_RELATIVE_ACCURACY = 0.001
+
+
+class RunSample:
+    """
+    One report reduced to weighted distinct values, so resampling cost does not depend on row count.
+
+    Resampling n rows with replacement is a multinomial draw of n over the distinct
+    values, which is what the bootstrap below does.
+    """
+
+    def __init__(self, path, header, columns):
+        self.path = path
+        self.model = header['Environment']['Model']
+        self.timestamp = header['Timestamp']
+        self.name = f"{self.model} ({str(self.timestamp)[:16]})"
+
+        # Successful response times as log buckets; a few thousand values however many rows there are
+        latency = LatencySketch(BOOTSTRAP_RELATIVE_ACCURACY).add(columns.response_time_ms[columns.success])
+        self.latency_values, self.latency_counts = latency.buckets()
+        self.latency_mean = latency.mean
+        self.requests = len(columns)
+        self.successes = int(np.count_nonzero(columns.success))
+
+        confidences = np.round(columns.confidence[columns.success & columns.confident].astype(np.float64),
+                               CONFIDENCE_DECIMALS)
+        self.confidence_values, self.confidence_counts = np.unique(confidences, return_counts=True)
+        self.confidence_mean = float(confidences.mean()) if len(confidences) else np.nan
+
+        counts = np.bincount(columns.decision_code[columns.success], minlength=len(columns.decision_labels))
+        self.decision_counts = {label: count for label, count in zip(columns.decision_labels, counts.tolist())
+                                if count}
+
+    @classmethod
+    def load(cls, path):
+        header, columns = open_report(path)
+        return cls(path, header, columns)
+
+
+def _chunks(total, cells_per_resample):
+    size = max(1, BOOTSTRAP_CHUNK_CELLS // max(1, cells_per_resample))
+    for start in range(0, total, size):
+        yield min(size, total - start)
+
+
+def bootstrap_distribution(values, counts, resamples, rng, quantile=None):
+    """
+    Bootstrap replicates of the mean (and optionally a quantile) of a weighted sample.
+
+    Each chunk draws a [chunk, distinct values] multinomial count matrix and reduces
+    it with matrix products and cumulative sums; there is no per-resample Python loop.
+    """
+    n = int(counts.sum())
+    means = np.full(resamples, np.nan)
+    quantiles = np.full(resamples, np.nan)
+    if not n:
+        return means, quantiles
+    probabilities = counts / n
+    done = 0
+    for size in _chunks(resamples, len(values)):
+        drawn = rng.multinomial(n, probabilities, size=size)
+        means[done:done + size] = drawn @ values / n
+        if quantile is not None:
+            rank = quantile * (n - 1)
+            index = (np.cumsum(drawn, axis=1) <= rank).sum(axis=1)
+            quantiles[done:done + size] = values[np.minimum(index, len(values) - 1)]
+        done += size
+    return means, quantiles
+
+
+def bootstrap_proportions(counts, resamples, rng):
+    """Bootstrap replicates [resamples, categories] of category shares"""
+    counts = np.asarray(counts, dtype=np.int64)
+    n = int(counts.sum())
+    if not n:
+        return np.full((resamples, len(counts)), np.nan)
+    shares = np.empty((resamples, len(counts)))
+    done = 0
+    for size in _chunks(resamples, len(counts)):
+        shares[done:done + size] = rng.multinomial(n, counts / n, size=size) / n
+        done += size
+    return shares
+
+
+def _weighted_quantile(values, counts, q):
+    """Quantile with the same rank convention as LatencySketch.quantiles"""
+    n = int(counts.sum())
+    if not n:
+        return np.nan
+    index = int(np.searchsorted(np.cumsum(counts), q * (n - 1), side='right'))
+    return float(values[min(index, len(values) - 1)])
+
+
+class ReportComparison:
+    """
+    Per-run estimates and baseline-relative differences with percentile bootstrap intervals.
+
+    The first report is the baseline. Runs are resampled independently, and each metric
+    is resampled from its own marginal distribution.
+    """
+
+    def __init__(self, samples, resamples=DEFAULT_RESAMPLES, confidence_level=DEFAULT_CONFIDENCE_LEVEL, seed=0):
+        if len(samples) < 2:
+            raise ValueError("Comparison needs at least two reports")
+        self.samples = samples
+        if len({s.name for s in samples}) < len(samples):
+            # Same model and timestamp (e.g. synthetic runs): label runs by file instead
+            for sample in samples:
+                sample.name = os.path.splitext(os.path.basename(sample.path))[0]
+        self.resamples = resamples
+        self.confidence_level = confidence_level
+        self.decision_labels = sorted({label for s in samples for label in s.decision_counts})
+        rng = np.random.default_rng(seed)
+        # metric -> (point estimates per run, replicates per run)
+        self.metrics = {}
+        for sample in samples:
+            self._add_run(sample, rng)
+        self.rows = self._difference_rows()
+
+    def _record(self, metric, point, replicates):
+        points, draws = self.metrics.setdefault(metric, ([], []))
+        points.append(point)
+        draws.append(replicates)
+
+    def _add_run(self, sample, rng):
+        means, p95s = bootstrap_distribution(sample.latency_values, sample.latency_counts, self.resamples, rng,
+                                             quantile=0.95)
+        # Bucket values are approximate; shift the replicates so they centre on the exact mean
+        binned_mean = (sample.latency_values @ sample.latency_counts / sample.latency_counts.sum()
+                       if sample.latency_counts.sum() else np.nan)
+        self._record('Mean latency (s)', sample.latency_mean / 1000, (means + sample.latency_mean - binned_mean) / 1000)
+        self._record('p95 latency (s)', _weighted_quantile(sample.latency_values, sample.latency_counts, 0.95) / 1000,
+                     p95s / 1000)
+
+        success = bootstrap_proportions([sample.successes, sample.requests - sample.successes], self.resamples, rng)
+        self._record('Success rate (%)', 100 * sample.successes / sample.requests if sample.requests else np.nan,
+                     100 * success[:, 0])
+
+        confidences, _ = bootstrap_distribution(sample.confidence_values, sample.confidence_counts,
+                                                self.resamples, rng)
+        self._record('Avg confidence', sample.confidence_mean, confidences)
+
+        counts = np.array([sample.decision_counts.get(label, 0) for label in self.decision_labels])
+        shares = bootstrap_proportions(counts, self.resamples, rng)
+        total = counts.sum()
+        for i, label in enumerate(self.decision_labels):
+            self._record(f"{label.title()} share (%)", 100 * counts[i] / total if total else np.nan,
+                         100 * shares[:, i])
+
+    def interval(self, replicates):
+        alpha = (1 - self.confidence_level) / 2
+        finite = replicates[np.isfinite(replicates)]
+        if not len(finite):
+            return np.nan, np.nan
+        low, high = np.quantile(finite, [alpha, 1 - alpha])
+        return float(low), float(high)
+
+    def run_interval(self, metric, run):
+        """Bootstrap interval of one run's own estimate"""
+        return self.interval(self.metrics[metric][1][run])
+
+    def _difference_rows(self):
+        rows = []
+        for metric, (points, draws) in self.metrics.items():
+            for run in range(1, len(self.samples)):
+                low, high = self.interval(draws[run] - draws[0])
+                difference = points[run] - points[0]
+                rows.append({
+                    'metric': metric,
+                    'baseline': self.samples[0].name,
+                    'run': self.samples[run].name,
+                    'baseline_value': points[0],
+                    'value': points[run],
+                    'difference': difference,
+                    'ci_low': low,
+                    'ci_high': high,
+                    'significant': bool(low > 0 or high < 0),
+                })
+        return rows
+
+    def format_table(self):
+        level = f"{self.confidence_level:.0%} CI"
+        lines = [f"{'Metric':<22} {'Run':<34} {'Baseline':>10} {'Value':>10} {'Delta':>10} {level:>22}"]
+        for row in self.rows:
+            flag = ' *' if row['significant'] else ''
+            lines.append(f"{row['metric']:<22} {row['run'][:34]:<34} {row['baseline_value']:>10.3f} "
+                         f"{row['value']:>10.3f} {row['difference']:>+10.3f} "
+                         f"[{row['ci_low']:>+9.3f}, {row['ci_high']:>+9.3f}]{flag}")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            'reports': [s.path for s in self.samples],
+            'runs': [s.name for s in self.samples],
+            'resamples': self.resamples,
+            'confidence_level': self.confidence_level,
+            'estimates': {metric: points for metric, (points, _) in self.metrics.items()},
+            'differences': self.rows,
+        }
+
+    def create_charts(self, charts_dir='charts', dpi=300, image_format='png'):
+        """Write comparison_side_by_side and comparison_deltas; returns their paths"""
+        import matplotlib.pyplot as plt
+
+        os.makedirs(charts_dir, exist_ok=True)
+        names = [s.name for s in self.samples]
+        colors = plt.cm.tab10(np.arange(len(names)) % 10)
+
+        # Side by side: each run's estimate with its own bootstrap interval
+        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig.suptitle('EAI Benchmark Comparison', fontsize=16, fontweight='bold', y=0.98)
+        panels = [('Mean latency (s)', 'p95 latency (s)'), ('Success rate (%)',), ('Avg confidence',)]
+        for ax, metrics in zip(axes.flat, panels):
+            width = 0.8 / len(names)
+            for run, name in enumerate(names):
+                x = np.arange(len(metrics)) + (run - (len(names) - 1) / 2) * width
+                values = [self.metrics[m][0][run] for m in metrics]
+                bounds = np.array([self.run_interval(m, run) for m in metrics])
+                errors = np.abs(bounds.T - np.array(values))
+                ax.bar(x, values, width, yerr=errors, capsize=4, color=colors[run], alpha=0.8,
+                       edgecolor='black', label=name)
+            ax.set_xticks(np.arange(len(metrics)))
+            ax.set_xticklabels(metrics)
+            ax.grid(True, alpha=0.3, axis='y')
+        axes[0, 0].set_title('Latency (bars: estimate, whiskers: bootstrap CI)')
+        axes[0, 1].set_title('Success Rate')
+        axes[1, 0].set_title('Average Confidence')
+        axes[0, 0].legend()
+
+        ax = axes[1, 1]
+        share_metrics = [f"{label.title()} share (%)" for label in self.decision_labels]
+        bottom = np.zeros(len(names))
+        for i, metric in enumerate(share_metrics):
+            shares = np.array(self.metrics[metric][0])
+            ax.bar(np.arange(len(names)), shares, bottom=bottom, label=self.decision_labels[i].title(),
+                   color=plt.cm.Set2(i % 8), edgecolor='black')
+            bottom += np.nan_to_num(shares)
+        ax.set_xticks(np.arange(len(names)))
+        ax.set_xticklabels(names, rotation=15, ha='right')
+        ax.set_ylabel('Share of successful requests (%)')
+        ax.set_title('Decision Mix')
+        ax.legend(loc='upper right')
+
+        plt.tight_layout()
+        plt.subplots_adjust(top=0.93)
+        side_path = os.path.join(charts_dir, f'comparison_side_by_side.{image_format}')
+        plt.savefig(side_path, dpi=dpi, bbox_inches='tight')
+        plt.close()
+
+        # Deltas: difference from the baseline with its interval; one panel per metric so each keeps its units
+        metrics = list(self.metrics)
+        runs = names[1:]
+        fig, axes = plt.subplots(len(metrics), 1, figsize=(14, 1.1 * len(metrics) * max(1, len(runs) / 2) + 2),
+                                 squeeze=False)
+        fig.suptitle(f"EAI Benchmark Deltas vs Baseline {names[0]}", fontsize=14, fontweight='bold')
+        for ax, metric in zip(axes[:, 0], metrics):
+            rows = [row for row in self.rows if row['metric'] == metric]
+            y = np.arange(len(rows))[::-1]
+            for yi, row in zip(y, rows):
+                ax.errorbar(row['difference'], yi,
+                            xerr=[[row['difference'] - row['ci_low']], [row['ci_high'] - row['difference']]],
+                            fmt='o', color='crimson' if row['significant'] else 'gray', capsize=4)
+            ax.axvline(0, color='black', linewidth=1)
+            ax.set_yticks(y)
+            ax.set_yticklabels(runs)
+            ax.set_ylim(-0.6, len(rows) - 0.4)
+            ax.set_title(metric, fontsize=10, loc='left')
+            ax.grid(True, alpha=0.3, axis='x')
+        axes[-1, 0].set_xlabel(f"Difference from baseline ({self.confidence_level:.0%} bootstrap CI; "
+                               f"red = interval excludes 0)")
+        plt.tight_layout()
+        delta_path = os.path.join(charts_dir, f'comparison_deltas.{image_format}')
+        plt.savefig(delta_path, dpi=dpi, bbox_inches='tight')
+        plt.close()
+        return side_path, delta_path
+
+
+def compare_reports(paths, resamples=DEFAULT_RESAMPLES, confidence_level=DEFAULT_CONFIDENCE_LEVEL, seed=0):
+    """Load reports (baseline first) one at a time and compare them"""
+    return ReportComparison([RunSample.load(path) for path in paths], resamples, confidence_level, seed)
+
+
+def main():
+    """Compare two or more benchmark reports"""
+    parser = argparse.ArgumentParser(description='Compare benchmark reports with bootstrap confidence intervals')
+    parser.add_argument('reports', nargs='+', help='benchmark_report_*.json files; the first is the baseline')
+    parser.add_argument('--charts-dir', default='charts', help='Output directory for comparison charts')
+    parser.add_argument('--resamples', type=int, default=DEFAULT_RESAMPLES, help='Bootstrap resamples per run')
+    parser.add_argument('--confidence-level', type=float, default=DEFAULT_CONFIDENCE_LEVEL)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('-o', '--output', help='Also write the comparison as JSON')
+    args = parser.parse_args()
+    if len(args.reports) < 2:
+        parser.error('give at least two reports')
+
+    try:
+        comparison = compare_reports(args.reports, args.resamples, args.confidence_level, args.seed)
+        print(comparison.format_table())
+        for path in comparison.create_charts(args.charts_dir, dpi=args.dpi):
+            print(f"Created {path}")
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(comparison.to_dict(), f, indent=2)
+    except Exception as e:
+        print(f"Failed to compare reports: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
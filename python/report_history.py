@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+EAI Benchmark Report History
+Indexes every benchmark_report_*.json in a directory into SQLite and renders
+trend charts of the Summary metrics across runs and model versions
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+import numpy as np
+from report_loader import load_header
+from latency_sketch import LatencySketch
+
+HISTORY_DB_NAME = 'report_history.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    source_path TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    model TEXT NOT NULL,
+    total_requests INTEGER,
+    successful_requests INTEGER,
+    failed_requests INTEGER,
+    success_rate REAL,
+    average_response_time REAL,
+    min_response_time REAL,
+    max_response_time REAL,
+    average_confidence REAL,
+    decision_distribution TEXT,
+    latency_sketch TEXT
+);
+"""
+
+_RUN_COLUMNS = (
+    'source_path', 'timestamp', 'model', 'total_requests', 'successful_requests',
+    'failed_requests', 'success_rate', 'average_response_time', 'min_response_time',
+    'max_response_time', 'average_confidence', 'decision_distribution', 'latency_sketch',
+)
+
+
+def find_reports(report_dir):
+    """All benchmark_report_*.json files in report_dir, oldest name first"""
+    return sorted(os.path.join(report_dir, f) for f in os.listdir(report_dir)
+                  if f.startswith('benchmark_report_') and f.endswith('.json'))
+
+
+def parse_timestamp(value):
+    """Parse a .NET DateTime string (up to 7 fractional digits, optional offset) as naive UTC/local time"""
+    text = str(value).replace('Z', '+00:00')
+    if '.' in text:
+        head, _, rest = text.partition('.')
+        digits = len(rest) - len(rest.lstrip('0123456789'))
+        text = f"{head}.{rest[:min(digits, 6)]:0<6}{rest[digits:]}"
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class ReportHistory:
+    """SQLite index of benchmark report summaries, one row per report file"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Bring an index created by an earlier version up to the current schema"""
+        existing = {row[1]: row[5] for row in self.conn.execute('PRAGMA table_info(runs)')}
+        if 'latency_sketch' not in existing:
+            with self.conn:
+                self.conn.execute('ALTER TABLE runs ADD COLUMN latency_sketch TEXT')
+        if existing.get('source_path') != 1:
+            # Runs used to be keyed by (Timestamp, Model), so reports sharing both overwrote
+            # each other; rekey by file and re-ingest everything to recover the lost rows
+            with self.conn:
+                self.conn.execute('DROP TABLE runs')
+                self.conn.execute('DELETE FROM ingested_files')
+                self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _is_ingested(self, path, stat):
+        row = self.conn.execute('SELECT size, mtime_ns FROM ingested_files WHERE path = ?',
+                                (path,)).fetchone()
+        return row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns
+
+    def ingest_file(self, path):
+        """Index one report; returns False when it was already ingested unchanged"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if self._is_ingested(path, stat):
+            return False
+
+        header, latency = load_header(path)
+        summary = header['Results']['Summary']
+        # runs() parses every stored Timestamp, so reject one it could not read (ValueError)
+        parse_timestamp(header['Timestamp'])
+        with self.conn:
+            # A re-ingested file replaces its own earlier row
+            self.conn.execute('DELETE FROM runs WHERE source_path = ?', (path,))
+            self.conn.execute(
+                f"INSERT INTO runs ({', '.join(_RUN_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_RUN_COLUMNS))})",
+                (path, header['Timestamp'], header['Environment']['Model'],
+                 summary.get('TotalRequests'), summary.get('SuccessfulRequests'),
+                 summary.get('FailedRequests'), summary.get('SuccessRate'),
+                 summary.get('AverageResponseTime'), summary.get('MinResponseTime'),
+                 summary.get('MaxResponseTime'), summary.get('AverageConfidence'),
+                 json.dumps(summary.get('DecisionDistribution', {})), latency.dumps()))
+            self.conn.execute('INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?)',
+                              (path, stat.st_size, stat.st_mtime_ns))
+        return True
+
+    def ingest_directory(self, report_dir):
+        """Index new or modified reports in report_dir; returns the number ingested"""
+        ingested = 0
+        for path in find_reports(report_dir):
+            try:
+                if self.ingest_file(path):
+                    ingested += 1
+                    print(f"Indexed {os.path.basename(path)}")
+            except (ValueError, KeyError) as e:
+                print(f"Skipped {os.path.basename(path)}: {e}")
+        return ingested
+
+    def runs(self, model=None):
+        """Indexed runs ordered by timestamp, as dicts"""
+        query = 'SELECT * FROM runs'
+        params = ()
+        if model is not None:
+            query += ' WHERE model = ?'
+            params = (model,)
+        cursor = self.conn.execute(query, params)
+        names = [d[0] for d in cursor.description]
+        runs = []
+        for row in cursor:
+            run = dict(zip(names, row))
+            run['decision_distribution'] = json.loads(run['decision_distribution'] or '{}')
+            sketch = run['latency_sketch']
+            run['latency_sketch'] = LatencySketch.loads(sketch) if sketch else None
+            run['p95_response_time'] = (run['latency_sketch'].quantile(0.95)
+                                        if run['latency_sketch'] is not None and len(run['latency_sketch'])
+                                        else None)
+            run['time'] = parse_timestamp(run['timestamp'])
+            runs.append(run)
+        runs.sort(key=lambda r: r['time'])
+        return runs
+
+    def models(self):
+        return [row[0] for row in self.conn.execute('SELECT DISTINCT model FROM runs ORDER BY model')]
+
+    def create_trend_charts(self, charts_dir='charts', dpi=300, image_format='png'):
+        """Render Summary metric trends across all indexed runs, one line per model"""
+        # Imported here so indexing alone (watcher, batch renderer) does not load matplotlib
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        runs = self.runs()
+        if not runs:
+            raise ValueError("No indexed benchmark reports to chart")
+        os.makedirs(charts_dir, exist_ok=True)
+
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig.suptitle('EAI Benchmark History', fontsize=16, fontweight='bold', y=0.98)
+
+        metrics = [
+            (ax1, 'average_response_time', 1 / 1000, 'Response Time (seconds)', 'Average and p95 Response Time'),
+            (ax2, 'success_rate', 1, 'Success Rate (%)', 'Success Rate'),
+            (ax3, 'average_confidence', 1, 'Confidence Score', 'Average Confidence'),
+        ]
+        for model in self.models():
+            model_runs = [r for r in runs if r['model'] == model]
+            times = [r['time'] for r in model_runs]
+            for ax, key, scale, _, _ in metrics:
+                values = [r[key] * scale if r[key] is not None else np.nan for r in model_runs]
+                line, = ax.plot(times, values, marker='o', linewidth=2, label=model)
+                if key == 'average_response_time':
+                    p95 = [r['p95_response_time'] / 1000 if r['p95_response_time'] is not None else np.nan
+                           for r in model_runs]
+                    ax.plot(times, p95, marker='^', linestyle='--', linewidth=1.5,
+                            color=line.get_color(), label=f'{model} (p95)')
+
+        for ax, _, _, ylabel, title in metrics:
+            ax.set_ylabel(ylabel)
+            ax.set_title(f'{title} per Run', pad=15)
+            ax.grid(True, alpha=0.3)
+            ax.legend(fontsize=9)
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+            ax.tick_params(axis='x', rotation=30)
+
+        # Decision mix as stacked shares across all runs
+        decisions = sorted({d for r in runs for d in r['decision_distribution']})
+        times = [r['time'] for r in runs]
+        totals = np.array([sum(r['decision_distribution'].values()) or 1 for r in runs], dtype=float)
+        shares = [np.array([r['decision_distribution'].get(d, 0) for r in runs]) / totals * 100
+                  for d in decisions]
+        if decisions:
+            ax4.stackplot(times, shares, labels=[d.title() for d in decisions], alpha=0.8)
+            ax4.legend(loc='upper left', fontsize=9)
+        ax4.set_ylabel('Share of Decisions (%)')
+        ax4.set_ylim(0, 100)
+        ax4.set_title('Decision Distribution per Run', pad=15)
+        ax4.grid(True, alpha=0.3)
+        ax4.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        ax4.tick_params(axis='x', rotation=30)
+
+        fig.text(0.5, 0.01, f"{len(runs)} runs indexed across {len(self.models())} model(s)",
+                 ha='center', fontsize=10)
+
+        plt.tight_layout()
+        plt.subplots_adjust(top=0.93, bottom=0.08)
+        path = os.path.join(charts_dir, f'history_trends.{image_format}')
+        plt.savefig(path, dpi=dpi, bbox_inches='tight')
+        plt.close()
+        print("Created benchmark history trend charts")
+        return path
+
+
+def main():
+    """Index all reports in a directory and render history trend charts"""
+    parser = argparse.ArgumentParser(description='Index benchmark reports and chart Summary trends')
+    parser.add_argument('report_dir', nargs='?', default='..', help='Directory holding benchmark_report_*.json')
+    parser.add_argument('--charts-dir', default='charts', help='Output directory for charts and the index')
+    parser.add_argument('--db', help=f'SQLite index path (default: <charts-dir>/{HISTORY_DB_NAME})')
+    args = parser.parse_args()
+
+    try:
+        os.makedirs(args.charts_dir, exist_ok=True)
+        db_path = args.db or os.path.join(args.charts_dir, HISTORY_DB_NAME)
+        with ReportHistory(db_path) as history:
+            ingested = history.ingest_directory(args.report_dir)
+            print(f"Indexed {ingested} new report(s) into {db_path}")
+            history.create_trend_charts(args.charts_dir)
+    except Exception as e:
+        print(f"Failed to build report history: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
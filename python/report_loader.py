@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+EAI Benchmark Report Loader
+Streams LoadTestResults out of benchmark_report_*.json files into compact NumPy columns
+so chart generation memory stays proportional to the columns, not the JSON object graph
+"""
+
+import json
+import re
+import numpy as np
+from latency_sketch import LatencySketch
+
+# Bytes of JSON text read per I/O call while streaming
+CHUNK_SIZE = 1 << 20
+# Records buffered in Python lists before being packed into NumPy blocks
+ROWS_PER_BLOCK = 65536
+
+INT32_MAX = np.iinfo(np.int32).max
+
+_LOAD_TEST_KEY = re.compile(r'"LoadTestResults"\s*:\s*\[')
+_SEPARATORS = re.compile(r'[\s,]*')
+
+
+class ReportColumns:
+    """Columnar LoadTestResults shared by all chart methods"""
+
+    def __init__(self, response_time_ms, confidence, decision_code, success, decision_labels, latency=None,
+                 start_time=None, end_time=None, row_weight=1.0):
+        self.response_time_ms = np.asarray(response_time_ms, dtype=np.int32)
+        self.confidence = np.asarray(confidence, dtype=np.float32)
+        self.decision_code = np.asarray(decision_code, dtype=np.uint8)
+        self.success = np.asarray(success, dtype=bool)
+        self.decision_labels = list(decision_labels)
+        # Optional request start/end (Unix seconds, NaN where missing); None when the report has none
+        self.start_time = None if start_time is None else np.asarray(start_time, dtype=np.float64)
+        self.end_time = None if end_time is None else np.asarray(end_time, dtype=np.float64)
+        if latency is None:
+            latency = LatencySketch().add(self.response_time_ms[self.success])
+        # Quantile sketch of successful response times (ms), mergeable across reports
+        self.latency = latency
+        # Requests each row stands for: above 1 when the columns are a uniform sample of a larger
+        # run (see report_shards.py), so absolute counts and rates must be scaled by it
+        self.row_weight = float(row_weight)
+
+    def __len__(self):
+        return len(self.response_time_ms)
+
+    @classmethod
+    def from_records(cls, records):
+        """Build columns from an in-memory list of LoadTestResults dicts"""
+        builder = ColumnBuilder()
+        for record in records:
+            builder.append(record)
+        return builder.finish()
+
+    @property
+    def response_time_s(self):
+        """Response times in seconds"""
+        return self.response_time_ms / 1000.0
+
+    @property
+    def sampled(self):
+        """True when the rows are a sample and counts need scaling by row_weight"""
+        return self.row_weight != 1.0
+
+    @property
+    def has_timestamps(self):
+        """True when LoadTestResults carried StartTime/EndTime"""
+        return self.start_time is not None and self.end_time is not None
+
+    @property
+    def confident(self):
+        """Mask of requests that reported a positive confidence score"""
+        return self.confidence > 0
+
+    def decisions(self):
+        """Decision labels per request (materialised on demand)"""
+        return np.asarray(self.decision_labels, dtype=object)[self.decision_code]
+
+    def decision_counts(self):
+        """Number of requests per decision label, in first-seen order"""
+        counts = np.bincount(self.decision_code, minlength=len(self.decision_labels))
+        return {label: int(count) for label, count in zip(self.decision_labels, counts)}
+
+    def nbytes(self):
+        """Memory held by the column arrays"""
+        timestamps = self.start_time.nbytes + self.end_time.nbytes if self.has_timestamps else 0
+        return (self.response_time_ms.nbytes + self.confidence.nbytes +
+                self.decision_code.nbytes + self.success.nbytes + timestamps)
+
+
+def _epoch_seconds(values):
+    """StartTime/EndTime values (Unix epoch milliseconds) as float64 seconds, NaN where missing"""
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64) / 1000
+
+
+class ColumnBuilder:
+    """Accumulates LoadTestResults records into fixed-size NumPy blocks"""
+
+    def __init__(self, rows_per_block=ROWS_PER_BLOCK):
+        self.rows_per_block = rows_per_block
+        self.decision_codes = {}
+        self.decision_labels = []
+        self.latency = LatencySketch()
+        self._blocks = []
+        self._timestamp_blocks = []
+        self._reset_pending()
+
+    def _reset_pending(self):
+        self._times = []
+        self._confidences = []
+        self._codes = []
+        self._success = []
+        self._starts = []
+        self._ends = []
+        self._pending_timestamps = False
+
+    def _code_for(self, decision):
+        code = self.decision_codes.get(decision)
+        if code is None:
+            code = len(self.decision_labels)
+            if code > np.iinfo(np.uint8).max:
+                raise ValueError("Too many distinct decision labels for uint8 decision codes")
+            self.decision_codes[decision] = code
+            self.decision_labels.append(decision)
+        return code
+
+    def append(self, record):
+        """Add one LoadTestResults entry"""
+        self._times.append(record.get('ResponseTime', 0))
+        self._confidences.append(record.get('Confidence', 0.0))
+        self._codes.append(self._code_for(record.get('Decision', '')))
+        self._success.append(bool(record.get('Success', False)))
+        start, end = record.get('StartTime'), record.get('EndTime')
+        self._starts.append(start)
+        self._ends.append(end)
+        if start is not None or end is not None:
+            self._pending_timestamps = True
+        if len(self._times) >= self.rows_per_block:
+            self._flush()
+
+    def _flush(self):
+        if not self._times:
+            return
+        times = np.clip(np.array(self._times, dtype=np.int64), 0, INT32_MAX).astype(np.int32)
+        success = np.array(self._success, dtype=bool)
+        self.latency.add(times[success])
+        self._blocks.append((
+            times,
+            np.array(self._confidences, dtype=np.float32),
+            np.array(self._codes, dtype=np.uint8),
+            success,
+        ))
+        # Timestamp blocks are only materialised when the block has any
+        self._timestamp_blocks.append((_epoch_seconds(self._starts), _epoch_seconds(self._ends))
+                                      if self._pending_timestamps else len(times))
+        self._reset_pending()
+
+    def finish(self):
+        """Concatenate all blocks into a ReportColumns instance"""
+        self._flush()
+        if self._blocks:
+            times, confidences, codes, success = (np.concatenate(parts) for parts in zip(*self._blocks))
+        else:
+            times = np.empty(0, dtype=np.int32)
+            confidences = np.empty(0, dtype=np.float32)
+            codes = np.empty(0, dtype=np.uint8)
+            success = np.empty(0, dtype=bool)
+        start_time = end_time = None
+        if any(isinstance(block, tuple) for block in self._timestamp_blocks):
+            filled = [block if isinstance(block, tuple) else (np.full(block, np.nan), np.full(block, np.nan))
+                      for block in self._timestamp_blocks]
+            start_time, end_time = (np.concatenate(parts) for parts in zip(*filled))
+        self._blocks = []
+        self._timestamp_blocks = []
+        return ReportColumns(times, confidences, codes, success, self.decision_labels, self.latency,
+                             start_time, end_time)
+
+
+class SketchBuilder(ColumnBuilder):
+    """Builder that keeps only the latency sketch, dropping the columns themselves"""
+
+    def _flush(self):
+        if self._times:
+            times = np.clip(np.array(self._times, dtype=np.int64), 0, INT32_MAX)
+            self.latency.add(times[np.array(self._success, dtype=bool)])
+        self._reset_pending()
+
+    def finish(self):
+        self._flush()
+        return self.latency
+
+
+def _find_load_test_key(buffer, start=0):
+    """Locate the LoadTestResults array opener, ignoring escaped occurrences inside strings"""
+    match = _LOAD_TEST_KEY.search(buffer, start)
+    while match is not None:
+        backslashes = 0
+        i = match.start() - 1
+        while i >= 0 and buffer[i] == '\\':
+            backslashes += 1
+            i -= 1
+        if backslashes % 2 == 0:
+            return match
+        match = _LOAD_TEST_KEY.search(buffer, match.start() + 1)
+    return None
+
+
+def load_header(path, chunk_size=CHUNK_SIZE):
+    """
+    Parse everything but LoadTestResults, streaming past the array without keeping it.
+
+    Returns (header, latency) where latency is the LatencySketch of the array.
+    """
+    return load_report(path, chunk_size, builder=SketchBuilder())
+
+
+def load_report(path, chunk_size=CHUNK_SIZE, rows_per_block=ROWS_PER_BLOCK, builder=None):
+    """
+    Stream a benchmark report from disk.
+
+    Returns (header, columns): header is the parsed report with an empty
+    Results.LoadTestResults list, columns is a ReportColumns instance.
+    """
+    decoder = json.JSONDecoder()
+    if builder is None:
+        builder = ColumnBuilder(rows_per_block)
+    head_parts = []
+
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        # Phase 1: copy header text until the LoadTestResults array opens
+        buffer = ''
+        eof = False
+        match = None
+        while match is None:
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            match = _find_load_test_key(buffer)
+            if match is None:
+                if eof:
+                    break
+                # Keep a tail in case the key straddles two chunks
+                keep = 256
+                if len(buffer) > keep:
+                    head_parts.append(buffer[:-keep])
+                    buffer = buffer[-keep:]
+
+        if match is None:
+            # No array in the document: parse it whole (tiny or non-standard report)
+            header = json.loads(''.join(head_parts) + buffer)
+            results = header.get('Results', {})
+            for record in results.get('LoadTestResults', []) or []:
+                builder.append(record)
+            results['LoadTestResults'] = []
+            return header, builder.finish()
+
+        head_parts.append(buffer[:match.end()])
+        buffer = buffer[match.end():]
+        pos = 0
+
+        # Phase 2: decode one array element at a time
+        while True:
+            pos = _SEPARATORS.match(buffer, pos).end()
+            if pos >= len(buffer):
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise ValueError(f"Unexpected end of file inside LoadTestResults in {path}")
+                buffer = chunk
+                pos = 0
+                continue
+            if buffer[pos] == ']':
+                break
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            builder.append(record)
+            pos = end
+
+        # Phase 3: the remainder of the document is header text again
+        head_parts.append(buffer[pos:])
+        head_parts.append(f.read())
+
+    header = json.loads(''.join(head_parts))
+    return header, builder.finish()
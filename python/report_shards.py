@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+EAI Sharded Report Aggregation
+Map-reduce of per-node benchmark_report_*.json shards over a process pool into one dataset
+(Summary, decision distribution, merged latency sketch, confidence statistics and columns)
+that EAIChartGenerator charts like a single report
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from latency_sketch import LatencySketch
+from report_loader import ReportColumns
+from report_sidecar import open_report
+from report_writer import SummaryAccumulator, generate_recommendations
+
+# Rows kept in the merged columns; larger runs keep a uniform sample of this size
+DEFAULT_MAX_ROWS = 20_000_000
+
+
+def expand_shards(patterns):
+    """Sorted, de-duplicated report paths matching any of the glob patterns"""
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern)
+        if not matches and os.path.exists(pattern):
+            matches = [pattern]
+        paths.update(path for path in matches if path.endswith('.json'))
+    if not paths:
+        raise FileNotFoundError(f"No reports match {', '.join(patterns)}")
+    return sorted(paths)
+
+
+class ConfidenceStats:
+    """Mergeable count / mean / variance / range of positive confidence scores"""
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return self
+        self.count += len(values)
+        self.sum += float(values.sum())
+        self.sum_squares += float(np.square(values).sum())
+        low, high = float(values.min()), float(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        return self
+
+    def merge(self, other):
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_squares += other.sum_squares
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def std(self):
+        if not self.count:
+            return 0.0
+        return float(np.sqrt(max(self.sum_squares / self.count - self.mean ** 2, 0.0)))
+
+
+class ShardPartial:
+    """What one shard contributes: header, exact statistics and (possibly sampled) columns"""
+
+    def __init__(self, index, path, header, columns, max_rows, seed):
+        self.index = index
+        self.path = path
+        self.header = header
+        self.rows = len(columns)
+        results = header['Results']
+
+        self.summary = SummaryAccumulator()
+        self.summary.add_columns(columns)
+        # The C# Summary also counts the single request and the per-type requests
+        for extra in [results['SingleRequest']] + list(results.get('RequestTypeResults', {}).values()):
+            self.summary.add(extra)
+        self.load_successful = int(np.count_nonzero(columns.success))
+        self.latency = columns.latency
+        self.confidence = ConfidenceStats().add(columns.confidence[columns.success & columns.confident])
+
+        # Bottom-k sampling: every row gets a random key and the max_rows smallest keys over
+        # all shards are a uniform sample, so no shard needs to send more than its own max_rows
+        keys = np.random.default_rng([seed, index]).random(self.rows)
+        keep = np.arange(self.rows)
+        if self.rows > max_rows:
+            keep = np.sort(np.argpartition(keys, max_rows)[:max_rows])
+        self.keys = keys[keep]
+        self.row = keep
+        self.decision_labels = columns.decision_labels
+        self.response_time_ms = columns.response_time_ms[keep]
+        self.confidence_column = columns.confidence[keep]
+        self.decision_code = columns.decision_code[keep]
+        self.success = columns.success[keep]
+        self.start_time = columns.start_time[keep] if columns.has_timestamps else None
+        self.end_time = columns.end_time[keep] if columns.has_timestamps else None
+
+
+def _map_shard(index, path, max_rows, seed, use_sidecar=True):
+    """Process pool task: load one shard and reduce it to a ShardPartial"""
+    header, columns = open_report(path, use_sidecar=use_sidecar)
+    return ShardPartial(index, path, header, columns, max_rows, seed)
+
+
+class MergedReport:
+    """
+    Several shards reduced into one dataset.
+
+    Partials are folded in with add() as workers finish, keeping at most max_rows
+    rows at any time; finish() fills header (a single report's Timestamp, Environment,
+    Results with a recomputed Summary, Recommendations, plus the Shards list) and
+    columns, a ReportColumns whose latency sketch covers every row even when the
+    columns themselves are a sample; a sample carries row_weight = total rows / kept
+    rows so timelines and histograms are scaled back to the whole run.
+
+    Unlike a single report, the merged Results hold every shard's extra requests:
+    HealthCheck and SingleRequest are lists with one entry per shard (in Shards
+    order) and RequestTypeResults maps each request type to the list of shard
+    results for it, so together with the load results they add up to TotalRequests.
+    """
+
+    COLUMNS = ('shard', 'row', 'keys', 'response_time_ms', 'confidence', 'decision_code', 'success',
+               'start_time', 'end_time')
+
+    def __init__(self, max_rows=DEFAULT_MAX_ROWS, seed=0):
+        self.max_rows = max_rows
+        self.seed = seed
+        self.total_rows = 0
+        self.load_successful = 0
+        self.summary = SummaryAccumulator()
+        self.latency = LatencySketch()
+        self.confidence = ConfidenceStats()
+        self.decision_labels = []
+        self._codes = {}
+        self._headers = {}
+        self._timestamps = False
+        self._parts = {name: [] for name in self.COLUMNS}
+        self._pending = 0
+        self.header = None
+        self.columns = None
+
+    def add(self, partial):
+        self._headers[partial.index] = (partial.path, partial.header)
+        self.total_rows += partial.rows
+        self.load_successful += partial.load_successful
+        self.summary.merge(partial.summary)
+        self.latency.merge(partial.latency)
+        self.confidence.merge(partial.confidence)
+
+        # Shard-local decision codes -> codes into the union label table
+        for label in partial.decision_labels:
+            if label not in self._codes:
+                self._codes[label] = len(self.decision_labels)
+                self.decision_labels.append(label)
+        if len(self.decision_labels) > np.iinfo(np.uint8).max + 1:
+            raise ValueError("Too many distinct decision labels across shards for uint8 decision codes")
+        remap = np.array([self._codes[label] for label in partial.decision_labels] or [0], dtype=np.uint8)
+
+        rows = len(partial.keys)
+        missing = np.full(rows, np.nan)
+        self._timestamps |= partial.start_time is not None
+        values = {
+            'shard': np.full(rows, partial.index, dtype=np.int32),
+            'row': partial.row,
+            'keys': partial.keys,
+            'response_time_ms': partial.response_time_ms,
+            'confidence': partial.confidence_column,
+            'decision_code': remap[partial.decision_code],
+            'success': partial.success,
+            'start_time': missing if partial.start_time is None else partial.start_time,
+            'end_time': missing if partial.end_time is None else partial.end_time,
+        }
+        for name in self.COLUMNS:
+            self._parts[name].append(values[name])
+        self._pending += rows
+        if self._pending > 2 * self.max_rows:
+            self._compact()
+        return self
+
+    def _compact(self):
+        """Concatenate the collected parts, keeping the max_rows smallest keys"""
+        merged = {name: np.concatenate(parts) for name, parts in self._parts.items()}
+        if len(merged['keys']) > self.max_rows:
+            keep = np.argpartition(merged['keys'], self.max_rows)[:self.max_rows]
+            merged = {name: values[keep] for name, values in merged.items()}
+        self._parts = {name: [values] for name, values in merged.items()}
+        self._pending = len(merged['keys'])
+        return merged
+
+    def finish(self):
+        if not self._headers:
+            raise ValueError("No shards to merge")
+        merged = self._compact()
+        # Shard order, then original row order within each shard
+        order = np.lexsort((merged['row'], merged['shard']))
+        merged = {name: values[order] for name, values in merged.items()}
+        self.paths = [path for _, (path, _) in sorted(self._headers.items())]
+        self.columns = ReportColumns(
+            merged['response_time_ms'], merged['confidence'], merged['decision_code'], merged['success'],
+            self.decision_labels, latency=self.latency,
+            start_time=merged['start_time'] if self._timestamps else None,
+            end_time=merged['end_time'] if self._timestamps else None,
+            row_weight=self.total_rows / len(merged['keys']) if len(merged['keys']) else 1.0)
+        self.sampled = self.columns.sampled
+        self.header = self._merge_header([header for _, (_, header) in sorted(self._headers.items())])
+        self._parts = None
+        return self
+
+    def _merge_header(self, headers):
+        first = headers[0]
+        environment = dict(first['Environment'])
+        for key in environment:
+            values = sorted({str(header['Environment'].get(key)) for header in headers})
+            if len(values) > 1:
+                environment[key] = ', '.join(values)
+        request_types = {}
+        for header in headers:
+            for name, result in header['Results'].get('RequestTypeResults', {}).items():
+                request_types.setdefault(name, []).append(result)
+        summary = self.summary.summary()
+        return {
+            'Timestamp': min(header['Timestamp'] for header in headers),
+            'Environment': environment,
+            'Results': {
+                'HealthCheck': [header['Results']['HealthCheck'] for header in headers],
+                'SingleRequest': [header['Results']['SingleRequest'] for header in headers],
+                'LoadTestResults': [],
+                'RequestTypeResults': request_types,
+                'Summary': summary,
+            },
+            'Recommendations': generate_recommendations(summary, self.total_rows, self.load_successful),
+            'Shards': self.paths,
+        }
+
+    def digest(self, file_digest):
+        """Cache key of the merged dataset from each shard's content digest"""
+        payload = json.dumps([self.max_rows, self.seed] +
+                             [[os.path.abspath(path), file_digest(path)] for path in self.paths])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def merge_reports(paths, workers=None, max_rows=DEFAULT_MAX_ROWS, seed=0, use_sidecar=True):
+    """Reduce shard reports in a process pool (map) and fold the partials as they finish (reduce)"""
+    paths = list(paths)
+    merged = MergedReport(max_rows, seed)
+    if workers is None:
+        workers = min(len(paths), os.cpu_count() or 1)
+    if workers <= 1 or len(paths) == 1:
+        for index, path in enumerate(paths):
+            merged.add(_map_shard(index, path, max_rows, seed, use_sidecar))
+        return merged.finish()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_map_shard, index, path, max_rows, seed, use_sidecar) for index, path in enumerate(paths)}
+        for future in as_completed(pending):
+            merged.add(future.result())
+            # Let each partial be freed once folded in
+            pending.discard(future)
+    return merged.finish()
+
+
+def main():
+    """Merge shard reports and print the combined Summary"""
+    parser = argparse.ArgumentParser(description='Merge per-node benchmark report shards')
+    parser.add_argument('shards', nargs='+', help='Shard reports or glob patterns (quote globs)')
+    parser.add_argument('--workers', type=int, help='Process pool size (default: one per shard, up to CPU count)')
+    parser.add_argument('--max-rows', type=int, default=DEFAULT_MAX_ROWS, help='Rows kept in the merged columns')
+    parser.add_argument('-o', '--output', help='Write the merged header (Summary, Recommendations, ...) as JSON')
+    args = parser.parse_args()
+
+    try:
+        merged = merge_reports(expand_shards(args.shards), args.workers, args.max_rows)
+    except Exception as e:
+        print(f"Failed to merge shards: {e}")
+        return 1
+
+    summary = merged.header['Results']['Summary']
+    print(f"Merged {len(merged.paths)} shard(s): {merged.total_rows:,} load test results"
+          f"{f' ({len(merged.columns):,} kept as columns)' if merged.sampled else ''}")
+    print(f"Total Requests: {summary['TotalRequests']:,}  Success Rate: {summary['SuccessRate']:.2f}%")
+    print(f"Avg Response Time: {summary['AverageResponseTime']/1000:.2f}s  "
+          f"p95: {merged.latency.quantile(0.95)/1000:.2f}s  p99: {merged.latency.quantile(0.99)/1000:.2f}s")
+    print(f"Avg Confidence: {summary['AverageConfidence']:.3f} (std {merged.confidence.std:.3f})")
+    print(f"Decisions: {summary['DecisionDistribution']}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(dict(merged.header, LatencySketch=merged.latency.to_dict()), f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
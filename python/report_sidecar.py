@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+EAI Benchmark Report Sidecar
+Compact columnar binary copy of a benchmark_report_*.json that opens with np.memmap
+
+Layout (little-endian):
+    magic       8 bytes   b'EAICOL01'
+    header_len  uint64    length of the JSON header that follows
+    header      JSON      report header (Environment, Summary, ...), decision labels,
+                          latency sketch, source file signature and column table
+    padding     to a 64-byte boundary; column offsets are relative to this point
+    columns     response_time_ms int32, confidence float32, success bool,
+                decision_code uint8, reasoning_id uint32, error_id uint32, and
+                start_time/end_time float64 when the report has request timestamps
+    strings     string_offsets uint64[k + 1] and a UTF-8 blob of the k unique
+                Reasoning/Error strings
+"""
+
+import argparse
+import json
+import os
+import struct
+import numpy as np
+from latency_sketch import LatencySketch
+from report_loader import ColumnBuilder, ReportColumns, load_report
+
+SIDECAR_MAGIC = b'EAICOL01'
+SIDECAR_SUFFIX = '.eaicol'
+SIDECAR_VERSION = 2
+ALIGNMENT = 64
+
+_PREFIX = struct.Struct('<8sQ')
+
+
+def sidecar_path(report_path):
+    """benchmark_report_X.json -> benchmark_report_X.eaicol"""
+    return os.path.splitext(report_path)[0] + SIDECAR_SUFFIX
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _source_signature(report_path):
+    stat = os.stat(report_path)
+    return {'name': os.path.basename(report_path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+class SidecarBuilder(ColumnBuilder):
+    """ColumnBuilder that also keeps Reasoning/Error as ids into a deduplicated string table"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.string_ids = {'': 0}
+        self.strings = ['']
+        self._reasoning_blocks = []
+        self._error_blocks = []
+
+    def _reset_pending(self):
+        super()._reset_pending()
+        self._reasoning = []
+        self._errors = []
+
+    def _string_id(self, value):
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.string_ids[value] = string_id
+            self.strings.append(value)
+        return string_id
+
+    def append(self, record):
+        self._reasoning.append(self._string_id(record.get('Reasoning') or ''))
+        self._errors.append(self._string_id(record.get('Error') or ''))
+        super().append(record)
+
+    def _flush(self):
+        if self._times:
+            self._reasoning_blocks.append(np.array(self._reasoning, dtype=np.uint32))
+            self._error_blocks.append(np.array(self._errors, dtype=np.uint32))
+        super()._flush()
+
+    def string_columns(self):
+        def concat(blocks):
+            return np.concatenate(blocks) if blocks else np.empty(0, dtype=np.uint32)
+        return concat(self._reasoning_blocks), concat(self._error_blocks)
+
+
+def convert_report(report_path, output_path=None):
+    """Write the sidecar for a JSON report; returns its path"""
+    output_path = output_path or sidecar_path(report_path)
+    builder = SidecarBuilder()
+    header, columns = load_report(report_path, builder=builder)
+    reasoning_ids, error_ids = builder.string_columns()
+
+    encoded = [s.encode('utf-8') for s in builder.strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    string_offsets[1:] = np.cumsum([len(b) for b in encoded])
+    string_blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    arrays = [
+        ('response_time_ms', columns.response_time_ms),
+        ('confidence', columns.confidence),
+        ('success', columns.success),
+        ('decision_code', columns.decision_code),
+        ('reasoning_id', reasoning_ids),
+        ('error_id', error_ids),
+        ('string_offsets', string_offsets),
+        ('string_blob', string_blob),
+    ]
+    if columns.has_timestamps:
+        arrays += [('start_time', columns.start_time), ('end_time', columns.end_time)]
+    column_table = {}
+    offset = 0
+    for name, array in arrays:
+        column_table[name] = {'dtype': array.dtype.str, 'offset': offset, 'length': int(len(array))}
+        offset = _align(offset + array.nbytes)
+
+    meta = {
+        'version': SIDECAR_VERSION,
+        'rows': len(columns),
+        'source': _source_signature(report_path),
+        'report': header,
+        'decision_labels': columns.decision_labels,
+        'latency': columns.latency.to_dict(),
+        'columns': column_table,
+    }
+    header_bytes = json.dumps(meta).encode('utf-8')
+    data_start = _align(_PREFIX.size + len(header_bytes))
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREFIX.pack(SIDECAR_MAGIC, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays:
+            f.seek(data_start + column_table[name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+class SidecarReport:
+    """Memory-mapped view of a sidecar: header dict, ReportColumns and the string table"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, header_len = _PREFIX.unpack(f.read(_PREFIX.size))
+            if magic != SIDECAR_MAGIC:
+                raise ValueError(f"{path} is not an EAI report sidecar")
+            self.meta = json.loads(f.read(header_len).decode('utf-8'))
+        if self.meta.get('version') != SIDECAR_VERSION:
+            raise ValueError(f"Unsupported sidecar version in {path}")
+        self._data_start = _align(_PREFIX.size + header_len)
+
+        self.header = self.meta['report']
+        self.columns = ReportColumns(
+            self._map('response_time_ms'), self._map('confidence'), self._map('decision_code'),
+            self._map('success'), self.meta['decision_labels'],
+            latency=LatencySketch.from_dict(self.meta['latency']),
+            start_time=self._map('start_time'), end_time=self._map('end_time'))
+        self._string_offsets = self._map('string_offsets')
+        self._string_blob = self._map('string_blob')
+        self.reasoning_id = self._map('reasoning_id')
+        self.error_id = self._map('error_id')
+
+    def _map(self, name):
+        spec = self.meta['columns'].get(name)
+        if spec is None:
+            return None
+        if not spec['length']:
+            return np.empty(0, dtype=np.dtype(spec['dtype']))
+        return np.memmap(self.path, dtype=np.dtype(spec['dtype']), mode='r',
+                         offset=self._data_start + spec['offset'], shape=(spec['length'],))
+
+    def string(self, string_id):
+        start, end = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+        return bytes(self._string_blob[start:end]).decode('utf-8')
+
+    def reasoning(self, row):
+        return self.string(self.reasoning_id[row])
+
+    def error(self, row):
+        return self.string(self.error_id[row])
+
+    def matches(self, report_path):
+        """True when the sidecar was built from report_path as it is now"""
+        source = self.meta['source']
+        stat = os.stat(report_path)
+        return source['size'] == stat.st_size and source['mtime_ns'] == stat.st_mtime_ns
+
+
+def open_report(report_path, use_sidecar=True):
+    """
+    Load a report as (header, columns), memory-mapping its sidecar when one exists
+    and is up to date, and streaming the JSON otherwise.
+    """
+    path = sidecar_path(report_path)
+    if use_sidecar and os.path.exists(path):
+        try:
+            sidecar = SidecarReport(path)
+            if not os.path.exists(report_path) or sidecar.matches(report_path):
+                return sidecar.header, sidecar.columns
+            print(f"Ignoring stale sidecar {path}")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable sidecar {path}: {e}")
+    return load_report(report_path)
+
+
+def main():
+    """Convert benchmark reports to memory-mappable sidecars"""
+    parser = argparse.ArgumentParser(description='Write .eaicol sidecars for benchmark reports')
+    parser.add_argument('reports', nargs='+', help='benchmark_report_*.json files')
+    args = parser.parse_args()
+
+    for report_path in args.reports:
+        path = convert_report(report_path)
+        print(f"Wrote {path} ({os.path.getsize(path) / 1e6:.1f} MB from "
+              f"{os.path.getsize(report_path) / 1e6:.1f} MB JSON)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+EAI Benchmark Report Writer
+Streams results to disk in the benchmark_report_*.json schema written by src/EAI.Testing
+(BenchmarkResult / TestResult / BenchmarkSummary), so EAIChartGenerator can read them directly
+"""
+
+import json
+from datetime import datetime
+import numpy as np
+
+DEFAULT_ENVIRONMENT = {
+    'BaseUrl': 'https://localhost:58080',
+    'LLMProvider': 'LM Studio',
+    'Model': 'qwen2.5-7b-instruct-1m',
+    'Database': 'In-Memory',
+}
+
+
+def test_result(success=True, response_time=0, decision='', confidence=0.0, reasoning='', error='',
+                start_time=None, end_time=None):
+    """
+    A TestResult dict with the same fields and defaults as the C# class.
+
+    start_time/end_time (Unix epoch milliseconds) add the optional StartTime/EndTime
+    fields used by the timeline chart.
+    """
+    result = {
+        'Success': success,
+        'ResponseTime': int(response_time),
+        'Decision': decision,
+        'Confidence': confidence,
+        'Reasoning': reasoning,
+        'Error': error,
+    }
+    if start_time is not None:
+        result['StartTime'] = round(float(start_time), 3)
+    if end_time is not None:
+        result['EndTime'] = round(float(end_time), 3)
+    return result
+
+
+class SummaryAccumulator:
+    """Incremental version of APITester.CalculateSummary"""
+
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+        self.response_time_sum = 0
+        self.min_response_time = None
+        self.max_response_time = None
+        self.confidence_sum = 0.0
+        self.confidence_count = 0
+        self.decisions = {}
+
+    def add(self, result):
+        self.total += 1
+        if not result['Success']:
+            return
+        self.successful += 1
+        response_time = result['ResponseTime']
+        self.response_time_sum += response_time
+        if self.min_response_time is None or response_time < self.min_response_time:
+            self.min_response_time = response_time
+        if self.max_response_time is None or response_time > self.max_response_time:
+            self.max_response_time = response_time
+        if result['Confidence'] > 0:
+            self.confidence_sum += result['Confidence']
+            self.confidence_count += 1
+        decision = result['Decision']
+        self.decisions[decision] = self.decisions.get(decision, 0) + 1
+
+    def add_columns(self, columns):
+        """Add every row of a ReportColumns at once"""
+        success = columns.success
+        self.total += len(columns)
+        successful = int(np.count_nonzero(success))
+        if not successful:
+            return
+        self.successful += successful
+        response_times = columns.response_time_ms[success]
+        self.response_time_sum += int(response_times.sum(dtype=np.int64))
+        low, high = int(response_times.min()), int(response_times.max())
+        self.min_response_time = low if self.min_response_time is None else min(self.min_response_time, low)
+        self.max_response_time = high if self.max_response_time is None else max(self.max_response_time, high)
+        confidences = columns.confidence[success]
+        confidences = confidences[confidences > 0]
+        self.confidence_sum += float(confidences.sum(dtype=np.float64))
+        self.confidence_count += len(confidences)
+        counts = np.bincount(columns.decision_code[success], minlength=len(columns.decision_labels))
+        for label, count in zip(columns.decision_labels, counts.tolist()):
+            if count:
+                self.decisions[label] = self.decisions.get(label, 0) + count
+
+    def merge(self, other):
+        """Fold another accumulator (e.g. from another shard) into this one"""
+        self.total += other.total
+        self.successful += other.successful
+        self.response_time_sum += other.response_time_sum
+        for name, pick in (('min_response_time', min), ('max_response_time', max)):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs if mine is None else mine if theirs is None else pick(mine, theirs))
+        self.confidence_sum += other.confidence_sum
+        self.confidence_count += other.confidence_count
+        for decision, count in other.decisions.items():
+            self.decisions[decision] = self.decisions.get(decision, 0) + count
+
+    def summary(self):
+        successful = self.successful
+        return {
+            'TotalRequests': self.total,
+            'SuccessfulRequests': successful,
+            'FailedRequests': self.total - successful,
+            'SuccessRate': successful / self.total * 100 if self.total else 0,
+            'AverageResponseTime': self.response_time_sum / successful if successful else 0,
+            'MinResponseTime': self.min_response_time or 0,
+            'MaxResponseTime': self.max_response_time or 0,
+            'AverageConfidence': self.confidence_sum / self.confidence_count if self.confidence_count else 0,
+            'DecisionDistribution': self.decisions,
+        }
+
+
+def generate_recommendations(summary, load_test_total, load_test_successful):
+    """Same thresholds as Program.GenerateRecommendations"""
+    recommendations = []
+    if summary['SuccessRate'] < 95:
+        recommendations.append("⚠️ Success rate below 95% - investigate failed requests")
+    if summary['AverageResponseTime'] > 2000:
+        recommendations.append("🐌 Average response time > 2s - consider performance optimization")
+    if summary['MaxResponseTime'] > 5000:
+        recommendations.append("🚨 Max response time > 5s - investigate slow requests")
+    if summary['AverageConfidence'] < 0.7:
+        recommendations.append("🤔 Low average confidence - review LLM prompts and policies")
+    if load_test_total > 0 and load_test_successful / load_test_total * 100 < 90:
+        recommendations.append("⚡ Load test success rate < 90% - consider scaling improvements")
+    if not recommendations:
+        recommendations.append("✅ All metrics look good! System is performing well.")
+    return recommendations
+
+
+class ReportWriter:
+    """
+    Writes a benchmark report incrementally.
+
+    The header (Timestamp, Environment, HealthCheck, SingleRequest) is written on
+    open, LoadTestResults are appended one per line with add(), and
+    RequestTypeResults, Summary and Recommendations are written by close().
+    """
+
+    def __init__(self, path, environment=None, timestamp=None, health_check=None, single_request=None):
+        self.path = path
+        self.timestamp = timestamp or datetime.now().isoformat()
+        self.environment = dict(DEFAULT_ENVIRONMENT if environment is None else environment)
+        self.health_check = health_check or test_result(success=False)
+        self.single_request = single_request
+        self._summary = SummaryAccumulator()
+        self._load_total = 0
+        self._load_successful = 0
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('{\n')
+        self._file.write(f'  "Timestamp": {json.dumps(self.timestamp)},\n')
+        self._file.write(f'  "Environment": {json.dumps(self.environment)},\n')
+        self._file.write('  "Results": {\n')
+        self._file.write(f'    "HealthCheck": {json.dumps(self.health_check)},\n')
+        self._file.write(f'    "SingleRequest": {json.dumps(single_request or test_result(success=False))},\n')
+        self._file.write('    "LoadTestResults": [')
+
+    def add(self, result):
+        """Append one LoadTestResults entry (a test_result dict, plus any optional fields)"""
+        self._file.write(',\n      ' if self._load_total else '\n      ')
+        self._file.write(json.dumps(result, ensure_ascii=False))
+        self._load_total += 1
+        if result['Success']:
+            self._load_successful += 1
+        self._summary.add(result)
+
+    def add_many(self, results):
+        for result in results:
+            self.add(result)
+
+    def close(self, request_type_results=None):
+        """Finish the document; returns the computed Summary"""
+        request_type_results = request_type_results or {}
+        # The C# summary covers the single request, per-type requests and the load test
+        extras = list(request_type_results.values())
+        if self.single_request is not None:
+            extras.insert(0, self.single_request)
+        for extra in extras:
+            self._summary.add(extra)
+        summary = self._summary.summary()
+        recommendations = generate_recommendations(summary, self._load_total, self._load_successful)
+
+        self._file.write('\n    ],\n' if self._load_total else '],\n')
+        self._file.write(f'    "RequestTypeResults": {json.dumps(request_type_results)},\n')
+        self._file.write(f'    "Summary": {json.dumps(summary)}\n')
+        self._file.write('  },\n')
+        self._file.write(f'  "Recommendations": {json.dumps(recommendations, ensure_ascii=False)}\n')
+        self._file.write('}\n')
+        self._file.close()
+        return summary
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self._file.closed:
+            if exc_type is None:
+                self.close()
+            else:
+                self._file.close()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+EAI Synthetic Benchmark Reports
+Generates benchmark_report_*.json files of arbitrary size with realistic distributions,
+following the BenchmarkResult / TestResult schema written by src/EAI.Testing/APITester.cs
+"""
+
+import argparse
+import os
+import numpy as np
+from report_writer import ReportWriter, test_result
+
+GENERATION_CHUNK = 100_000
+# Requests per second of the synthetic arrival process
+DEFAULT_ARRIVAL_RATE = 50.0
+# 2025-01-01T00:00:00Z, the synthetic report Timestamp, in Unix epoch milliseconds
+START_EPOCH_MS = 1735689600000.0
+DECISIONS = ('escalate', 'approve', 'deny')
+DECISION_WEIGHTS = (0.6, 0.3, 0.1)
+REASONINGS = (
+    "Amount exceeds department threshold; escalating for manager review",
+    "Request complies with policy limits and has sufficient justification",
+    "Insufficient documentation for the requested amount",
+    "Leave days within annual allowance",
+)
+
+
+def _results_chunk(rng, size, failure_rate, median_ms, starts=None):
+    """
+    Yield `size` TestResult dicts drawn from the synthetic distributions.
+
+    starts (Unix epoch ms per result) adds StartTime/EndTime fields.
+    """
+    response_times = np.clip(rng.lognormal(np.log(median_ms), 0.5, size), 50, None).astype(np.int64)
+    success = rng.random(size) >= failure_rate
+    decisions = rng.choice(len(DECISIONS), size=size, p=DECISION_WEIGHTS)
+    confidences = np.round(rng.beta(7, 3, size), 2)
+    reasonings = rng.integers(0, len(REASONINGS), size)
+    for i in range(size):
+        timestamps = {} if starts is None else {'start_time': starts[i], 'end_time': starts[i] + response_times[i]}
+        if success[i]:
+            yield test_result(True, response_times[i], DECISIONS[decisions[i]], float(confidences[i]),
+                              REASONINGS[reasonings[i]], **timestamps)
+        else:
+            yield test_result(False, response_times[i], error="HTTP InternalServerError: LLM backend timeout",
+                              **timestamps)
+
+
+def generate_synthetic_report(path, entries, seed=0, model='synthetic-model', failure_rate=0.02,
+                              median_ms=20000, rate=DEFAULT_ARRIVAL_RATE):
+    """
+    Stream a synthetic report with `entries` LoadTestResults to path; returns its Summary.
+
+    Requests arrive as a Poisson process at `rate` per second and carry StartTime/EndTime;
+    rate=None leaves the timestamps out, like reports from src/EAI.Testing.
+    """
+    rng = np.random.default_rng(seed)
+    environment = {
+        'BaseUrl': 'https://localhost:58080',
+        'LLMProvider': 'Synthetic',
+        'Model': model,
+        'Database': 'In-Memory',
+    }
+    single = next(_results_chunk(rng, 1, 0.0, median_ms))
+    with ReportWriter(path, environment=environment, timestamp='2025-01-01T00:00:00',
+                      health_check=test_result(True, 15), single_request=single) as writer:
+        remaining = entries
+        clock = START_EPOCH_MS
+        while remaining:
+            size = min(GENERATION_CHUNK, remaining)
+            starts = None
+            if rate:
+                starts = clock + np.cumsum(rng.exponential(1000 / rate, size))
+                clock = starts[-1]
+            writer.add_many(_results_chunk(rng, size, failure_rate, median_ms, starts))
+            remaining -= size
+        request_types = {name: next(_results_chunk(rng, 1, 0.0, median_ms))
+                         for name in ('expense', 'leave', 'purchase')}
+        return writer.close(request_types)
+
+
+def synthetic_report_path(work_dir, entries, seed=0, rate=DEFAULT_ARRIVAL_RATE):
+    """Canonical file name for a synthetic report of a given size"""
+    rate_suffix = f'_r{rate:g}' if rate else ''
+    return os.path.join(work_dir, f'benchmark_report_synthetic_{entries}_s{seed}{rate_suffix}.json')
+
+
+def ensure_synthetic_report(work_dir, entries, seed=0, rate=DEFAULT_ARRIVAL_RATE):
+    """Path to a synthetic report of the given size, generating it only if missing"""
+    os.makedirs(work_dir, exist_ok=True)
+    path = synthetic_report_path(work_dir, entries, seed, rate)
+    if not os.path.exists(path):
+        tmp_path = f"{path}.tmp"
+        generate_synthetic_report(tmp_path, entries, seed, rate=rate)
+        os.replace(tmp_path, path)
+    return path
+
+
+def main():
+    """Write a synthetic benchmark report"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic EAI benchmark report')
+    parser.add_argument('entries', type=float, help='Number of LoadTestResults entries (e.g. 1e6)')
+    parser.add_argument('-o', '--output', help='Output path (default: benchmark_report_synthetic_<n>_s<seed>.json)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--model', default='synthetic-model', help="Environment['Model'] value")
+    parser.add_argument('--rate', type=float, default=DEFAULT_ARRIVAL_RATE,
+                        help='Arrivals per second for StartTime/EndTime; 0 omits timestamps (default: %(default)s)')
+    args = parser.parse_args()
+
+    entries = int(args.entries)
+    path = args.output or synthetic_report_path('.', entries, args.seed, args.rate)
+    summary = generate_synthetic_report(path, entries, seed=args.seed, model=args.model, rate=args.rate or None)
+    print(f"Wrote {entries:,} load test results to {path}")
+    print(f"Success Rate: {summary['SuccessRate']:.1f}%  Avg Response Time: {summary['AverageResponseTime']/1000:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
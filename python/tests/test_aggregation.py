@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from aggregation import GroupedDistribution, histogram
+
+
+@pytest.fixture(scope='module')
+def grouped():
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 3, 30_000)
+    values = rng.beta(2 + codes, 2, len(codes))
+    return codes, values
+
+
+def test_chunked_histogram_matches_numpy(grouped):
+    _, values = grouped
+    counts, edges = histogram(values, 6, chunk=1000)
+    expected_counts, expected_edges = np.histogram(values, bins=6)
+    np.testing.assert_array_equal(counts, expected_counts)
+    np.testing.assert_allclose(edges, expected_edges)
+
+
+def test_grouped_quantiles_within_one_bin(grouped):
+    codes, values = grouped
+    distribution = GroupedDistribution(codes, values, 4, lo=0.0, hi=1.0, chunk=1000)
+    width = distribution.edges[1] - distribution.edges[0]
+    assert list(distribution.groups()) == [0, 1, 2]
+    for group in range(3):
+        selected = values[codes == group]
+        assert distribution.count(group) == len(selected)
+        assert distribution.mean(group) == pytest.approx(selected.mean())
+        np.testing.assert_allclose(distribution.quantiles(group, [0.25, 0.5, 0.75]),
+                                   np.quantile(selected, [0.25, 0.5, 0.75]), atol=width)
+    assert np.isnan(distribution.quantiles(3, [0.5])).all()
+
+
+def test_box_stats_match_tukey_whiskers(grouped):
+    codes, values = grouped
+    distribution = GroupedDistribution(codes, values, 3, lo=0.0, hi=1.0)
+    width = distribution.edges[1] - distribution.edges[0]
+    selected = values[codes == 0]
+    stats = distribution.box_stats(0, 'approve')
+    q1, median, q3 = np.quantile(selected, [0.25, 0.5, 0.75])
+    inside = selected[(selected >= q1 - 1.5 * (q3 - q1)) & (selected <= q3 + 1.5 * (q3 - q1))]
+    assert stats['label'] == 'approve'
+    assert stats['med'] == pytest.approx(median, abs=width)
+    assert stats['whislo'] == pytest.approx(inside.min(), abs=2 * width)
+    assert stats['whishi'] == pytest.approx(inside.max(), abs=2 * width)
+    assert ((stats['fliers'] < stats['whislo']) | (stats['fliers'] > stats['whishi'])).all()
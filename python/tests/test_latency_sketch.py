@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from latency_sketch import LatencySketch, REPORTED_QUANTILES
+
+
+@pytest.fixture(scope='module')
+def response_times():
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.lognormal(7, 0.6, 50_000), rng.lognormal(9, 0.3, 2_000)]).astype(np.int64)
+
+
+def test_quantiles_within_relative_accuracy(response_times):
+    sketch = LatencySketch().add(response_times)
+    exact = np.quantile(response_times, REPORTED_QUANTILES, method='lower')
+    np.testing.assert_allclose(sketch.quantiles(), exact, rtol=sketch.relative_accuracy * 1.01)
+    assert sketch.count == len(response_times)
+    assert sketch.min == response_times.min()
+    assert sketch.max == response_times.max()
+    assert sketch.mean == pytest.approx(response_times.mean())
+
+
+def test_merged_shards_equal_one_sketch(response_times):
+    whole = LatencySketch().add(response_times)
+    merged = LatencySketch.merged(LatencySketch().add(part) for part in np.array_split(response_times, 7))
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    assert (merged.min, merged.max, merged.sum) == (whole.min, whole.max, whole.sum)
+    np.testing.assert_array_equal(merged.quantiles(), whole.quantiles())
+
+
+def test_serialization_round_trip(response_times):
+    sketch = LatencySketch().add(response_times)
+    restored = LatencySketch.loads(sketch.dumps())
+    np.testing.assert_array_equal(restored.counts, sketch.counts)
+    assert restored.percentiles() == sketch.percentiles()
+
+
+def test_zero_and_empty():
+    assert np.isnan(LatencySketch().quantile(0.5))
+    assert LatencySketch().add([0, 0, 0]).quantile(0.99) == 0
+
+
+def test_merge_rejects_different_accuracy():
+    with pytest.raises(ValueError):
+        LatencySketch(0.01).merge(LatencySketch(0.02))
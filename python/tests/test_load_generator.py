@@ -0,0 +1,40 @@
+import asyncio
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from approval_stub_server import StubSettings, start_stub_server
+from load_generator import LoadPlan, run_benchmark
+from report_loader import load_report
+
+REQUESTS = 60
+
+
+async def _benchmark_against_stub(path, plan, processes=1):
+    runner, base_url = await start_stub_server(StubSettings(median_ms=5, seed=1))
+    try:
+        return await run_benchmark(path, plan, base_url=base_url, processes=processes, seed=1)
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.parametrize('plan, processes', [
+    (LoadPlan(concurrency=8, total_requests=REQUESTS), 1),
+    (LoadPlan(rate=300, concurrency=16, total_requests=REQUESTS), 1),
+    (LoadPlan(rate=300, concurrency=16, total_requests=REQUESTS), 2),
+], ids=['closed_loop', 'open_loop', 'open_loop_processes'])
+def test_report_from_stub_loads_with_every_request(tmp_path, plan, processes):
+    path = str(tmp_path / 'benchmark_report_stub.json')
+    summary, stats = asyncio.run(_benchmark_against_stub(path, plan, processes))
+
+    assert stats['issued'] == REQUESTS
+    assert stats['dropped'] == 0
+    assert stats['completed'] == REQUESTS
+
+    header, columns = load_report(path)
+    assert len(columns) == REQUESTS
+    assert columns.success.all()
+    assert columns.has_timestamps
+    # Load test plus the single request and one request per type
+    assert header['Results']['Summary']['TotalRequests'] == REQUESTS + 1 + len(header['Results']['RequestTypeResults'])
+    assert summary == header['Results']['Summary']
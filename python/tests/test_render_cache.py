@@ -0,0 +1,71 @@
+import os
+import pytest
+from chart_generator import EAIChartGenerator
+from render_cache import RenderCache
+from synthetic_report import generate_synthetic_report
+
+CHART = 'create_business_impact_chart'
+
+
+@pytest.fixture
+def generator_factory(tmp_path, monkeypatch):
+    report = str(tmp_path / 'benchmark_report_a.json')
+    generate_synthetic_report(report, 200, seed=0)
+    rendered = []
+
+    def render_chart(self, method_name):
+        # Stand-in for drawing: an output file is all the cache checks for
+        rendered.append(method_name)
+        with open(self.chart_path(method_name), 'w') as f:
+            f.write('chart')
+
+    monkeypatch.setattr(EAIChartGenerator, 'render_chart', render_chart)
+
+    def make(**options):
+        generator = EAIChartGenerator(report, charts_dir=str(tmp_path / 'charts'), use_sidecar=False, **options)
+        rendered.clear()
+        generator.generate_all_charts(charts=[EAIChartGenerator.CHART_SPECS[CHART]['file']])
+        return list(rendered)
+
+    return report, make
+
+
+def test_unchanged_chart_is_skipped(generator_factory):
+    _, make = generator_factory
+    assert make() == [CHART]
+    assert make() == []
+
+
+def test_report_change_invalidates_chart(generator_factory):
+    report, make = generator_factory
+    assert make() == [CHART]
+    generate_synthetic_report(report, 201, seed=0)
+    assert make() == [CHART]
+
+
+def test_render_parameter_change_invalidates_chart(generator_factory):
+    _, make = generator_factory
+    assert make() == [CHART]
+    assert make(dpi=72) == [CHART]
+    assert make(dpi=72) == []
+
+
+def test_version_bump_invalidates_chart(generator_factory, monkeypatch):
+    _, make = generator_factory
+    assert make() == [CHART]
+    spec = dict(EAIChartGenerator.CHART_SPECS[CHART], version=EAIChartGenerator.CHART_SPECS[CHART]['version'] + 1)
+    monkeypatch.setitem(EAIChartGenerator.CHART_SPECS, CHART, spec)
+    assert make() == [CHART]
+
+
+def test_deleted_output_is_not_fresh(tmp_path):
+    charts_dir = str(tmp_path)
+    output = os.path.join(charts_dir, 'chart.png')
+    cache = RenderCache(charts_dir)
+    cache.record(output, 'key')
+    cache.save()
+    assert not RenderCache(charts_dir).is_fresh(output, 'key')
+    with open(output, 'w') as f:
+        f.write('chart')
+    assert RenderCache(charts_dir).is_fresh(output, 'key')
+    assert not RenderCache(charts_dir).is_fresh(output, 'other key')
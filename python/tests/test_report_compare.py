@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from latency_sketch import LatencySketch
+from report_compare import (ReportComparison, RunSample, _weighted_quantile, bootstrap_distribution,
+                            bootstrap_proportions)
+from report_loader import ReportColumns
+
+
+def _sample(name, seed, latency_scale=1.0, rows=4000):
+    rng = np.random.default_rng(seed)
+    columns = ReportColumns((rng.lognormal(7, 0.5, rows) * latency_scale).astype(np.int32),
+                            rng.uniform(0.5, 1.0, rows), rng.integers(0, 2, rows), rng.random(rows) > 0.05,
+                            ['approve', 'deny'])
+    header = {'Environment': {'Model': 'test'}, 'Timestamp': f'2025-09-10T10:0{seed}:00'}
+    return RunSample(f'{name}.json', header, columns)
+
+
+def test_weighted_bootstrap_matches_standard_error():
+    rng = np.random.default_rng(0)
+    values = np.array([1.0, 2.0, 5.0, 10.0])
+    counts = np.array([400, 300, 200, 100])
+    means, medians = bootstrap_distribution(values, counts, 4000, rng, quantile=0.5)
+    rows = np.repeat(values, counts)
+    assert means.mean() == pytest.approx(rows.mean(), rel=0.01)
+    assert means.std() == pytest.approx(rows.std() / np.sqrt(len(rows)), rel=0.1)
+    assert set(np.unique(medians)) <= set(values)
+
+
+def test_proportions_sum_to_one():
+    shares = bootstrap_proportions([30, 50, 20], 500, np.random.default_rng(0))
+    np.testing.assert_allclose(shares.sum(axis=1), 1.0)
+    np.testing.assert_allclose(shares.mean(axis=0), [0.3, 0.5, 0.2], atol=0.01)
+
+
+def test_weighted_quantile_uses_sketch_rank_convention():
+    values = np.arange(1, 1001)
+    sketch = LatencySketch(0.001).add(values)
+    bucket_values, counts = sketch.buckets()
+    assert _weighted_quantile(bucket_values, counts, 0.95) == pytest.approx(sketch.quantile(0.95))
+
+
+def test_identical_runs_are_not_significant():
+    comparison = ReportComparison([_sample('a', 1), _sample('b', 1)], resamples=500)
+    for row in comparison.rows:
+        assert row['difference'] == pytest.approx(0)
+        assert row['ci_low'] <= 0 <= row['ci_high'], row['metric']
+        assert not row['significant']
+
+
+def test_slower_run_has_significant_latency_difference():
+    comparison = ReportComparison([_sample('a', 1), _sample('b', 2, latency_scale=1.2)], resamples=500)
+    rows = {row['metric']: row for row in comparison.rows}
+    mean = rows['Mean latency (s)']
+    assert mean['significant'] and mean['ci_low'] > 0
+    assert mean['ci_low'] <= mean['difference'] <= mean['ci_high']
+    assert rows['p95 latency (s)']['significant']
+    assert not rows['Success rate (%)']['significant']
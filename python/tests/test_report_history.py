@@ -0,0 +1,44 @@
+import os
+from report_history import ReportHistory
+from report_writer import ReportWriter, test_result as make_result
+
+
+def _write_report(path, timestamp, response_time):
+    with ReportWriter(path, timestamp=timestamp) as writer:
+        writer.add(make_result(response_time=response_time, decision='approve', confidence=0.9))
+
+
+def test_reingested_report_replaces_its_previous_row(tmp_path):
+    path = str(tmp_path / 'benchmark_report_a.json')
+    _write_report(path, '2025-09-10T10:00:00', 1000)
+    with ReportHistory(str(tmp_path / 'history.sqlite')) as history:
+        assert history.ingest_file(path)
+
+        _write_report(path, '2025-09-11T10:00:00', 2000)
+        # Make sure the size/mtime check sees a change
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert history.ingest_file(path)
+
+        runs = history.runs()
+        assert [run['timestamp'] for run in runs] == ['2025-09-11T10:00:00']
+        assert runs[0]['average_response_time'] == 2000
+
+
+def test_reports_sharing_timestamp_and_model_keep_separate_rows(tmp_path):
+    for name, response_time in (('a', 1000), ('b', 2000)):
+        _write_report(str(tmp_path / f'benchmark_report_{name}.json'), '2025-09-10T10:00:00', response_time)
+    with ReportHistory(str(tmp_path / 'history.sqlite')) as history:
+        assert history.ingest_directory(str(tmp_path)) == 2
+        runs = history.runs()
+        assert sorted(run['average_response_time'] for run in runs) == [1000, 2000]
+        assert {os.path.basename(run['source_path']) for run in runs} == {'benchmark_report_a.json',
+                                                                          'benchmark_report_b.json'}
+
+
+def test_report_with_malformed_timestamp_is_skipped(tmp_path):
+    _write_report(str(tmp_path / 'benchmark_report_a.json'), '2025-09-10T10:00:00', 1000)
+    _write_report(str(tmp_path / 'benchmark_report_z.json'), 'not a timestamp', 2000)
+    with ReportHistory(str(tmp_path / 'history.sqlite')) as history:
+        assert history.ingest_directory(str(tmp_path)) == 1
+        assert [run['average_response_time'] for run in history.runs()] == [1000]
@@ -0,0 +1,67 @@
+import json
+import numpy as np
+import pytest
+from report_loader import load_header, load_report
+from report_writer import ReportWriter, test_result as make_result
+
+# Strings that look like the array key or JSON structure must not confuse the streaming parser
+TRICKY = ['"LoadTestResults": [', 'brackets ] [ } {', 'back\\slash\\', 'unicode — ✓ ü', '']
+
+
+def _write_report(path, rows=23):
+    environment = {'Model': 'test', 'Note': '"LoadTestResults": [ inside a header string'}
+    with ReportWriter(path, environment=environment, timestamp='2025-09-10T10:00:00') as writer:
+        for i in range(rows):
+            writer.add(make_result(success=i % 5 != 0, response_time=100 + 37 * i,
+                                   decision=['approve', 'deny', 'escalate'][i % 3], confidence=(i % 10) / 10,
+                                   reasoning=TRICKY[i % len(TRICKY)], start_time=1e12 + 50 * i,
+                                   end_time=1e12 + 50 * i + 100 + 37 * i))
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', [7, 64, 1 << 20])
+def test_streamed_columns_match_json_load(tmp_path, chunk_size):
+    path = _write_report(str(tmp_path / 'benchmark_report_a.json'))
+    with open(path, encoding='utf-8') as f:
+        document = json.load(f)
+    records = document['Results']['LoadTestResults']
+
+    header, columns = load_report(path, chunk_size=chunk_size, rows_per_block=4)
+
+    assert len(columns) == len(records)
+    np.testing.assert_array_equal(columns.response_time_ms, [r['ResponseTime'] for r in records])
+    np.testing.assert_array_equal(columns.success, [r['Success'] for r in records])
+    np.testing.assert_allclose(columns.confidence, [r['Confidence'] for r in records], rtol=1e-6)
+    assert list(columns.decisions()) == [r['Decision'] for r in records]
+    np.testing.assert_allclose(columns.start_time, [r['StartTime'] / 1000 for r in records])
+    document['Results']['LoadTestResults'] = []
+    assert header == document
+
+
+def test_header_only_load_sketches_successful_response_times(tmp_path):
+    path = _write_report(str(tmp_path / 'benchmark_report_a.json'))
+    header, latency = load_header(path, chunk_size=7)
+    _, columns = load_report(path)
+    assert header['Results']['LoadTestResults'] == []
+    assert latency.count == np.count_nonzero(columns.success)
+    np.testing.assert_array_equal(latency.counts, columns.latency.counts)
+
+
+def test_report_without_array_is_parsed_whole(tmp_path):
+    path = str(tmp_path / 'benchmark_report_a.json')
+    with open(path, 'w') as f:
+        json.dump({'Timestamp': '2025-09-10T10:00:00', 'Results': {'Summary': {}}}, f)
+    header, columns = load_report(path, chunk_size=7)
+    assert header['Timestamp'] == '2025-09-10T10:00:00'
+    assert len(columns) == 0
+    assert not columns.has_timestamps
+
+
+def test_truncated_array_raises(tmp_path):
+    path = _write_report(str(tmp_path / 'benchmark_report_a.json'))
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text[:text.index('"RequestTypeResults"') - 20])
+    with pytest.raises(ValueError):
+        load_report(path, chunk_size=7)
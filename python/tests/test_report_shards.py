@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from aggregation import ChartAggregates
+from report_shards import merge_reports
+from synthetic_report import generate_synthetic_report
+from timeline import Timeline
+
+SHARD_ROWS = 5000
+
+
+@pytest.fixture(scope='module')
+def shard_paths(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('shards')
+    paths = []
+    for seed in range(4):
+        path = str(directory / f'benchmark_report_node{seed}.json')
+        generate_synthetic_report(path, SHARD_ROWS, seed=seed)
+        paths.append(path)
+    return paths
+
+
+def test_merged_summary_counts_every_shard(shard_paths):
+    merged = merge_reports(shard_paths, workers=1)
+    assert merged.total_rows == 4 * SHARD_ROWS
+    assert len(merged.columns) == merged.total_rows
+    assert not merged.sampled
+    assert merged.columns.row_weight == 1.0
+
+
+def test_sampled_timeline_is_scaled_to_the_whole_run(shard_paths):
+    full = merge_reports(shard_paths, workers=1)
+    sampled = merge_reports(shard_paths, workers=1, max_rows=7000)
+    assert sampled.sampled
+    assert len(sampled.columns) == 7000
+    assert sampled.columns.row_weight == pytest.approx(4 * SHARD_ROWS / 7000)
+
+    width = Timeline(full.columns).width
+    full_timeline = Timeline(full.columns, width=width)
+    sampled_timeline = Timeline(sampled.columns, width=width)
+    # Compare the steady state, where every bucket holds plenty of requests
+    steady = slice(len(full_timeline.arrival_rate) // 10, len(full_timeline.arrival_rate) // 2)
+    for name in ('arrival_rate', 'in_flight_mean'):
+        full_median = np.median(getattr(full_timeline, name)[steady])
+        sampled_median = np.median(getattr(sampled_timeline, name)[steady])
+        assert sampled_median == pytest.approx(full_median, rel=0.15), name
+    assert sampled_timeline.in_flight_peak.max() == pytest.approx(full_timeline.in_flight_peak.max(), rel=0.15)
+
+
+def test_sampled_histograms_are_scaled_to_the_whole_run(shard_paths):
+    sampled = merge_reports(shard_paths, workers=1, max_rows=7000)
+    counts, _ = ChartAggregates(sampled.columns).response_time_hist
+    successful = np.count_nonzero(sampled.columns.success) * sampled.columns.row_weight
+    assert counts.sum() == pytest.approx(len(sampled.columns) * sampled.columns.row_weight)
+    assert successful == pytest.approx(sampled.header['Results']['Summary']['SuccessfulRequests'], rel=0.05)
+
+
+def test_merged_header_keeps_every_shards_extra_requests(shard_paths):
+    merged = merge_reports(shard_paths, workers=1)
+    results = merged.header['Results']
+    assert len(results['HealthCheck']) == len(results['SingleRequest']) == len(shard_paths)
+    extras = len(results['SingleRequest']) + sum(len(runs) for runs in results['RequestTypeResults'].values())
+    assert results['Summary']['TotalRequests'] == merged.total_rows + extras
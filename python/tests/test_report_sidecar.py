@@ -0,0 +1,67 @@
+import json
+import os
+import numpy as np
+import pytest
+from report_loader import load_report
+from report_sidecar import SidecarReport, convert_report, open_report, sidecar_path
+from report_writer import ReportWriter, test_result as make_result
+
+
+@pytest.fixture
+def report(tmp_path):
+    path = str(tmp_path / 'benchmark_report_a.json')
+    with ReportWriter(path, timestamp='2025-09-10T10:00:00') as writer:
+        for i in range(50):
+            writer.add(make_result(success=i % 7 != 0, response_time=50 * i, decision=['approve', 'deny'][i % 2],
+                                   confidence=i / 50, reasoning=f'reason {i % 4} — ✓', error='' if i % 7 else 'boom',
+                                   start_time=1e12 + 10 * i, end_time=1e12 + 10 * i + 50 * i))
+    return path
+
+
+def _assert_same_columns(actual, expected):
+    for name in ('response_time_ms', 'confidence', 'decision_code', 'success', 'start_time', 'end_time'):
+        np.testing.assert_array_equal(getattr(actual, name), getattr(expected, name), err_msg=name)
+    assert actual.decision_labels == expected.decision_labels
+    np.testing.assert_array_equal(actual.latency.counts, expected.latency.counts)
+
+
+def test_sidecar_round_trip(report):
+    header, columns = load_report(report)
+    sidecar = SidecarReport(convert_report(report))
+    assert sidecar.header == header
+    _assert_same_columns(sidecar.columns, columns)
+    with open(report, encoding='utf-8') as f:
+        records = json.load(f)['Results']['LoadTestResults']
+    assert [sidecar.reasoning(row) for row in range(len(records))] == [r['Reasoning'] for r in records]
+    assert [sidecar.error(row) for row in range(len(records))] == [r['Error'] for r in records]
+
+
+def test_open_report_uses_fresh_sidecar_only(report, capsys):
+    convert_report(report)
+    _, columns = open_report(report)
+    # Memory-mapped columns are not writeable
+    assert not columns.response_time_ms.flags.writeable
+    assert capsys.readouterr().out == ''
+
+    # A rewritten report makes the sidecar stale, so the JSON is streamed instead
+    stat = os.stat(report)
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    _, columns = open_report(report)
+    assert columns.response_time_ms.flags.writeable
+    assert 'stale sidecar' in capsys.readouterr().out
+
+
+def test_open_report_falls_back_on_unreadable_sidecar(report, capsys):
+    with open(sidecar_path(report), 'wb') as f:
+        f.write(b'not a sidecar at all')
+    _, columns = open_report(report)
+    _assert_same_columns(columns, load_report(report)[1])
+    assert 'unreadable sidecar' in capsys.readouterr().out
+
+
+def test_open_report_reads_sidecar_without_json(report):
+    expected = load_report(report)[1]
+    convert_report(report)
+    os.remove(report)
+    _, columns = open_report(report)
+    _assert_same_columns(columns, expected)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from report_loader import ReportColumns
+from timeline import Timeline, bucket_width
+
+
+def _columns(starts, ends, response_time_ms=None, success=None):
+    n = len(starts)
+    return ReportColumns(np.full(n, 100) if response_time_ms is None else response_time_ms, np.full(n, 0.9),
+                         np.zeros(n), np.ones(n, dtype=bool) if success is None else success, ['approve'],
+                         start_time=starts, end_time=ends)
+
+
+@pytest.fixture(scope='module')
+def random_timeline():
+    rng = np.random.default_rng(0)
+    starts = np.sort(rng.uniform(0, 60, 2000)) + 1.7e9
+    durations = rng.exponential(0.8, len(starts))
+    success = rng.random(len(starts)) > 0.1
+    columns = _columns(starts, starts + durations, (durations * 1000).astype(np.int32), success)
+    return starts - starts.min(), durations, success, Timeline(columns, width=1.0)
+
+
+def test_bucket_width_is_one_two_five():
+    assert bucket_width(240) == 1
+    assert bucket_width(241) == 2
+    assert bucket_width(1000) == 5
+    assert bucket_width(0.01) == 0.001
+
+
+def test_rates_match_bucket_counts(random_timeline):
+    starts, durations, success, timeline = random_timeline
+    ends = starts + durations
+    assert len(timeline.arrival_rate) == int(np.ceil(ends.max()))
+    last = len(timeline.arrival_rate) - 1
+    np.testing.assert_array_equal(timeline.arrival_rate,
+                                  np.bincount(np.minimum(starts.astype(int), last), minlength=last + 1))
+    completions = np.bincount(np.minimum(ends[success].astype(int), last), minlength=last + 1)
+    np.testing.assert_array_equal(timeline.success_rate, completions)
+    assert timeline.arrival_rate.sum() == timeline.success_rate.sum() + timeline.failure_rate.sum()
+
+
+def test_in_flight_matches_brute_force(random_timeline):
+    starts, durations, _, timeline = random_timeline
+    ends = starts + durations
+    # Mean concurrency per bucket from a fine sampling grid
+    grid = np.arange(0, len(timeline.in_flight_mean), 0.001) + 0.0005
+    running = np.searchsorted(np.sort(starts), grid, side='right') - np.searchsorted(np.sort(ends), grid, side='right')
+    fine_mean = running.reshape(len(timeline.in_flight_mean), -1).mean(axis=1)
+    np.testing.assert_allclose(timeline.in_flight_mean, fine_mean, atol=0.05)
+
+    # Peak: concurrency just after each start and at each bucket opening, maximised per bucket
+    times = np.concatenate((starts, timeline.edges[:-1]))
+    level = np.searchsorted(np.sort(starts), times, side='right') - np.searchsorted(np.sort(ends), times, side='right')
+    buckets = np.minimum(times.astype(int), len(timeline.in_flight_peak) - 1)
+    peak = np.zeros(len(timeline.in_flight_peak), dtype=int)
+    np.maximum.at(peak, buckets, level)
+    np.testing.assert_array_equal(timeline.in_flight_peak, peak)
+
+
+def test_back_to_back_requests_do_not_overlap():
+    starts = np.array([0.0, 1.0, 2.0])
+    timeline = Timeline(_columns(starts, starts + 1.0), width=0.5)
+    assert timeline.in_flight_peak.max() == 1
+    np.testing.assert_allclose(timeline.in_flight_mean, 1.0)
+
+
+def test_rolling_latency_quantiles(random_timeline):
+    _, durations, success, timeline = random_timeline
+    # Over the whole run the median of the widest windows tracks the overall median
+    median = np.nanmedian(timeline.latency_ms[0.5][timeline.window_buckets:-timeline.window_buckets])
+    assert median == pytest.approx(np.median(durations[success] * 1000), rel=0.15)
+
+
+def test_report_without_timestamps_is_rejected():
+    columns = ReportColumns([100], [0.9], [0], [True], ['approve'])
+    with pytest.raises(ValueError):
+        Timeline(columns)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+EAI Request Timelines
+Throughput, in-flight concurrency and rolling latency quantiles over wall-clock time, computed
+with vectorized sweeps over the optional StartTime/EndTime columns of a report
+"""
+
+import numpy as np
+from aggregation import GroupedDistribution
+
+# Target number of time buckets across a run
+TIMELINE_BUCKETS = 240
+# Buckets per rolling latency window unless a window length is given
+ROLLING_WINDOW_BUCKETS = 5
+# Log-latency bins per bucket used for rolling quantiles (about 1.5% relative resolution)
+LATENCY_BINS = 512
+
+
+def bucket_width(span, target=TIMELINE_BUCKETS):
+    """Smallest 1/2/5 x 10^k second width that covers span in at most `target` buckets"""
+    raw = max(span / target, 1e-3)
+    magnitude = 10 ** np.floor(np.log10(raw))
+    for step in (1, 2, 5, 10):
+        if step * magnitude >= raw:
+            return float(step * magnitude)
+
+
+def in_flight_integral(sorted_starts, sorted_ends, t):
+    """
+    Integral of the in-flight request count from 0 to each t (request-seconds).
+
+    Each started request contributes t - start and each finished one subtracts
+    t - end, so the whole curve comes from two searchsorted passes and prefix sums.
+    """
+    start_sums = np.concatenate(([0.0], np.cumsum(sorted_starts)))
+    end_sums = np.concatenate(([0.0], np.cumsum(sorted_ends)))
+    started = np.searchsorted(sorted_starts, t, side='right')
+    ended = np.searchsorted(sorted_ends, t, side='right')
+    return (t * started - start_sums[started]) - (t * ended - end_sums[ended])
+
+
+def histogram_quantiles(counts, edges, q):
+    """Quantile q of each row of a [rows, bins] histogram, interpolated inside bins; NaN for empty rows"""
+    rows = np.arange(len(counts))
+    totals = counts.sum(axis=1)
+    cumulative = np.cumsum(counts, axis=1)
+    targets = q * totals
+    index = np.minimum((cumulative < targets[:, None]).sum(axis=1), counts.shape[1] - 1)
+    before = np.where(index > 0, cumulative[rows, index - 1], 0)
+    fraction = np.clip((targets - before) / np.maximum(counts[rows, index], 1), 0, 1)
+    values = edges[index] + fraction * (edges[1] - edges[0])
+    values[totals == 0] = np.nan
+    return values
+
+
+class Timeline:
+    """
+    Per-bucket request rates, in-flight concurrency and rolling latency quantiles.
+
+    Times are seconds since the first request started. Rows without both
+    timestamps are ignored. When the columns are a uniform sample, rates and
+    in-flight counts are scaled by columns.row_weight to estimate the whole run.
+    """
+
+    def __init__(self, columns, width=None, window=None, quantiles=(0.5, 0.95, 0.99)):
+        if not columns.has_timestamps:
+            raise ValueError("Report has no StartTime/EndTime in LoadTestResults")
+        valid = np.isfinite(columns.start_time) & np.isfinite(columns.end_time)
+        if not valid.any():
+            raise ValueError("No LoadTestResults entry has both StartTime and EndTime")
+        self.origin = float(columns.start_time[valid].min())
+        starts = columns.start_time[valid] - self.origin
+        ends = np.maximum(columns.end_time[valid] - self.origin, starts)
+        success = columns.success[valid]
+        self.requests = int(valid.sum())
+        self.row_weight = columns.row_weight
+
+        span = float(ends.max()) or 1e-3
+        self.width = width or bucket_width(span)
+        n_buckets = max(1, int(np.ceil(span / self.width)))
+        self.edges = np.arange(n_buckets + 1) * self.width
+        start_bucket = np.minimum((starts / self.width).astype(np.intp), n_buckets - 1)
+        end_bucket = np.minimum((ends / self.width).astype(np.intp), n_buckets - 1)
+
+        # Throughput: arrivals by start time, completions by end time
+        per_second = self.row_weight / self.width
+        self.arrival_rate = np.bincount(start_bucket, minlength=n_buckets) * per_second
+        self.success_rate = np.bincount(end_bucket[success], minlength=n_buckets) * per_second
+        self.failure_rate = np.bincount(end_bucket[~success], minlength=n_buckets) * per_second
+
+        # In flight: mean from the integral of the concurrency curve, peak from a +1/-1 event sweep
+        sorted_starts = np.sort(starts)
+        sorted_ends = np.sort(ends)
+        self.in_flight_mean = np.diff(in_flight_integral(sorted_starts, sorted_ends, self.edges)) * per_second
+        # For a sample this is the sample's peak scaled up, an estimate of the run's peak
+        self.in_flight_peak = self._peak_in_flight(sorted_starts, sorted_ends, n_buckets) * self.row_weight
+
+        # Rolling latency: log-latency histograms of successful completions per bucket, summed over the window
+        self.window_buckets = max(1, int(round(window / self.width))) if window else ROLLING_WINDOW_BUCKETS
+        self.window = self.window_buckets * self.width
+        self.quantile_levels = tuple(quantiles)
+        self.latency_ms = self._rolling_latency(columns.response_time_ms[valid], end_bucket, success, n_buckets)
+
+    @property
+    def centres(self):
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    def _peak_in_flight(self, sorted_starts, sorted_ends, n_buckets):
+        times = np.concatenate((sorted_starts, sorted_ends))
+        deltas = np.concatenate((np.ones(len(sorted_starts), dtype=np.int64),
+                                 -np.ones(len(sorted_ends), dtype=np.int64)))
+        # Ends sort before starts at equal times, so back-to-back requests do not overlap
+        order = np.lexsort((deltas, times))
+        level = np.cumsum(deltas[order])
+        buckets = np.minimum((times[order] / self.width).astype(np.intp), n_buckets - 1)
+        first = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        peak = np.zeros(n_buckets, dtype=np.int64)
+        peak[buckets[first]] = np.maximum.reduceat(level, first)
+        # Requests already running when a bucket opens count even if nothing starts or ends in it
+        at_open = (np.searchsorted(sorted_starts, self.edges[:-1], side='right') -
+                   np.searchsorted(sorted_ends, self.edges[:-1], side='right'))
+        return np.maximum(peak, at_open)
+
+    def _rolling_latency(self, response_time_ms, end_bucket, success, n_buckets):
+        log_ms = np.log1p(response_time_ms.astype(np.float64))
+        distribution = GroupedDistribution(end_bucket, log_ms, n_buckets, mask=success, bins=LATENCY_BINS)
+        cumulative = np.concatenate((np.zeros((1, LATENCY_BINS), dtype=np.int64),
+                                     np.cumsum(distribution.counts, axis=0)))
+        upper = np.arange(1, n_buckets + 1)
+        windows = cumulative[upper] - cumulative[np.maximum(upper - self.window_buckets, 0)]
+        self.window_counts = windows.sum(axis=1)
+        return {q: np.expm1(histogram_quantiles(windows, distribution.edges, q)) for q in self.quantile_levels}